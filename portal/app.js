@@ -20,6 +20,28 @@ function dataKey(id) {
   return `${datasetPrefix(id)}/data.parquet`;
 }
 
+function latestKey(id) {
+  return `${datasetPrefix(id)}/latest.json`;
+}
+
+// Data and metadata of the current content-addressed version from one
+// latest.json read, else manifest.json for partitioned / appended datasets;
+// older datasets only have data.parquet.
+async function resolveKeys(id) {
+  const prefix = datasetPrefix(id);
+  try {
+    const p = await fetchJson(state.base + latestKey(id));
+    if (p && p.path) {
+      return { data: `${prefix}/${p.path}`, metadata: `${prefix}/${p.metadata_path || "metadata.json"}` };
+    }
+  } catch (_) {}
+  try {
+    await fetchJson(state.base + `${prefix}/manifest.json`);
+    return { data: `${prefix}/manifest.json`, metadata: metadataKey(id) };
+  } catch (_) {}
+  return { data: dataKey(id), metadata: metadataKey(id) };
+}
+
 function metadataKey(id) {
   return `${datasetPrefix(id)}/metadata.json`;
 }
@@ -160,7 +182,7 @@ function buildMetaEntries(ds, m) {
   if (m && typeof m === "object") {
     for (const [key, value] of Object.entries(m)) {
       if (seen.has(key)) continue;
-      if (key === "preview" || key === "columns" || key === "source" || key === "geo") continue;
+      if (key === "preview" || key === "preview_path" || key === "columns" || key === "source" || key === "geo") continue;
       addMeta(entries, seen, key, value);
     }
   }
@@ -218,21 +240,29 @@ async function showDetail(id) {
   $("brand-dataset-name").textContent = ds.id;
   const dataHref = ds.data_key || dataKey(ds.id);
   $("detail-data").href = state.base + dataHref;
+  const resolved = ds.data_key && ds.metadata_key ? null : resolveKeys(ds.id);
+  if (!ds.data_key) {
+    resolved.then(k => { $("detail-data").href = state.base + k.data; });
+  }
   $("detail-snippet").textContent = `import opendata as od\ndf = od.load("${ds.id}")`;
 
   const meta = buildMetaEntries(ds, null);
   $("detail-meta").innerHTML = meta.map(([k,v]) => `<dt>${k}</dt><dd>${esc(v)}</dd>`).join("");
   $("preview").innerHTML = "<span class='muted'>Loading...</span>";
 
-  const metaHref = ds.metadata_key || metadataKey(ds.id);
+  const metaHref = ds.metadata_key || (await resolved).metadata;
   if (metaHref) {
     try {
       const m = await fetchJson(state.base + metaHref);
       const metaFull = buildMetaEntries(ds, m);
       $("detail-meta").innerHTML = metaFull.map(([k,v]) => `<dt>${k}</dt><dd>${esc(v)}</dd>`).join("");
 
-      if (m.preview) {
-        $("preview").innerHTML = renderPreview(m.preview);
+      // Large datasets keep the preview in a separate preview.json.
+      const preview = m.preview || (m.preview_path
+        ? await fetchJson(state.base + `${datasetPrefix(ds.id)}/${m.preview_path}`)
+        : null);
+      if (preview) {
+        $("preview").innerHTML = renderPreview(preview);
       } else {
         $("preview").innerHTML = "<span class='muted'>No preview.</span>";
       }
@@ -0,0 +1,132 @@
+"""Benchmark peak memory of `opendata.load()` return types.
+
+Each mode runs in a fresh subprocess so peak RSS is not polluted by earlier
+runs. The parquet bytes are placed in a MemoryStorage before the baseline is
+taken, so the reported delta is the cost of decoding + converting.
+
+    python3 scripts/bench_load_memory.py --rows 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+DATASET_ID = "bench/load-memory"
+MODES = ["pandas-copy", "pandas", "pandas-arrow", "arrow"]
+
+
+def _proc_status_bytes(field: str) -> Optional[int]:
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss() -> int:
+    """Reset the peak-RSS watermark where supported and return current RSS."""
+
+    try:
+        # Linux: writing 5 resets VmHWM to the current RSS.
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+    current = _proc_status_bytes("VmRSS")
+    return current if current is not None else _peak_rss()
+
+
+def _peak_rss() -> int:
+    hwm = _proc_status_bytes("VmHWM")
+    if hwm is not None:
+        return hwm
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return int(rss) if sys.platform == "darwin" else int(rss) * 1024
+
+
+def _write_dataset(path: Path, *, rows: int) -> None:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rng = np.random.default_rng(0)
+    table = pa.table(
+        {
+            "id": np.arange(rows, dtype=np.int64),
+            "ts": pa.array(np.arange(rows, dtype=np.int64) * 60_000_000_000, pa.timestamp("ns")),
+            "x": rng.random(rows),
+            "y": rng.random(rows),
+            "symbol": pa.array(np.char.add("S", (np.arange(rows) % 500).astype(str))),
+        }
+    )
+    pq.write_table(table, path)
+
+
+def _run_child(mode: str, path: Path) -> dict[str, object]:
+    from opendata.client import load
+    from opendata.ids import data_key
+    from opendata.storage.memory import MemoryStorage
+
+    storage = MemoryStorage()
+    storage.put_bytes(data_key(DATASET_ID), path.read_bytes())
+    baseline = _reset_peak_rss()
+
+    start = time.perf_counter()
+    if mode == "pandas-copy":
+        # What `load()` did before return types existed: a plain `to_pandas()`.
+        result = load(DATASET_ID, return_type="arrow", storage=storage).to_pandas()
+    else:
+        result = load(DATASET_ID, return_type=mode, storage=storage)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "rows": len(result),
+        "seconds": round(elapsed, 2),
+        "peak_delta_mb": round((_peak_rss() - baseline) / 1e6, 1),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_run_child(args.child[0], Path(args.child[1]))))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "data.parquet"
+        _write_dataset(path, rows=args.rows)
+        print(f"rows={args.rows} parquet_mb={path.stat().st_size / 1e6:.1f}")
+
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            res = json.loads(out.stdout)
+            print(
+                f"{res['mode']:>13}  peak_delta_mb={res['peak_delta_mb']:>8}  "
+                f"seconds={res['seconds']}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,11 +8,12 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
-from opendata.ids import data_key, metadata_key
+from opendata.ids import metadata_key
 from opendata.metadata import DatasetCatalog, coerce_catalog
 from opendata.portal_publish import publish_portal_assets
 from opendata.registry import Registry
 from opendata.storage import storage_from_env
+from opendata.versions import resolve_data_key
 
 
 def _load_catalog(main_path: Path) -> DatasetCatalog:
@@ -77,7 +78,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                 runpy.run_path(str(d / "main.py"), run_name="__main__")
 
             # Ensure the producer actually published the stable objects.
-            if not storage.exists(data_key(catalog.id)):
+            if not storage.exists(resolve_data_key(storage, catalog.id)[0]):
                 raise RuntimeError("producer did not publish data.parquet")
             if not storage.exists(metadata_key(catalog.id)):
                 raise RuntimeError("producer did not publish metadata.json")
@@ -5,8 +5,20 @@ This package is the Python SDK/CLI entrypoint described in `opendata.md`.
 
 from __future__ import annotations
 
-from .client import load, push
+from .aio import aload, aload_many
+from .client import LoadManyResult, iter_batches, load, load_many, push
+from .info import DatasetInfo, info
 
-__all__ = ["load", "push"]
+__all__ = [
+    "DatasetInfo",
+    "LoadManyResult",
+    "aload",
+    "aload_many",
+    "info",
+    "iter_batches",
+    "load",
+    "load_many",
+    "push",
+]
 
 __version__ = "0.1.0"
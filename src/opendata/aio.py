@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .client import (
+    LoadManyResult,
+    LoadResult,
+    _check_columns,
+    _check_return_type,
+    _convert_table,
+)
+from .errors import NotFoundError, ValidationError
+from .ids import data_key, latest_key, manifest_key, validate_dataset_id
+from .partitions import Manifest, parse_manifest
+from .storage.aio import AsyncStorageBackend, async_storage_from_env
+from .storage.ranged import (
+    FOOTER_READ_BYTES,
+    PrefetchedReader,
+    coalesce_ranges,
+    column_chunk_ranges,
+    parquet_footer_length,
+)
+from .versions import parse_latest
+
+
+def _decode(parquet_bytes: bytes) -> pa.Table:
+    return pq.read_table(pa.BufferReader(parquet_bytes))
+
+
+async def _aread_columns(
+    storage: AsyncStorageBackend, key: str, columns: Sequence[str]
+) -> pa.Table:
+    # Fetch the footer, plan the column chunk ranges, fetch them concurrently,
+    # then let pyarrow decode (in a thread) from the prefetched ranges only.
+    size = await storage.asize(key)
+    tail_start = max(size - FOOTER_READ_BYTES, 0)
+    tail = await storage.aget_range(key, tail_start, size)
+    reader = PrefetchedReader(size)
+    reader.add(tail_start, tail)
+
+    footer_start = size - parquet_footer_length(tail) - 8
+    if footer_start < tail_start:
+        reader.add(footer_start, await storage.aget_range(key, footer_start, tail_start))
+
+    pf = await asyncio.to_thread(pq.ParquetFile, reader)
+    cols = _check_columns(pf, columns)
+
+    ranges = coalesce_ranges(column_chunk_ranges(pf.metadata, cols))
+    chunks = await asyncio.gather(*(storage.aget_range(key, s, e) for s, e in ranges))
+    for (start, _), data in zip(ranges, chunks):
+        reader.add(start, data)
+
+    return await asyncio.to_thread(pf.read, columns=cols)
+
+
+async def _aload_manifest(storage: AsyncStorageBackend, dataset_id: str) -> Optional[Manifest]:
+    # Async counterpart of `partitions.load_manifest`.
+    try:
+        raw = await storage.aget_bytes(manifest_key(dataset_id))
+    except NotFoundError:
+        return None
+    return parse_manifest(raw, dataset_id)
+
+
+async def _aread_object(
+    storage: AsyncStorageBackend, key: str, columns: Optional[Sequence[str]]
+) -> pa.Table:
+    if columns is not None:
+        return await _aread_columns(storage, key, columns)
+    return await asyncio.to_thread(_decode, await storage.aget_bytes(key))
+
+
+async def _aload_with(
+    storage: AsyncStorageBackend,
+    dataset_id: str,
+    *,
+    columns: Optional[Sequence[str]],
+    return_type: str,
+) -> LoadResult:
+    validate_dataset_id(dataset_id)
+    # Same resolution order as `load()`: `latest.json`, then `manifest.json`
+    # (files fetched concurrently), then a legacy `data.parquet`.
+    raw: Optional[bytes]
+    try:
+        raw = await storage.aget_bytes(latest_key(dataset_id))
+    except NotFoundError:
+        raw = None
+    manifest = await _aload_manifest(storage, dataset_id) if raw is None else None
+    if raw is not None:
+        table = await _aread_object(storage, parse_latest(raw, dataset_id).data_key, columns)
+    elif manifest is None:
+        table = await _aread_object(storage, data_key(dataset_id), columns)
+    elif not manifest.files:
+        raise NotFoundError(f"not found: no files in manifest of {dataset_id}")
+    else:
+        tables = await asyncio.gather(
+            *(_aread_object(storage, manifest.file_key(f), columns) for f in manifest.files)
+        )
+        table = pa.concat_tables(tables)
+    return await asyncio.to_thread(_convert_table, table, return_type)
+
+
+async def aload(
+    dataset_id: str,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    return_type: str = "pandas",
+    storage: Optional[AsyncStorageBackend] = None,
+) -> LoadResult:
+    """Async variant of `opendata.load()`.
+
+    Network I/O goes through an `AsyncStorageBackend` and parquet decoding runs
+    in a worker thread, so the event loop is never blocked. If no storage is
+    given, one is created from env vars and closed afterwards.
+    """
+
+    _check_return_type(return_type)
+    owned = storage is None
+    backend = storage or async_storage_from_env()
+    try:
+        return await _aload_with(backend, dataset_id, columns=columns, return_type=return_type)
+    finally:
+        if owned:
+            await backend.aclose()
+
+
+async def aload_many(
+    dataset_ids: Sequence[str],
+    *,
+    max_concurrency: int = 8,
+    columns: Optional[Sequence[str]] = None,
+    return_type: str = "pandas",
+    storage: Optional[AsyncStorageBackend] = None,
+) -> LoadManyResult:
+    """Async variant of `opendata.load_many()`.
+
+    At most `max_concurrency` datasets are in flight at once (the storage backend
+    additionally bounds concurrent requests). Failures are collected per dataset.
+    """
+
+    if int(max_concurrency) <= 0:
+        raise ValidationError("max_concurrency must be > 0")
+    _check_return_type(return_type)
+
+    ids = list(dict.fromkeys(dataset_ids))
+    result = LoadManyResult()
+    if not ids:
+        return result
+
+    owned = storage is None
+    backend = storage or async_storage_from_env()
+    sem = asyncio.Semaphore(int(max_concurrency))
+
+    async def _one(dataset_id: str) -> LoadResult:
+        async with sem:
+            return await _aload_with(backend, dataset_id, columns=columns, return_type=return_type)
+
+    try:
+        outcomes = await asyncio.gather(*(_one(i) for i in ids), return_exceptions=True)
+    finally:
+        if owned:
+            await backend.aclose()
+
+    for dataset_id, outcome in zip(ids, outcomes):
+        if isinstance(outcome, Exception):
+            result.errors[dataset_id] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            result.frames[dataset_id] = outcome
+    return result
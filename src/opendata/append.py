@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .errors import NotFoundError, ValidationError
+from .filters import find_time_column
+from .hashing import sha256_bytes
+from .ids import (
+    append_file_key,
+    dataset_prefix,
+    latest_key,
+    manifest_key,
+    metadata_key,
+    validate_dataset_id,
+)
+from .metadata import CatalogInput
+from .partitions import APPEND_LAYOUT, Manifest, PartitionFile, load_manifest
+from .preview import DEFAULT_PREVIEW_MAX_BYTES
+from .profiles import WriteProfile, WriteProfileInput
+from .publish import (
+    PublishedDataset,
+    _canonical_json_bytes,
+    _catalog_payload,
+    _commit_publish,
+    _existing_metadata,
+    _existing_preview,
+    _json_sanitize,
+    _resolve_profile,
+    _sort_keys,
+    _stats_payload,
+    _table_preview_json,
+    _table_schema_columns,
+    _table_to_parquet_bytes,
+)
+from .stats import merge_stats, table_stats
+from .storage.base import StorageBackend
+from .storage.ranged import read_parquet_footer
+from .versioning import utc_now_iso
+from .versions import resolve_data_key
+
+DEFAULT_COMPACT_MAX_DELTAS = 24
+DEFAULT_COMPACT_MAX_DELTA_BYTES = 64 * 1024 * 1024
+READ_WORKERS = 8
+
+
+def _read_file(
+    storage: StorageBackend, key: str, columns: Optional[Sequence[str]] = None
+) -> pa.Table:
+    with storage.open_input_file(key) as f:
+        return pq.ParquetFile(f, pre_buffer=True).read(columns=columns)
+
+
+def _read_files(
+    storage: StorageBackend, keys: list[str], columns: Optional[Sequence[str]] = None
+) -> list[pa.Table]:
+    if not keys:
+        return []
+    with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(keys))) as pool:
+        return list(pool.map(lambda key: _read_file(storage, key, columns), keys))
+
+
+def _with_row_numbers(table: pa.Table) -> pa.Table:
+    return table.append_column("__row", pa.array(range(table.num_rows), type=pa.int64()))
+
+
+def _dedupe_last(table: pa.Table, keys: list[str]) -> pa.Table:
+    """Keep the last row for each key, in input order."""
+
+    last = _with_row_numbers(table).group_by(keys).aggregate([("__row", "max")])["__row_max"]
+    if len(last) == table.num_rows:
+        return table
+    return table.take(last.take(pc.sort_indices(last)))
+
+
+def _new_rows(table: pa.Table, published_keys: pa.Table, keys: list[str]) -> pa.Table:
+    """Return the rows of `table` whose key is not in `published_keys`, in order."""
+
+    joined = _with_row_numbers(table).join(published_keys, keys=keys, join_type="left anti")
+    # Joins do not preserve row order.
+    joined = joined.take(pc.sort_indices(joined["__row"]))
+    return joined.select(table.column_names)
+
+
+def _merge_stats_payload(
+    current: dict[str, Any], new: dict[str, dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    for name, entry in new.items():
+        old = current.get(name)
+        if not isinstance(old, dict) or "null_count" not in old:
+            out[name] = entry
+            continue
+        merged = merge_stats(old, entry)
+        for size in ("compressed_bytes", "uncompressed_bytes"):
+            if size in old and size in entry:
+                merged[size] = old[size] + entry[size]
+        out[name] = merged
+    return out
+
+
+def _write_file(
+    dataset_id: str,
+    kind: str,
+    table: pa.Table,
+    *,
+    profile: WriteProfile,
+    sort_keys: list[str],
+    time_column: str,
+) -> tuple[PartitionFile, bytes]:
+    data = _table_to_parquet_bytes(table, profile, sort_keys)
+    checksum = sha256_bytes(data)
+    key = append_file_key(dataset_id, kind, f"part-{checksum[:16]}.parquet")
+    lo = hi = None
+    if time_column and table.num_rows:
+        bounds = pc.min_max(table[time_column])
+        lo, hi = _json_sanitize(bounds["min"].as_py()), _json_sanitize(bounds["max"].as_py())
+    entry = PartitionFile(
+        path=key[len(dataset_prefix(dataset_id)) + 1 :],
+        partition=kind,
+        row_count=int(table.num_rows),
+        size_bytes=len(data),
+        checksum_sha256=checksum,
+        min=lo,
+        max=hi,
+    )
+    return entry, data
+
+
+def publish_append(
+    storage: StorageBackend,
+    *,
+    dataset_id: str,
+    table: pa.Table,
+    key_columns: Sequence[str],
+    catalog: CatalogInput,
+    time_column: Optional[str] = None,
+    updated_at: Optional[str] = None,
+    preview_rows: int = 100,
+    preview_max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES,
+    separate_preview: bool = False,
+    compact: Optional[bool] = None,
+    compact_max_deltas: int = DEFAULT_COMPACT_MAX_DELTAS,
+    compact_max_delta_bytes: int = DEFAULT_COMPACT_MAX_DELTA_BYTES,
+    refresh_checked_at: bool = False,
+    write_profile: Optional[WriteProfileInput] = None,
+    compute_stats: bool = True,
+) -> PublishedDataset:
+    """Append the rows of `table` whose `key_columns` are not yet published.
+
+    Rows are deduplicated on `key_columns` (the last occurrence in `table` wins;
+    already published keys are kept as they are) and only new rows are uploaded,
+    as a small `part/delta/` file listed in `manifest.json` after the `part/base/`
+    file. `load()` reads base and deltas as one dataset; `time_column` (default:
+    the first timestamp/date column) bounds are recorded for `start`/`end` pruning.
+
+    Once there are more than `compact_max_deltas` deltas or they exceed
+    `compact_max_delta_bytes`, base and deltas are merged into a new base
+    (`compact=True` forces this, `compact=False` disables it). Superseded files
+    are left for `gc_versions`, so readers of the previous manifest can finish.
+    A dataset published as a single file (`latest.json` version or
+    `data.parquet`) is adopted as the base on first append; its pointer is
+    deleted once the manifest and metadata are written.
+    """
+
+    validate_dataset_id(dataset_id)
+    keys = list(key_columns)
+    if not keys:
+        raise ValidationError("key_columns must not be empty")
+    missing = [k for k in keys if k not in table.schema.names]
+    if missing:
+        raise ValidationError(f"unknown key column(s): {', '.join(missing)}")
+    if any(table[k].null_count for k in keys):
+        raise ValidationError("key columns must not contain nulls")
+
+    catalog_payload = _catalog_payload(catalog, dataset_id=dataset_id)
+    profile = _resolve_profile(catalog, write_profile)
+    sort_keys = _sort_keys(catalog, table.schema)
+    column = time_column or find_time_column(table.schema) or ""
+    if column and column not in table.schema.names:
+        raise ValidationError(f"unknown time column: {column}")
+
+    mk = metadata_key(dataset_id)
+    existing_meta = _existing_metadata(storage, mk)
+    current = load_manifest(storage, dataset_id)
+    prefix = dataset_prefix(dataset_id)
+
+    def _key(f: PartitionFile) -> str:
+        return f"{prefix}/{f.path}"
+
+    files: list[PartitionFile] = []
+    adopted: Optional[pa.Table] = None
+    drop_pointer = False
+    if current is None:
+        single_key, version = resolve_data_key(storage, dataset_id)
+        if storage.exists(single_key):
+            adopted = _read_file(storage, single_key)
+            # Readers prefer `latest.json` over the manifest, so the pointer
+            # must go; the data file itself is left to `gc_versions`.
+            drop_pointer = version is not None
+    elif current.partition_by != APPEND_LAYOUT:
+        raise ValidationError(f"{dataset_id} is date-partitioned; it cannot be appended to")
+    elif current.key_columns != keys:
+        raise ValidationError(
+            f"key_columns must match the dataset's: {', '.join(current.key_columns)}"
+        )
+    else:
+        files = list(current.files)
+
+    # Appended rows must fit the published schema (parquet may widen e.g.
+    # strings to large_string on read).
+    schema: Optional[pa.Schema] = None
+    if adopted is not None:
+        schema = adopted.schema
+    elif files:
+        schema = read_parquet_footer(storage, _key(files[0])).schema.to_arrow_schema()
+    if schema is not None and not table.schema.equals(schema, check_metadata=False):
+        try:
+            table = table.cast(schema)
+        except (ValueError, pa.ArrowException) as e:
+            raise ValidationError("table schema does not match the published schema") from e
+
+    table = _dedupe_last(table, keys)
+    if adopted is not None:
+        new = _new_rows(table, adopted.select(keys), keys)
+    elif files:
+        published_keys = pa.concat_tables(_read_files(storage, [_key(f) for f in files], keys))
+        new = _new_rows(table, published_keys, keys)
+    else:
+        new = table
+
+    def _write(kind: str, data_table: pa.Table) -> tuple[PartitionFile, bytes]:
+        return _write_file(
+            dataset_id, kind, data_table, profile=profile, sort_keys=sort_keys, time_column=column
+        )
+
+    deltas = [f for f in files if f.partition == "delta"]
+    delta: Optional[tuple[PartitionFile, bytes]] = None
+    if new.num_rows and files:
+        delta = _write("delta", new)
+        deltas.append(delta[0])
+
+    if adopted is not None or not files:
+        rewrite_base = True  # first publish, or adopting a single-file dataset
+    elif compact is None:
+        rewrite_base = len(deltas) > int(compact_max_deltas) or sum(
+            f.size_bytes for f in deltas
+        ) > int(compact_max_delta_bytes)
+    else:
+        rewrite_base = compact and len(files) + (delta is not None) > 1
+
+    uploads: dict[str, bytes] = {}
+    full: Optional[pa.Table] = None
+    stats: Optional[dict[str, dict[str, Any]]] = None
+    if rewrite_base:
+        parts = _read_files(storage, [_key(f) for f in files])
+        if adopted is not None:
+            parts.append(adopted)
+        full = pa.concat_tables([*parts, new])
+        if full.num_rows == 0:
+            raise ValidationError("cannot publish an empty appended dataset")
+        base, data = _write("base", full)
+        files = [base]
+        uploads[_key(base)] = data
+        if compute_stats:
+            loaders = {n: functools.partial(full.column, n) for n in full.column_names}
+            footer = pq.read_metadata(pa.BufferReader(data))
+            stats = _stats_payload(full.schema, table_stats(loaders), footer)
+    else:
+        if delta is not None:
+            files.append(delta[0])
+            uploads[_key(delta[0])] = delta[1]
+        old_stats = existing_meta.get("stats") if existing_meta else None
+        if compute_stats and isinstance(old_stats, dict):
+            # Merge the delta into the published stats; distinct counts cannot
+            # be merged and are dropped.
+            stats = old_stats
+            if delta is not None:
+                loaders = {n: functools.partial(new.column, n) for n in new.column_names}
+                footer = pq.read_metadata(pa.BufferReader(delta[1]))
+                delta_stats = _stats_payload(
+                    new.schema, table_stats(loaders, distinct=False), footer
+                )
+                stats = _merge_stats_payload(old_stats, delta_stats)
+
+    # Appends leave the first rows, and so the preview, unchanged.
+    preview_obj = None
+    if existing_meta and full is None:
+        preview_obj = _existing_preview(storage, dataset_id, existing_meta)
+    if preview_obj is None and preview_rows > 0:
+        preview_obj = _table_preview_json(
+            full if full is not None else new,
+            preview_rows=preview_rows,
+            max_bytes=preview_max_bytes,
+        )
+
+    published = PublishedDataset(
+        dataset_id=dataset_id,
+        updated_at=updated_at or utc_now_iso(),
+        data_key=manifest_key(dataset_id),
+        metadata_key=mk,
+        row_count=sum(f.row_count for f in files),
+        data_size_bytes=sum(f.size_bytes for f in files),
+        checksum_sha256=sha256_bytes(
+            _canonical_json_bytes(
+                {
+                    "partition_column": column,
+                    "key_columns": keys,
+                    "files": [f.to_dict() for f in files],
+                }
+            )
+        ),
+        columns=_table_schema_columns(table),
+        preview=preview_obj,
+        catalog=catalog_payload,
+        stats=stats,
+        separate_preview=separate_preview,
+    )
+
+    def _upload() -> None:
+        for key, data in uploads.items():
+            storage.put_bytes(key, data, content_type="application/octet-stream")
+        manifest = Manifest(
+            dataset_id=dataset_id,
+            updated_at=published.updated_at,
+            partition_column=column,
+            files=files,
+            partition_by=APPEND_LAYOUT,
+            key_columns=keys,
+        )
+        storage.put_bytes(
+            manifest_key(dataset_id),
+            _canonical_json_bytes(manifest.to_dict()),
+            content_type="application/json",
+        )
+
+    result = _commit_publish(
+        storage,
+        published,
+        upload=_upload,
+        existing=existing_meta,
+        refresh_checked_at=refresh_checked_at,
+    )
+    if drop_pointer:
+        storage.delete(latest_key(dataset_id))
+    return result
+
+
+def compact_appended(
+    storage: StorageBackend,
+    *,
+    dataset_id: str,
+    catalog: CatalogInput,
+    **kwargs: Any,
+) -> PublishedDataset:
+    """Merge the base and delta files of an appended dataset into one base file."""
+
+    manifest = load_manifest(storage, dataset_id)
+    if manifest is None or manifest.partition_by != APPEND_LAYOUT or not manifest.files:
+        raise NotFoundError(f"not found: appended dataset {dataset_id}")
+    footer = read_parquet_footer(storage, manifest.file_key(manifest.files[0]))
+    return publish_append(
+        storage,
+        dataset_id=dataset_id,
+        table=footer.schema.to_arrow_schema().empty_table(),
+        key_columns=manifest.key_columns,
+        catalog=catalog,
+        time_column=manifest.partition_column or None,
+        compact=True,
+        **kwargs,
+    )
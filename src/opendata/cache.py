@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import pyarrow as pa
+
+from .env import load_dotenv
+from .errors import ValidationError
+from .hashing import sha256_bytes
+
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+CACHE_FORMATS = ("parquet", "arrow")
+
+
+class DiskCache:
+    """Content-addressed on-disk cache for dataset objects.
+
+    Entries are keyed by the `checksum_sha256` recorded in `metadata.json`, so a
+    republished dataset simply misses and old entries age out. Writes go to a temp
+    file in the cache directory followed by `os.replace`, which makes them atomic
+    for concurrent processes sharing the same directory. Recency is tracked via
+    file mtime (bumped on every hit) and used for LRU eviction once the total size
+    exceeds `max_bytes`.
+
+    With `format="parquet"` entries are the downloaded parquet bytes (`get`/`put`).
+    With `format="arrow"` entries are decoded tables stored as uncompressed Arrow
+    IPC files (`get_table`/`put_table`) and opened with `pa.memory_map`, so every
+    process on a host gets zero-copy tables backed by the same OS page cache.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        format: str = "parquet",
+    ) -> None:
+        if int(max_bytes) <= 0:
+            raise ValidationError("cache max_bytes must be > 0")
+        if format not in CACHE_FORMATS:
+            raise ValidationError(f"cache format must be one of: {', '.join(CACHE_FORMATS)}")
+        self._directory = Path(directory)
+        self._max_bytes = int(max_bytes)
+        self._format = format
+
+    @staticmethod
+    def from_env() -> Optional[DiskCache]:
+        """Create a cache from environment variables, or return None if disabled.
+
+        - OPENDATA_CACHE_DIR: cache directory (may be shared between processes)
+        - OPENDATA_CACHE_MAX_BYTES: size cap in bytes (default: 2 GiB)
+        - OPENDATA_CACHE_FORMAT: parquet|arrow (default: parquet)
+        """
+
+        load_dotenv()
+
+        directory = os.environ.get("OPENDATA_CACHE_DIR", "").strip()
+        if not directory:
+            return None
+
+        max_raw = os.environ.get("OPENDATA_CACHE_MAX_BYTES", "").strip()
+        max_bytes = DEFAULT_CACHE_MAX_BYTES
+        if max_raw:
+            try:
+                max_bytes = int(max_raw)
+            except ValueError as e:
+                raise ValidationError("OPENDATA_CACHE_MAX_BYTES must be an integer") from e
+
+        fmt = os.environ.get("OPENDATA_CACHE_FORMAT", "").strip().lower() or "parquet"
+
+        return DiskCache(Path(directory).expanduser(), max_bytes=max_bytes, format=fmt)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    def path_for(self, checksum_sha256: str) -> Path:
+        checksum = checksum_sha256.strip().lower()
+        if len(checksum) != 64 or any(c not in "0123456789abcdef" for c in checksum):
+            raise ValidationError(f"invalid sha256 checksum: {checksum_sha256!r}")
+        return self._directory / "objects" / checksum[:2] / f"{checksum}.{self._format}"
+
+    def _require_format(self, fmt: str) -> None:
+        if self._format != fmt:
+            raise ValidationError(f"operation requires a {fmt!r} cache, not {self._format!r}")
+
+    def get(self, checksum_sha256: str) -> Optional[bytes]:
+        self._require_format("parquet")
+        path = self.path_for(checksum_sha256)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        self._touch(path)
+        return data
+
+    def put(self, data: bytes) -> str:
+        """Store `data` under its own sha256 and return the checksum.
+
+        Keying by the hash of the bytes actually received (rather than the
+        checksum advertised in metadata) keeps the cache consistent even if the
+        dataset was republished between the metadata and data fetches.
+        """
+
+        self._require_format("parquet")
+        checksum = sha256_bytes(data)
+        path = self.path_for(checksum)
+        if path.exists():
+            self._touch(path)
+            return checksum
+
+        with self._atomic_write(path) as f:
+            f.write(data)
+
+        self.evict()
+        return checksum
+
+    def get_table(self, checksum_sha256: str) -> Optional[pa.Table]:
+        """Return a zero-copy, memory-mapped table for a cached dataset version."""
+
+        self._require_format("arrow")
+        path = self.path_for(checksum_sha256)
+        try:
+            source = pa.memory_map(str(path), "r")
+        except FileNotFoundError:
+            return None
+        self._touch(path)
+        # The table's buffers point into the mapping, which stays valid even if
+        # the file is evicted (unlinked) while in use.
+        return pa.ipc.open_file(source).read_all()
+
+    def put_table(self, checksum_sha256: str, table: pa.Table) -> Path:
+        """Store `table` as an uncompressed Arrow IPC file for `checksum_sha256`.
+
+        The checksum should be the sha256 of the parquet bytes the table was
+        decoded from.
+        """
+
+        self._require_format("arrow")
+        path = self.path_for(checksum_sha256)
+        if path.exists():
+            self._touch(path)
+            return path
+
+        with self._atomic_write(path) as f:
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+
+        self.evict()
+        return path
+
+    def total_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self) -> int:
+        """Remove least-recently-used entries until under `max_bytes`.
+
+        Returns the number of bytes freed.
+        """
+
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        freed = 0
+        for _, path, size in sorted(entries, key=lambda e: e[0]):
+            if total <= self._max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                # Already evicted by another process, or still mapped (Windows).
+                pass
+            total -= size
+            freed += size
+        return freed
+
+    def clear(self) -> None:
+        for _, path, _ in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _entries(self) -> list[tuple[float, Path, int]]:
+        root = self._directory / "objects"
+        if not root.exists():
+            return []
+        out: list[tuple[float, Path, int]] = []
+        for path in root.glob(f"*/*.{self._format}"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            out.append((st.st_mtime, path, int(st.st_size)))
+        return out
+
+    @staticmethod
+    @contextmanager
+    def _atomic_write(path: Path) -> Iterator[BinaryIO]:
+        # Write to a temp file in the same directory, then rename over the final
+        # name: readers see either nothing or the complete file.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
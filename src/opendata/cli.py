@@ -7,23 +7,73 @@ from typing import Optional
 
 from .client import load
 from .deploy import deploy_workflow
+from .download import DEFAULT_CHUNK_BYTES, DEFAULT_MAX_WORKERS, download_file
 from .errors import OpendataError, ValidationError
+from .ids import dataset_prefix, validate_dataset_id
+from .info import info
 from .metadata import coerce_catalog
 from .publish import publish_parquet_file
 from .registry import Registry
 from .storage import storage_from_env
+from .versions import DEFAULT_KEEP_VERSIONS, gc_versions, resolve_data_keys
 
 
 def _cmd_load(args: argparse.Namespace) -> int:
     storage = storage_from_env()
 
-    df = load(args.dataset_id, storage=storage)
+    columns = None
+    if args.columns:
+        columns = [c.strip() for c in args.columns.split(",") if c.strip()]
+
+    df = load(
+        args.dataset_id,
+        columns=columns,
+        start=args.start,
+        end=args.end,
+        time_column=args.time_column,
+        storage=storage,
+    )
     head = int(args.head)
     print(df.head(head).to_string(index=False))
     print(f"\nrows={len(df)} cols={len(df.columns)}")
     return 0
 
 
+def _cmd_download(args: argparse.Namespace) -> int:
+    storage = storage_from_env()
+
+    validate_dataset_id(args.dataset_id)
+    name = args.dataset_id.split("/", 1)[1]
+    prefix = dataset_prefix(args.dataset_id)
+    keys = resolve_data_keys(storage, args.dataset_id)
+    if len(keys) == 1 and not keys[0].startswith(f"{prefix}/part/"):
+        printed = Path(args.out) if args.out else Path(f"{name}.parquet")
+        targets = [(keys[0], printed)]
+    else:
+        # Partitioned / appended: every file under a directory, keeping the
+        # `part/...` layout so it reads back as a dataset.
+        printed = Path(args.out) if args.out else Path(name)
+        targets = [(k, printed / k[len(prefix) + 1 :]) for k in keys]
+    for key, dest in targets:
+        download_file(
+            storage,
+            key,
+            dest,
+            chunk_bytes=int(args.chunk_mb) * 1024 * 1024,
+            max_workers=int(args.workers),
+        )
+    print(printed)
+    return 0
+
+
+def _cmd_info(args: argparse.Namespace) -> int:
+    storage = storage_from_env()
+
+    described = info(args.dataset_id, footer=not args.no_footer, storage=storage)
+    print(json.dumps(described.to_dict(), indent=2, sort_keys=True))
+    return 0
+
+
 def _cmd_push(args: argparse.Namespace) -> int:
     storage = storage_from_env()
 
@@ -41,11 +91,25 @@ def _cmd_push(args: argparse.Namespace) -> int:
         dataset_id=catalog.id,
         parquet_path=Path(args.parquet_path),
         catalog=catalog,
+        skip_unchanged=not args.force,
+        refresh_checked_at=args.refresh_checked_at,
     )
     print(json.dumps(published.metadata(), indent=2, sort_keys=True))
     return 0
 
 
+def _cmd_gc(args: argparse.Namespace) -> int:
+    storage = storage_from_env()
+
+    validate_dataset_id(args.dataset_id)
+    keys = gc_versions(storage, args.dataset_id, keep=int(args.keep), dry_run=args.dry_run)
+    for key in keys:
+        print(key)
+    action = "would delete" if args.dry_run else "deleted"
+    print(f"{action} {len(keys)} object(s)")
+    return 0
+
+
 def _cmd_init(args: argparse.Namespace) -> int:
     from .scaffold import init_dataset_repo
 
@@ -77,15 +141,55 @@ def main(argv: Optional[list[str]] = None) -> int:
     p_load = sub.add_parser("load", help="Load a dataset")
     p_load.add_argument("dataset_id")
     p_load.add_argument("--head", default="5")
+    p_load.add_argument("--columns", help="Comma-separated list of columns to load")
+    p_load.add_argument("--start", help="Only rows with time column >= START")
+    p_load.add_argument("--end", help="Only rows with time column <= END (date-only: whole day)")
+    p_load.add_argument("--time-column", help="Column used by --start/--end (default: first date)")
     p_load.set_defaults(func=_cmd_load)
 
+    p_download = sub.add_parser(
+        "download", help="Download a dataset's parquet file with parallel range requests"
+    )
+    p_download.add_argument("dataset_id")
+    p_download.add_argument("--out", help="Output path (default: <name>.parquet)")
+    p_download.add_argument("--workers", default=str(DEFAULT_MAX_WORKERS))
+    p_download.add_argument("--chunk-mb", default=str(DEFAULT_CHUNK_BYTES // (1024 * 1024)))
+    p_download.set_defaults(func=_cmd_download)
+
+    p_info = sub.add_parser("info", help="Show schema, sizes and statistics without loading data")
+    p_info.add_argument("dataset_id")
+    p_info.add_argument(
+        "--no-footer", action="store_true", help="Only use metadata.json (skip the parquet footer)"
+    )
+    p_info.set_defaults(func=_cmd_info)
+
     p_push = sub.add_parser("push", help="Publish a parquet file")
     p_push.add_argument("parquet_path")
     cat = p_push.add_mutually_exclusive_group(required=True)
     cat.add_argument("--catalog-file", help="Path to a JSON catalog file")
     cat.add_argument("--catalog-json", help="Catalog JSON string")
+    p_push.add_argument(
+        "--force", action="store_true", help="Upload even if the checksum is unchanged"
+    )
+    p_push.add_argument(
+        "--refresh-checked-at",
+        action="store_true",
+        help="Record checked_at in metadata.json even when the data is unchanged",
+    )
     p_push.set_defaults(func=_cmd_push)
 
+    p_gc = sub.add_parser("gc", help="Delete data versions no longer referenced")
+    p_gc.add_argument("dataset_id")
+    p_gc.add_argument(
+        "--keep",
+        default=str(DEFAULT_KEEP_VERSIONS),
+        help="Previous versions to keep besides the current one",
+    )
+    p_gc.add_argument(
+        "--dry-run", action="store_true", help="Only list the objects that would be deleted"
+    )
+    p_gc.set_defaults(func=_cmd_gc)
+
     p_init = sub.add_parser("init", help="Create a dataset repo skeleton")
     p_init.add_argument("dataset_id")
     p_init.add_argument("--dir", default=".")
@@ -1,36 +1,427 @@
 from __future__ import annotations
 
-from typing import Optional
+import json
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
 
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-from .ids import data_key, validate_dataset_id
+from .cache import DiskCache
+from .download import fetch_object
+from .errors import NotFoundError, OpendataError, ValidationError
+from .filters import (
+    Filters,
+    RowFilter,
+    filter_columns,
+    prune_by_bounds,
+    prune_row_groups,
+    to_expression,
+)
+from .hashing import sha256_bytes
+from .ids import data_key, metadata_key, validate_dataset_id
 from .metadata import CatalogInput, coerce_catalog
+from .partitions import Manifest, PartitionFile, load_manifest
 from .publish import publish_dataframe
 from .storage import storage_from_env
 from .storage.base import StorageBackend
+from .storage.ranged import read_parquet_footer
+from .versions import load_latest, resolve_data_keys
+
+RETURN_TYPES = ("pandas", "pandas-arrow", "arrow")
+
+LoadResult = Union[pd.DataFrame, pa.Table]
+
+# Files of a partitioned dataset fetched concurrently by `load()`.
+PARTITION_READ_WORKERS = 8
+
+
+def _load_metadata(storage: StorageBackend, key: str) -> Optional[dict[str, Any]]:
+    try:
+        raw = storage.get_bytes(key)
+    except NotFoundError:
+        return None
+
+    meta = json.loads(raw)
+    if not isinstance(meta, dict):
+        return None
+    return meta
+
+
+def _metadata_checksum(storage: StorageBackend, dataset_id: str) -> Optional[str]:
+    # Only used for datasets without a pointer.
+    meta = _load_metadata(storage, metadata_key(dataset_id))
+    checksum = meta.get("checksum_sha256") if meta else None
+    return checksum if isinstance(checksum, str) and checksum else None
+
+
+def _fetch_data_bytes(
+    storage: StorageBackend, key: str, *, checksum: Optional[str], cache: Optional[DiskCache]
+) -> bytes:
+    if cache is None:
+        return fetch_object(storage, key)
+
+    if checksum:
+        cached = cache.get(checksum)
+        if cached is not None:
+            return cached
+
+    parquet_bytes = fetch_object(storage, key)
+    cache.put(parquet_bytes)
+    return parquet_bytes
+
+
+def _check_columns(pf: pq.ParquetFile, columns: Sequence[str]) -> list[str]:
+    names = set(pf.schema_arrow.names)
+    missing = [c for c in columns if c not in names]
+    if missing:
+        raise ValidationError(f"unknown column(s): {', '.join(missing)}")
+    return list(columns)
+
+
+def _read_parquet(
+    pf: pq.ParquetFile, columns: Optional[Sequence[str]], row_filter: Optional[RowFilter]
+) -> pa.Table:
+    cols = _check_columns(pf, columns) if columns is not None else None
+    if row_filter is None:
+        return pf.read(columns=cols)
+
+    # Skip row groups whose min/max statistics rule them out, then filter the
+    # remaining rows. Filter columns are read even if not requested.
+    dnf = row_filter.resolve(pf.schema_arrow)
+    read_cols = None if cols is None else list(dict.fromkeys([*cols, *filter_columns(dnf)]))
+    row_groups = prune_row_groups(pf.metadata, dnf)
+    table = pf.read_row_groups(row_groups, columns=read_cols).filter(to_expression(dnf))
+    return table.select(cols) if cols is not None else table
+
+
+def _read_ranged(
+    storage: StorageBackend,
+    key: str,
+    columns: Optional[Sequence[str]],
+    row_filter: Optional[RowFilter],
+) -> pa.Table:
+    # ParquetFile reads the footer first, then only the column chunks it decodes.
+    # `pre_buffer` lets pyarrow coalesce neighbouring chunks into fewer reads.
+    with storage.open_input_file(key) as f:
+        pf = pq.ParquetFile(f, pre_buffer=True)
+        return _read_parquet(pf, columns, row_filter)
+
+
+def _select_columns(table: pa.Table, columns: Sequence[str]) -> pa.Table:
+    missing = [c for c in columns if c not in table.schema.names]
+    if missing:
+        raise ValidationError(f"unknown column(s): {', '.join(missing)}")
+    return table.select(list(columns))
+
+
+def _read_table_arrow_cached(
+    storage: StorageBackend,
+    key: str,
+    *,
+    checksum: Optional[str],
+    columns: Optional[Sequence[str]],
+    cache: DiskCache,
+) -> pa.Table:
+    table = cache.get_table(checksum) if checksum else None
+
+    if table is None:
+        parquet_bytes = fetch_object(storage, key)
+        checksum = sha256_bytes(parquet_bytes)
+        decoded = pq.read_table(pa.BufferReader(parquet_bytes))
+        del parquet_bytes
+        cache.put_table(checksum, decoded)
+        # Re-open from the cache so this process shares the page cache too. The
+        # entry may already be gone if it alone exceeds the cache size.
+        table = cache.get_table(checksum)
+        if table is None:
+            table = decoded
+        del decoded
+
+    return _select_columns(table, columns) if columns is not None else table
+
+
+def _read_object(
+    storage: StorageBackend,
+    key: str,
+    *,
+    checksum: Optional[str],
+    columns: Optional[Sequence[str]],
+    cache: Optional[DiskCache],
+    row_filter: Optional[RowFilter],
+) -> pa.Table:
+    """Read one parquet object; `checksum` (if known) is its cache key."""
+
+    if cache is None and (columns is not None or row_filter is not None):
+        return _read_ranged(storage, key, columns, row_filter)
+
+    if cache is not None and cache.format == "arrow":
+        if row_filter is None:
+            return _read_table_arrow_cached(
+                storage, key, checksum=checksum, columns=columns, cache=cache
+            )
+        table = _read_table_arrow_cached(storage, key, checksum=checksum, columns=None, cache=cache)
+        table = table.filter(to_expression(row_filter.resolve(table.schema)))
+        return _select_columns(table, columns) if columns is not None else table
+
+    parquet_bytes = _fetch_data_bytes(storage, key, checksum=checksum, cache=cache)
+    return _read_parquet(pq.ParquetFile(pa.BufferReader(parquet_bytes)), columns, row_filter)
+
+
+def _read_partitioned(
+    storage: StorageBackend,
+    manifest: Manifest,
+    *,
+    columns: Optional[Sequence[str]],
+    cache: Optional[DiskCache],
+    row_filter: Optional[RowFilter],
+) -> pa.Table:
+    files = manifest.files
+    if not files:
+        raise NotFoundError(f"not found: no files in manifest of {manifest.dataset_id}")
+
+    if row_filter is not None:
+        # Skip whole files using the partition bounds listed in the manifest; the
+        # schema comes from one footer, fetched with a ranged read.
+        schema = read_parquet_footer(storage, manifest.file_key(files[0])).schema.to_arrow_schema()
+        dnf = row_filter.resolve(schema)
+        bounds = [(f.min, f.max) for f in files]
+        files = [files[i] for i in prune_by_bounds(schema, dnf, manifest.partition_column, bounds)]
+        if not files:
+            empty = schema.empty_table()
+            return _select_columns(empty, columns) if columns is not None else empty
+
+    def _one(f: PartitionFile) -> pa.Table:
+        return _read_object(
+            storage,
+            manifest.file_key(f),
+            checksum=f.checksum_sha256,
+            columns=columns,
+            cache=cache,
+            row_filter=row_filter,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(PARTITION_READ_WORKERS, len(files))) as pool:
+        return pa.concat_tables(list(pool.map(_one, files)))
+
+
+def _read_table(
+    storage: StorageBackend,
+    dataset_id: str,
+    *,
+    columns: Optional[Sequence[str]],
+    cache: Optional[DiskCache],
+    row_filter: Optional[RowFilter] = None,
+) -> pa.Table:
+    # `latest.json` names the current version and its checksum (the cache key).
+    pointer = load_latest(storage, dataset_id)
+    if pointer is not None:
+        return _read_object(
+            storage,
+            pointer.data_key,
+            checksum=pointer.version,
+            columns=columns,
+            cache=cache,
+            row_filter=row_filter,
+        )
+
+    # Partitioned and appended datasets have a manifest.json; it wins over a
+    # superseded `data.parquet` that `gc_versions` has not deleted yet.
+    manifest = load_manifest(storage, dataset_id)
+    if manifest is not None:
+        return _read_partitioned(
+            storage, manifest, columns=columns, cache=cache, row_filter=row_filter
+        )
+
+    checksum = _metadata_checksum(storage, dataset_id) if cache is not None else None
+    return _read_object(
+        storage,
+        data_key(dataset_id),
+        checksum=checksum,
+        columns=columns,
+        cache=cache,
+        row_filter=row_filter,
+    )
+
+
+def _check_return_type(return_type: str) -> str:
+    if return_type not in RETURN_TYPES:
+        raise ValidationError(
+            f"return_type must be one of: {', '.join(RETURN_TYPES)}; got {return_type!r}"
+        )
+    return return_type
+
+
+def _convert_table(table: pa.Table, return_type: str) -> LoadResult:
+    if return_type == "arrow":
+        return table
+    if return_type == "pandas-arrow":
+        # Arrow-backed dtypes wrap the existing Arrow buffers instead of copying.
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    # `self_destruct` releases each Arrow column as soon as it is converted, so
+    # peak memory is roughly one copy of the data plus one column. The caller
+    # must not use `table` afterwards.
+    return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 def load(
     dataset_id: str,
     *,
+    columns: Optional[Sequence[str]] = None,
+    start: Any = None,
+    end: Any = None,
+    filters: Optional[Filters] = None,
+    time_column: Optional[str] = None,
+    return_type: str = "pandas",
     storage: Optional[StorageBackend] = None,
-) -> pd.DataFrame:
-    """Load a dataset into a pandas DataFrame.
+    cache: Optional[DiskCache] = None,
+) -> LoadResult:
+    """Load a dataset into a pandas DataFrame (or an Arrow table).
 
-    This function does not write any local cache files. Data is fetched from the
-    configured storage backend and decoded in-memory.
+    Without a cache, data is fetched from the configured storage backend and
+    decoded in-memory. The small `latest.json` pointer is fetched first; it names
+    the current content-addressed version (`v/<sha256>/data.parquet`). With a
+    cache (explicit, or via `OPENDATA_CACHE_DIR`), the data is only downloaded
+    when that checksum is not already cached.
+
+    If `columns` is given and no cache is configured, only the parquet footer and
+    the requested column chunks are fetched (via ranged reads). With a cache the
+    whole object is downloaded once so later loads of any column set can hit it.
+    An `arrow`-format cache returns memory-mapped tables shared across processes;
+    combine it with `return_type="arrow"` to keep them zero-copy.
+
+    `start`/`end` select rows by `time_column` (default: the first timestamp or
+    date column); both bounds are inclusive and a date-only `end` covers the whole
+    day. `filters` takes pyarrow-style `[(column, op, value), ...]` terms (AND), or
+    a list of such lists (OR). Row groups whose min/max statistics cannot match
+    are never fetched; the remaining rows are filtered with `pyarrow.compute`.
+
+    `return_type` selects the result:
+
+    - `pandas` (default): NumPy-backed DataFrame, converted column by column with
+      Arrow buffers released as they go to keep peak memory low
+    - `pandas-arrow`: DataFrame with Arrow-backed (`pd.ArrowDtype`) columns
+    - `arrow`: the decoded `pyarrow.Table`, without any conversion
     """
 
+    _check_return_type(return_type)
     storage = storage or storage_from_env()
+    cache = cache or DiskCache.from_env()
 
     validate_dataset_id(dataset_id)
 
-    parquet_bytes = storage.get_bytes(data_key(dataset_id))
-    table = pq.read_table(pa.BufferReader(parquet_bytes))
-    return table.to_pandas()
+    row_filter = RowFilter.create(filters, start=start, end=end, time_column=time_column)
+    table = _read_table(storage, dataset_id, columns=columns, cache=cache, row_filter=row_filter)
+    return _convert_table(table, return_type)
+
+
+@dataclass
+class LoadManyResult:
+    """Outcome of `load_many()`: loaded frames plus per-dataset errors."""
+
+    frames: dict[str, LoadResult] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    def raise_for_errors(self) -> None:
+        if not self.errors:
+            return
+        ids = ", ".join(sorted(self.errors))
+        first = next(iter(self.errors.values()))
+        raise OpendataError(f"failed to load {len(self.errors)} dataset(s): {ids}") from first
+
+
+def load_many(
+    dataset_ids: Sequence[str],
+    *,
+    max_workers: int = 8,
+    columns: Optional[Sequence[str]] = None,
+    return_type: str = "pandas",
+    storage: Optional[StorageBackend] = None,
+    cache: Optional[DiskCache] = None,
+) -> LoadManyResult:
+    """Load several datasets concurrently.
+
+    Metadata and data objects are fetched on a thread pool sharing one storage
+    backend (and so one pooled HTTP session); parquet decoding uses pyarrow's own
+    thread pool. Failures are collected per dataset in `LoadManyResult.errors`
+    instead of being raised, so total time is bounded by the slowest dataset.
+    """
+
+    if int(max_workers) <= 0:
+        raise ValidationError("max_workers must be > 0")
+    _check_return_type(return_type)
+    storage = storage or storage_from_env()
+    cache = cache or DiskCache.from_env()
+
+    def _one(dataset_id: str) -> LoadResult:
+        validate_dataset_id(dataset_id)
+        table = _read_table(storage, dataset_id, columns=columns, cache=cache)
+        return _convert_table(table, return_type)
+
+    ids = list(dict.fromkeys(dataset_ids))
+    result = LoadManyResult()
+    if not ids:
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(int(max_workers), len(ids))) as pool:
+        futures = {dataset_id: pool.submit(_one, dataset_id) for dataset_id in ids}
+        for dataset_id, future in futures.items():
+            try:
+                result.frames[dataset_id] = future.result()
+            except Exception as e:
+                result.errors[dataset_id] = e
+    return result
+
+
+def iter_batches(
+    dataset_id: str,
+    *,
+    batch_size: int = 65_536,
+    columns: Optional[Sequence[str]] = None,
+    storage: Optional[StorageBackend] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Stream a dataset as Arrow record batches, one row group at a time.
+
+    While the batches of one row group are being consumed, the next row group is
+    fetched and decoded on a background thread, so peak memory stays around two
+    row groups regardless of dataset size. Partitioned and appended datasets
+    are streamed file by file, in manifest order.
+    """
+
+    if int(batch_size) <= 0:
+        raise ValidationError("batch_size must be > 0")
+
+    storage = storage or storage_from_env()
+
+    validate_dataset_id(dataset_id)
+
+    for key in resolve_data_keys(storage, dataset_id):
+        yield from _iter_file_batches(storage, key, batch_size=batch_size, columns=columns)
+
+
+def _iter_file_batches(
+    storage: StorageBackend, key: str, *, batch_size: int, columns: Optional[Sequence[str]]
+) -> Iterator[pa.RecordBatch]:
+    with storage.open_input_file(key) as f:
+        pf = pq.ParquetFile(f)
+        cols = _check_columns(pf, columns) if columns is not None else None
+        num_row_groups = pf.num_row_groups
+        if num_row_groups == 0:
+            return
+
+        # A single worker keeps all file access on one thread; the consumer only
+        # ever touches already-decoded tables.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(pf.read_row_group, 0, columns=cols)
+            for i in range(num_row_groups):
+                table = pending.result()
+                if i + 1 < num_row_groups:
+                    pending = pool.submit(pf.read_row_group, i + 1, columns=cols)
+                yield from table.to_batches(max_chunksize=int(batch_size))
+                del table
 
 
 def push(
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .env import load_dotenv
+from .errors import NotFoundError, StorageError, ValidationError
+from .storage.base import StorageBackend
+
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_CHUNK_RETRIES = 3
+DEFAULT_PARALLEL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def parallel_threshold_from_env() -> int:
+    """Return the object size above which `load()` downloads in parallel chunks.
+
+    - OPENDATA_PARALLEL_DOWNLOAD_THRESHOLD: bytes (default: 64 MiB; 0 disables)
+    """
+
+    load_dotenv()
+    raw = os.environ.get("OPENDATA_PARALLEL_DOWNLOAD_THRESHOLD", "").strip()
+    if not raw:
+        return DEFAULT_PARALLEL_THRESHOLD_BYTES
+    try:
+        return max(int(raw), 0)
+    except ValueError as e:
+        raise ValidationError("OPENDATA_PARALLEL_DOWNLOAD_THRESHOLD must be an integer") from e
+
+
+def _chunk_ranges(size: int, chunk_bytes: int, offset: int = 0) -> list[tuple[int, int]]:
+    return [(start, min(start + chunk_bytes, size)) for start in range(offset, size, chunk_bytes)]
+
+
+def _download_chunks(
+    storage: StorageBackend,
+    key: str,
+    *,
+    size: int,
+    write: Callable[[int, bytes], None],
+    chunk_bytes: int,
+    max_workers: int,
+    retries: Optional[int],
+    offset: int = 0,
+) -> None:
+    if int(chunk_bytes) <= 0:
+        raise ValidationError("chunk_bytes must be > 0")
+    if int(max_workers) <= 0:
+        raise ValidationError("max_workers must be > 0")
+    if retries is None:
+        # Backends that retry requests themselves would multiply the attempts.
+        retries = 0 if storage.retries_requests else DEFAULT_CHUNK_RETRIES
+
+    def _fetch(start: int, end: int) -> None:
+        # Retry each chunk on its own; after a partial read, resume from the
+        # first missing byte rather than restarting the chunk.
+        pos = start
+        failures = 0
+        while pos < end:
+            try:
+                data = storage.get_range(key, pos, end)
+                if not data:
+                    raise StorageError(f"empty range response for {key} at {pos}")
+            except NotFoundError:
+                raise
+            except Exception as e:
+                failures += 1
+                if failures > retries:
+                    raise StorageError(f"failed to download {key} [{pos}, {end})") from e
+                time.sleep(min(0.25 * (2 ** (failures - 1)), 4.0))
+                continue
+            write(pos, data[: end - pos])
+            pos += min(len(data), end - pos)
+
+    ranges = _chunk_ranges(size, int(chunk_bytes), offset)
+    with ThreadPoolExecutor(max_workers=min(int(max_workers), max(len(ranges), 1))) as pool:
+        futures = [pool.submit(_fetch, start, end) for start, end in ranges]
+        for future in futures:
+            future.result()
+
+
+def download_bytes(
+    storage: StorageBackend,
+    key: str,
+    *,
+    size: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    retries: Optional[int] = None,
+) -> bytearray:
+    """Download an object with concurrent range requests into one preallocated buffer.
+
+    Each chunk is retried `retries` times (default: `DEFAULT_CHUNK_RETRIES`,
+    or none for backends that retry requests themselves).
+    """
+
+    total = storage.size(key) if size is None else int(size)
+    return _download_buffer(
+        storage, key, total, chunk_bytes=chunk_bytes, max_workers=max_workers, retries=retries
+    )
+
+
+def _download_buffer(
+    storage: StorageBackend,
+    key: str,
+    size: int,
+    *,
+    head: bytes = b"",
+    chunk_bytes: int,
+    max_workers: int,
+    retries: Optional[int],
+) -> bytearray:
+    # `head` is the already fetched start of the object.
+    buf = bytearray(size)
+    buf[: len(head)] = head
+    view = memoryview(buf)
+
+    def _write(start: int, data: bytes) -> None:
+        view[start : start + len(data)] = data
+
+    _download_chunks(
+        storage,
+        key,
+        size=size,
+        write=_write,
+        chunk_bytes=chunk_bytes,
+        max_workers=max_workers,
+        retries=retries,
+        offset=len(head),
+    )
+    return buf
+
+
+def download_file(
+    storage: StorageBackend,
+    key: str,
+    dest: Path,
+    *,
+    size: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    retries: Optional[int] = None,
+) -> Path:
+    """Download an object with concurrent range requests into a preallocated file.
+
+    Chunks are written into a temp file next to `dest`, which is renamed into
+    place only once every chunk has arrived.
+    """
+
+    total = storage.size(key) if size is None else int(size)
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", dir=dest.parent)
+    lock = threading.Lock()
+    try:
+        with os.fdopen(fd, "r+b") as f:
+            f.truncate(total)
+
+            def _write(start: int, data: bytes) -> None:
+                with lock:
+                    f.seek(start)
+                    f.write(data)
+
+            _download_chunks(
+                storage,
+                key,
+                size=total,
+                write=_write,
+                chunk_bytes=chunk_bytes,
+                max_workers=max_workers,
+                retries=retries,
+            )
+        os.replace(tmp_name, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return dest
+
+
+def fetch_object(
+    storage: StorageBackend, key: str, *, threshold_bytes: Optional[int] = None
+) -> bytes:
+    """Fetch a whole object, switching to parallel chunks above `threshold_bytes`.
+
+    Only backends with native range reads are considered; the threshold defaults
+    to `parallel_threshold_from_env()`. The first ranged read also reports the
+    object's size, so small objects take a single request.
+    """
+
+    threshold = parallel_threshold_from_env() if threshold_bytes is None else threshold_bytes
+    if threshold <= 0 or not storage.supports_range_reads:
+        return storage.get_bytes(key)
+
+    head, size = storage.get_range_and_size(key, 0, min(threshold, DEFAULT_CHUNK_BYTES))
+    if len(head) >= size:
+        return head
+    if size < threshold:
+        return head + storage.get_range(key, len(head), size)
+    buf = _download_buffer(
+        storage,
+        key,
+        size,
+        head=head,
+        chunk_bytes=DEFAULT_CHUNK_BYTES,
+        max_workers=DEFAULT_MAX_WORKERS,
+        retries=None,
+    )
+    return bytes(buf)
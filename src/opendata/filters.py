@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import datetime as dt
+import operator
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .errors import ValidationError
+
+FilterTerm = tuple[str, str, Any]
+# Same shape as pyarrow's `filters=`: a list of terms (AND), or a list of such
+# lists (OR of ANDs, i.e. disjunctive normal form).
+Filters = Union[Sequence[FilterTerm], Sequence[Sequence[FilterTerm]]]
+
+FILTER_OPS = ("=", "==", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+_COMPARE: dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def find_time_column(schema: pa.Schema) -> Optional[str]:
+    """Return the first timestamp or date column of `schema`, if any."""
+
+    for f in schema:
+        if pa.types.is_timestamp(f.type) or pa.types.is_date(f.type):
+            return str(f.name)
+    return None
+
+
+def _is_date_only(value: Any) -> bool:
+    if isinstance(value, dt.date) and not isinstance(value, dt.datetime):
+        return True
+    return isinstance(value, str) and len(value.strip()) == 10
+
+
+def _coerce_value(value: Any, typ: pa.DataType) -> pa.Scalar:
+    """Convert a user-supplied filter value to a scalar of the column type."""
+
+    try:
+        if pa.types.is_timestamp(typ):
+            ts = pd.Timestamp(value)
+            tz = getattr(typ, "tz", None)
+            if tz and ts.tzinfo is None:
+                ts = ts.tz_localize(tz)
+            elif not tz and ts.tzinfo is not None:
+                ts = ts.tz_convert("UTC").tz_localize(None)
+            return pa.scalar(ts, type=typ)
+        if pa.types.is_date(typ):
+            return pa.scalar(pd.Timestamp(value).date(), type=typ)
+        if isinstance(value, pa.Scalar):
+            return value.cast(typ)
+        return pa.scalar(value, type=typ)
+    except (ValueError, TypeError, pa.ArrowException) as e:
+        raise ValidationError(f"cannot compare {value!r} with a {typ} column") from e
+
+
+def normalize_filters(
+    schema: pa.Schema,
+    filters: Optional[Filters] = None,
+    *,
+    start: Any = None,
+    end: Any = None,
+    time_column: Optional[str] = None,
+) -> list[list[FilterTerm]]:
+    """Validate filters and return them in DNF with values cast to column types.
+
+    `start`/`end` become `time_column >= start` / `time_column <= end` terms added
+    to every conjunction; a date-only `end` (e.g. `"2024-12-31"`) covers that
+    whole day. `time_column` defaults to the first timestamp/date column.
+    """
+
+    dnf: list[list[FilterTerm]] = []
+    if filters:
+        first = filters[0]
+        if isinstance(first, tuple) and len(first) == 3 and isinstance(first[0], str):
+            dnf = [list(filters)]  # type: ignore[arg-type]
+        else:
+            dnf = [list(conj) for conj in filters]  # type: ignore[arg-type]
+
+    time_terms: list[FilterTerm] = []
+    if start is not None or end is not None:
+        col = time_column or find_time_column(schema)
+        if col is None:
+            raise ValidationError("start/end need a timestamp or date column; pass time_column=")
+        if col not in schema.names:
+            raise ValidationError(f"unknown time_column: {col}")
+        if start is not None:
+            time_terms.append((col, ">=", start))
+        if end is not None:
+            if _is_date_only(end) and pa.types.is_timestamp(schema.field(col).type):
+                time_terms.append((col, "<", pd.Timestamp(end) + pd.Timedelta(days=1)))
+            else:
+                time_terms.append((col, "<=", end))
+    if time_terms:
+        dnf = [conj + time_terms for conj in dnf] if dnf else [time_terms]
+
+    names = set(schema.names)
+    out: list[list[FilterTerm]] = []
+    for conj in dnf:
+        terms: list[FilterTerm] = []
+        for term in conj:
+            if not isinstance(term, (tuple, list)) or len(term) != 3:
+                raise ValidationError(f"filter terms must be (column, op, value); got {term!r}")
+            col, op, value = term
+            if col not in names:
+                raise ValidationError(f"unknown filter column: {col}")
+            if op not in FILTER_OPS:
+                raise ValidationError(f"filter op must be one of: {', '.join(FILTER_OPS)}")
+            typ = schema.field(col).type
+            if op in ("in", "not in"):
+                if isinstance(value, (str, bytes)) or not value:
+                    raise ValidationError(f"filter value for {op!r} must be a non-empty list")
+                coerced: Any = [_coerce_value(v, typ) for v in value]
+            else:
+                coerced = _coerce_value(value, typ)
+            terms.append((col, op, coerced))
+        out.append(terms)
+    return out
+
+
+def filter_columns(dnf: list[list[FilterTerm]]) -> list[str]:
+    return list(dict.fromkeys(col for conj in dnf for col, _, _ in conj))
+
+
+def to_expression(dnf: list[list[FilterTerm]]) -> pc.Expression:
+    def _term(col: str, op: str, value: Any) -> pc.Expression:
+        field = pc.field(col)
+        if op == "in":
+            return field.isin(pa.array([v.as_py() for v in value], type=value[0].type))
+        if op == "not in":
+            return ~field.isin(pa.array([v.as_py() for v in value], type=value[0].type))
+        return _COMPARE[op](field, value)
+
+    expr: Optional[pc.Expression] = None
+    for conj in dnf:
+        c: Optional[pc.Expression] = None
+        for term in conj:
+            t = _term(*term)
+            c = t if c is None else c & t
+        if c is None:
+            continue
+        expr = c if expr is None else expr | c
+    return expr if expr is not None else pc.scalar(True)
+
+
+def _term_may_match(op: str, value: Any, lo: Any, hi: Any) -> bool:
+    if op in ("=", "=="):
+        return bool(lo <= value.as_py() <= hi)
+    if op == "<":
+        return bool(lo < value.as_py())
+    if op == "<=":
+        return bool(lo <= value.as_py())
+    if op == ">":
+        return bool(hi > value.as_py())
+    if op == ">=":
+        return bool(hi >= value.as_py())
+    if op == "in":
+        return any(lo <= v.as_py() <= hi for v in value if v.is_valid)
+    return True
+
+
+def _row_group_may_match(
+    rg_meta: pq.RowGroupMetaData, leaf_index: dict[str, int], term: FilterTerm
+) -> bool:
+    col, op, value = term
+    idx = leaf_index.get(col)
+    if idx is None:
+        return True
+    stats = rg_meta.column(idx).statistics
+    if stats is None or not stats.has_min_max:
+        return True
+    try:
+        return _term_may_match(op, value, stats.min, stats.max)
+    except TypeError:
+        return True
+
+
+def prune_row_groups(metadata: pq.FileMetaData, dnf: list[list[FilterTerm]]) -> list[int]:
+    """Return the row groups whose min/max statistics may satisfy `dnf`.
+
+    Row groups are only skipped when the statistics prove no row can match;
+    missing statistics, nested columns or incomparable values keep them.
+    """
+
+    if not dnf:
+        return list(range(metadata.num_row_groups))
+
+    leaf_index: dict[str, int] = {}
+    for i in range(metadata.num_columns):
+        path = metadata.schema.column(i).path
+        if "." not in path:
+            leaf_index[path] = i
+
+    keep: list[int] = []
+    for rg in range(metadata.num_row_groups):
+        rg_meta = metadata.row_group(rg)
+        if rg_meta.num_rows == 0:
+            continue
+        if any(all(_row_group_may_match(rg_meta, leaf_index, t) for t in conj) for conj in dnf):
+            keep.append(rg)
+    return keep
+
+
+def _bounds_may_match(column: str, lo: Any, hi: Any, term: FilterTerm) -> bool:
+    col, op, value = term
+    if col != column:
+        return True
+    try:
+        return _term_may_match(op, value, lo, hi)
+    except TypeError:
+        return True
+
+
+def prune_by_bounds(
+    schema: pa.Schema,
+    dnf: list[list[FilterTerm]],
+    column: str,
+    bounds: Sequence[tuple[Any, Any]],
+) -> list[int]:
+    """Return the indices of `bounds` whose (min, max) of `column` may satisfy `dnf`.
+
+    Used to prune whole files of a partitioned dataset; bounds are raw values
+    (e.g. ISO strings from a manifest) and are cast to the column type. Missing
+    bounds and terms on other columns never prune.
+    """
+
+    if not dnf or column not in schema.names:
+        return list(range(len(bounds)))
+
+    typ = schema.field(column).type
+    keep: list[int] = []
+    for i, (lo, hi) in enumerate(bounds):
+        if lo is None or hi is None:
+            keep.append(i)
+            continue
+        lo_v = _coerce_value(lo, typ).as_py()
+        hi_v = _coerce_value(hi, typ).as_py()
+        if any(all(_bounds_may_match(column, lo_v, hi_v, t) for t in conj) for conj in dnf):
+            keep.append(i)
+    return keep
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """Row selection passed to `load()`, resolved against a file's schema."""
+
+    filters: Optional[Filters] = None
+    start: Any = None
+    end: Any = None
+    time_column: Optional[str] = None
+
+    @staticmethod
+    def create(
+        filters: Optional[Filters] = None,
+        *,
+        start: Any = None,
+        end: Any = None,
+        time_column: Optional[str] = None,
+    ) -> Optional[RowFilter]:
+        if not filters and start is None and end is None:
+            return None
+        return RowFilter(filters=filters, start=start, end=end, time_column=time_column)
+
+    def resolve(self, schema: pa.Schema) -> list[list[FilterTerm]]:
+        return normalize_filters(
+            schema, self.filters, start=self.start, end=self.end, time_column=self.time_column
+        )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+import io
 from pathlib import Path
+from typing import IO, Any
 
 
 def sha256_bytes(data: bytes) -> str:
@@ -14,3 +16,65 @@ def sha256_file(path: Path) -> str:
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
+
+
+class HashingWriter(io.RawIOBase):
+    """Write-only wrapper that hashes (sha256) and counts bytes as they pass through.
+
+    Lets a producer compute the checksum and size of an object while it is being
+    written (e.g. by `pq.ParquetWriter`) instead of re-reading it afterwards.
+    Closing the wrapper does not close the underlying file.
+
+    With `segments`, the bytes between consecutive `mark()` calls are also
+    hashed on their own (e.g. one parquet row group per span).
+    """
+
+    def __init__(self, raw: IO[bytes], *, segments: bool = False) -> None:
+        super().__init__()
+        self._raw = raw
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._segment = hashlib.sha256() if segments else None
+        self._segment_start = 0
+        self._segments: list[tuple[int, int, str]] = []
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def segments(self) -> list[tuple[int, int, str]]:
+        """`(offset, size, sha256)` of each non-empty span closed by `mark()`."""
+
+        return list(self._segments)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def mark(self) -> None:
+        """End the current span at the current offset (no-op without `segments`)."""
+
+        if self._segment is None or self._size == self._segment_start:
+            return
+        size = self._size - self._segment_start
+        self._segments.append((self._segment_start, size, self._segment.hexdigest()))
+        self._segment = hashlib.sha256()
+        self._segment_start = self._size
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._size
+
+    def write(self, data: Any) -> int:
+        view = memoryview(data).cast("B")
+        self._hash.update(view)
+        if self._segment is not None:
+            self._segment.update(view)
+        self._raw.write(view)
+        self._size += len(view)
+        return len(view)
+
+    def flush(self) -> None:
+        self._raw.flush()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from typing import Optional
 
 from .errors import DatasetIdError
 
@@ -33,6 +34,15 @@ def dataset_prefix(dataset_id: str) -> str:
     return f"datasets/{namespace}/{name}"
 
 
+def key_dataset_prefix(key: str) -> Optional[str]:
+    """Return the `datasets/<namespace>/<name>` prefix of an object key, if any."""
+
+    parts = key.split("/")
+    if len(parts) < 4 or parts[0] != "datasets":
+        return None
+    return "/".join(parts[:3])
+
+
 def data_key(dataset_id: str) -> str:
     return f"{dataset_prefix(dataset_id)}/data.parquet"
 
@@ -43,3 +53,71 @@ def metadata_key(dataset_id: str) -> str:
 
 def readme_key(dataset_id: str) -> str:
     return f"{dataset_prefix(dataset_id)}/README.md"
+
+
+def manifest_key(dataset_id: str) -> str:
+    return f"{dataset_prefix(dataset_id)}/manifest.json"
+
+
+def preview_key(dataset_id: str) -> str:
+    return f"{dataset_prefix(dataset_id)}/preview.json"
+
+
+def partition_file_key(dataset_id: str, partition: str, filename: str) -> str:
+    """Key of a file of a partitioned dataset, e.g. `.../part/date=2024-01-01/<file>`."""
+
+    return f"{dataset_prefix(dataset_id)}/part/date={partition}/{filename}"
+
+
+def append_file_key(dataset_id: str, kind: str, filename: str) -> str:
+    """Key of a `base` or `delta` file of an appended dataset."""
+
+    return f"{dataset_prefix(dataset_id)}/part/{kind}/{filename}"
+
+
+def latest_key(dataset_id: str) -> str:
+    return f"{dataset_prefix(dataset_id)}/latest.json"
+
+
+def version_data_key(dataset_id: str, version: str) -> str:
+    """Key of a content-addressed data version, `.../v/<sha256>/data.parquet`."""
+
+    return f"{dataset_prefix(dataset_id)}/v/{version}/data.parquet"
+
+
+def version_metadata_key(dataset_id: str, version: str) -> str:
+    """Key of the metadata of a data version, `.../v/<sha256>/metadata.json`."""
+
+    return f"{dataset_prefix(dataset_id)}/v/{version}/metadata.json"
+
+
+def version_preview_key(dataset_id: str, version: str) -> str:
+    """Key of the separate preview of a data version."""
+
+    return f"{dataset_prefix(dataset_id)}/v/{version}/preview.json"
+
+
+# Objects whose key is derived from their content never change once written.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Pointers are small and must always be revalidated.
+POINTER_CACHE_CONTROL = "no-cache"
+
+_IMMUTABLE_KEY_RE = re.compile(
+    r"^datasets/[^/]+/[^/]+/(v/[0-9a-f]{64}/data\.parquet|part/.+/part-[0-9a-f]+\.)"
+)
+
+
+def cache_control(key: str) -> Optional[str]:
+    """Return the `Cache-Control` header for an object key, if any.
+
+    Versioned data (`v/<sha256>/data.parquet`) and content-named partition
+    files are immutable; `latest.json` is always revalidated. A version's
+    metadata and preview can still change (catalog edits), so they get no
+    header.
+    """
+
+    if _IMMUTABLE_KEY_RE.match(key):
+        return IMMUTABLE_CACHE_CONTROL
+    if key.startswith("datasets/") and key.endswith("/latest.json"):
+        return POINTER_CACHE_CONTROL
+    return None
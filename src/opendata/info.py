@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import pyarrow.parquet as pq
+
+from .client import _load_metadata
+from .errors import NotFoundError
+from .ids import data_key, validate_dataset_id
+from .partitions import load_manifest
+from .preview import _json_sanitize
+from .storage import storage_from_env
+from .storage.base import StorageBackend
+from .storage.ranged import read_parquet_footer
+from .versions import current_metadata_key, load_latest
+
+# metadata.json fields that are not part of the human-authored catalog.
+_STATS_FIELDS = {
+    "dataset_id",
+    "updated_at",
+    "row_count",
+    "data_size_bytes",
+    "checksum_sha256",
+    "columns",
+    "preview",
+    "preview_path",
+    "stats",
+    "row_group_checksums",
+}
+
+
+@dataclass(frozen=True)
+class ColumnInfo:
+    """Schema entry for one top-level column, with footer sizes/statistics.
+
+    Sizes and statistics are summed/merged across row groups (and across the
+    leaves of nested columns); they are None when the footer was not read or
+    does not record them.
+    """
+
+    name: str
+    type: str
+    compressed_bytes: Optional[int] = None
+    uncompressed_bytes: Optional[int] = None
+    null_count: Optional[int] = None
+    min: Any = None
+    max: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"name": self.name, "type": self.type}
+        for key in ("compressed_bytes", "uncompressed_bytes", "null_count", "min", "max"):
+            value = getattr(self, key)
+            if value is not None:
+                out[key] = _json_sanitize(value)
+        return out
+
+
+@dataclass(frozen=True)
+class RowGroupInfo:
+    index: int
+    num_rows: int
+    compressed_bytes: int
+    uncompressed_bytes: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "num_rows": self.num_rows,
+            "compressed_bytes": self.compressed_bytes,
+            "uncompressed_bytes": self.uncompressed_bytes,
+        }
+
+
+@dataclass(frozen=True)
+class DatasetInfo:
+    """Metadata-only description of a dataset returned by `info()`."""
+
+    dataset_id: str
+    row_count: int
+    data_size_bytes: Optional[int]
+    columns: list[ColumnInfo]
+    row_groups: list[RowGroupInfo] = field(default_factory=list)
+    updated_at: Optional[str] = None
+    checksum_sha256: Optional[str] = None
+    catalog: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def column_names(self) -> list[str]:
+        return [c.name for c in self.columns]
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "dataset_id": self.dataset_id,
+            "row_count": self.row_count,
+            "columns": [c.to_dict() for c in self.columns],
+        }
+        if self.data_size_bytes is not None:
+            out["data_size_bytes"] = self.data_size_bytes
+        if self.row_groups:
+            out["row_groups"] = [rg.to_dict() for rg in self.row_groups]
+        if self.updated_at:
+            out["updated_at"] = self.updated_at
+        if self.checksum_sha256:
+            out["checksum_sha256"] = self.checksum_sha256
+        if self.catalog:
+            out["catalog"] = dict(self.catalog)
+        return out
+
+
+def _merge_stat(current: Any, value: Any, pick: Any) -> Any:
+    if current is None:
+        return value
+    try:
+        return pick(current, value)
+    except TypeError:
+        return current
+
+
+def _footer_columns(
+    md: pq.FileMetaData, types: dict[str, str]
+) -> tuple[list[ColumnInfo], list[RowGroupInfo]]:
+    sizes: dict[str, list[int]] = {name: [0, 0] for name in types}
+    nulls: dict[str, Optional[int]] = {name: 0 for name in types}
+    mins: dict[str, Any] = {}
+    maxs: dict[str, Any] = {}
+    row_groups: list[RowGroupInfo] = []
+
+    for rg in range(md.num_row_groups):
+        rg_meta = md.row_group(rg)
+        rg_compressed = 0
+        for i in range(rg_meta.num_columns):
+            col = rg_meta.column(i)
+            path = col.path_in_schema
+            name = path.split(".", 1)[0]
+            rg_compressed += int(col.total_compressed_size)
+            if name not in sizes:
+                continue
+            sizes[name][0] += int(col.total_compressed_size)
+            sizes[name][1] += int(col.total_uncompressed_size)
+
+            stats = col.statistics
+            if path != name:
+                # Leaf statistics of nested columns don't describe the column.
+                nulls[name] = None
+                continue
+            count = nulls[name]
+            if count is not None:
+                has_count = stats is not None and stats.has_null_count
+                nulls[name] = count + int(stats.null_count) if has_count else None
+            if stats is not None and stats.has_min_max:
+                mins[name] = _merge_stat(mins.get(name), stats.min, min)
+                maxs[name] = _merge_stat(maxs.get(name), stats.max, max)
+
+        row_groups.append(
+            RowGroupInfo(
+                index=rg,
+                num_rows=int(rg_meta.num_rows),
+                compressed_bytes=rg_compressed,
+                uncompressed_bytes=int(rg_meta.total_byte_size),
+            )
+        )
+
+    columns = [
+        ColumnInfo(
+            name=name,
+            type=typ,
+            compressed_bytes=sizes[name][0],
+            uncompressed_bytes=sizes[name][1],
+            null_count=nulls[name],
+            min=mins.get(name),
+            max=maxs.get(name),
+        )
+        for name, typ in types.items()
+    ]
+    return columns, row_groups
+
+
+def _stats_column(name: str, typ: str, stats: Any) -> ColumnInfo:
+    # The metadata.json `stats` block (when published) fills in the footer's
+    # fields, so `footer=False` still reports sizes and value ranges.
+    if not isinstance(stats, dict):
+        return ColumnInfo(name=name, type=typ)
+    return ColumnInfo(
+        name=name,
+        type=typ,
+        compressed_bytes=stats.get("compressed_bytes"),
+        uncompressed_bytes=stats.get("uncompressed_bytes"),
+        null_count=stats.get("null_count"),
+        min=stats.get("min"),
+        max=stats.get("max"),
+    )
+
+
+def info(
+    dataset_id: str,
+    *,
+    footer: bool = True,
+    storage: Optional[StorageBackend] = None,
+) -> DatasetInfo:
+    """Describe a dataset without downloading its data.
+
+    Catalog fields, row count, schema, freshness and (if published) column
+    statistics come from `metadata.json`.
+    With `footer=True` (default) the parquet footer is also fetched with a ranged
+    read to report row groups and per-column compressed/uncompressed sizes and
+    statistics. If `metadata.json` is missing, the footer alone is used.
+    """
+
+    storage = storage or storage_from_env()
+
+    validate_dataset_id(dataset_id)
+
+    # One pointer read, so metadata and footer describe the same version.
+    pointer = load_latest(storage, dataset_id)
+    meta = _load_metadata(storage, current_metadata_key(dataset_id, pointer))
+    if meta is None and not footer:
+        raise NotFoundError(f"not found: metadata for {dataset_id}")
+
+    columns: list[ColumnInfo] = []
+    row_groups: list[RowGroupInfo] = []
+    row_count = 0
+    size: Optional[int] = None
+    if meta is not None:
+        raw_stats = meta.get("stats")
+        stats: dict[str, Any] = raw_stats if isinstance(raw_stats, dict) else {}
+        columns = [
+            _stats_column(str(c.get("name")), str(c.get("type")), stats.get(str(c.get("name"))))
+            for c in meta.get("columns") or []
+            if isinstance(c, dict)
+        ]
+        row_count = int(meta.get("row_count") or 0)
+        raw_size = meta.get("data_size_bytes")
+        size = int(raw_size) if isinstance(raw_size, int) else None
+
+    if footer:
+        # Size the object itself rather than trusting metadata.json, which may
+        # describe a different version if the dataset was just republished.
+        manifest = load_manifest(storage, dataset_id) if pointer is None else None
+        if manifest is not None:
+            # Partitioned datasets: totals come from the manifest, columns from
+            # the metadata.json stats; per-file footers are not read.
+            size = manifest.data_size_bytes
+            row_count = manifest.row_count
+        else:
+            key = pointer.data_key if pointer is not None else data_key(dataset_id)
+            size = storage.size(key)
+            md = read_parquet_footer(storage, key, size=size)
+            schema = md.schema.to_arrow_schema()
+            types = {f.name: str(f.type) for f in schema}
+            columns, row_groups = _footer_columns(md, types)
+            row_count = int(md.num_rows)
+
+    catalog = {k: v for k, v in (meta or {}).items() if k not in _STATS_FIELDS}
+    return DatasetInfo(
+        dataset_id=dataset_id,
+        row_count=row_count,
+        data_size_bytes=size,
+        columns=columns,
+        row_groups=row_groups,
+        updated_at=(meta or {}).get("updated_at"),
+        checksum_sha256=(meta or {}).get("checksum_sha256"),
+        catalog=catalog,
+    )
@@ -5,6 +5,7 @@ from typing import Any, Optional, Union
 
 from .errors import ValidationError
 from .ids import validate_dataset_id
+from .profiles import resolve_write_profile
 
 
 @dataclass(frozen=True)
@@ -76,6 +77,9 @@ class GeoInfo:
         return out
 
 
+WriteProfileSpec = Union[str, dict[str, Any]]
+
+
 @dataclass(frozen=True)
 class DatasetCatalog:
     """Human-authored catalog fields embedded in producer code."""
@@ -90,6 +94,19 @@ class DatasetCatalog:
     owners: list[str] = field(default_factory=list)
     frequency: str = ""
     geo: Optional[GeoInfo] = None
+    # Parquet write profile name (see `opendata.profiles`) or a mapping of
+    # overrides; used by publishing only, not published in metadata.json.
+    write_profile: Optional[WriteProfileSpec] = None
+    # Row order enforced at publish time: rows are grouped by `cluster_by`, then
+    # ordered by `sort_by` (all ascending).
+    cluster_by: list[str] = field(default_factory=list)
+    sort_by: list[str] = field(default_factory=list)
+
+    @property
+    def sort_keys(self) -> list[str]:
+        """Columns the published data is sorted by (`cluster_by` + `sort_by`)."""
+
+        return list(dict.fromkeys([*self.cluster_by, *self.sort_by]))
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> DatasetCatalog:
@@ -115,6 +132,16 @@ class DatasetCatalog:
                 out.append(v.strip())
             return out
 
+        def _opt_columns(key: str) -> list[str]:
+            raw = data.get(key)
+            if raw is None:
+                return []
+            if isinstance(raw, str):
+                raw = [raw]
+            if not isinstance(raw, list) or not all(isinstance(v, str) and v.strip() for v in raw):
+                raise ValidationError(f"{key} must be a column name or a list of column names")
+            return [v.strip() for v in raw]
+
         topics = _req_list("topics")
         owners = _req_list("owners")
 
@@ -136,6 +163,12 @@ class DatasetCatalog:
                 raise ValidationError("geo must be a mapping")
             geo = GeoInfo.from_dict(geo_raw)
 
+        write_profile = data.get("write_profile")
+        if write_profile is not None:
+            if not isinstance(write_profile, (str, dict)):
+                raise ValidationError("write_profile must be a profile name or a mapping")
+            resolve_write_profile(write_profile)
+
         return DatasetCatalog(
             id=dataset_id,
             title=_req("title"),
@@ -147,6 +180,9 @@ class DatasetCatalog:
             owners=owners,
             frequency=frequency,
             geo=geo,
+            write_profile=write_profile,
+            cluster_by=_opt_columns("cluster_by"),
+            sort_by=_opt_columns("sort_by"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -166,11 +202,18 @@ class DatasetCatalog:
                 data["source"] = src
         if self.geo:
             data["geo"] = self.geo.to_dict()
+        if self.write_profile is not None:
+            data["write_profile"] = self.write_profile
+        if self.cluster_by:
+            data["cluster_by"] = list(self.cluster_by)
+        if self.sort_by:
+            data["sort_by"] = list(self.sort_by)
         return data
 
     def to_catalog_dict(self) -> dict[str, Any]:
         data = self.to_dict()
         data.pop("id", None)
+        data.pop("write_profile", None)
         return data
 
 
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .errors import NotFoundError, ValidationError
+from .ids import dataset_prefix, manifest_key
+from .storage.base import StorageBackend
+
+# Partitions are UTC calendar days of the partition column.
+PARTITION_BY = "date"
+# Append layout (`publish_append`): one `base` file plus `delta` files.
+APPEND_LAYOUT = "append"
+MANIFEST_LAYOUTS = (PARTITION_BY, APPEND_LAYOUT)
+
+
+@dataclass(frozen=True)
+class PartitionFile:
+    """One parquet file of a partitioned dataset, as listed in `manifest.json`.
+
+    `path` is relative to the dataset prefix; `partition` is the UTC day (date
+    layout) or `base` / `delta` (append layout); `min`/`max` are the bounds of
+    the partition column within the file (ISO-8601 strings).
+    """
+
+    path: str
+    partition: str
+    row_count: int
+    size_bytes: int
+    checksum_sha256: str
+    min: Optional[str] = None
+    max: Optional[str] = None
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> PartitionFile:
+        try:
+            return PartitionFile(
+                path=str(data["path"]),
+                partition=str(data["partition"]),
+                row_count=int(data["row_count"]),
+                size_bytes=int(data["size_bytes"]),
+                checksum_sha256=str(data["checksum_sha256"]),
+                min=data.get("min"),
+                max=data.get("max"),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"invalid manifest file entry: {data!r}") from e
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "path": self.path,
+            "partition": self.partition,
+            "row_count": self.row_count,
+            "size_bytes": self.size_bytes,
+            "checksum_sha256": self.checksum_sha256,
+        }
+        if self.min is not None:
+            out["min"] = self.min
+        if self.max is not None:
+            out["max"] = self.max
+        return out
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """Contents of `manifest.json`, the file list of a partitioned dataset."""
+
+    dataset_id: str
+    updated_at: str
+    partition_column: str
+    files: list[PartitionFile] = field(default_factory=list)
+    partition_by: str = PARTITION_BY
+    # Append layout only: columns that identify a row across files.
+    key_columns: list[str] = field(default_factory=list)
+
+    @property
+    def row_count(self) -> int:
+        return sum(f.row_count for f in self.files)
+
+    @property
+    def data_size_bytes(self) -> int:
+        return sum(f.size_bytes for f in self.files)
+
+    def file_key(self, f: PartitionFile) -> str:
+        return f"{dataset_prefix(self.dataset_id)}/{f.path}"
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> Manifest:
+        files = data.get("files")
+        if not isinstance(files, list) or not all(isinstance(f, dict) for f in files):
+            raise ValidationError("manifest files must be a list of objects")
+        partition_by = str(data.get("partition_by", PARTITION_BY))
+        if partition_by not in MANIFEST_LAYOUTS:
+            raise ValidationError(f"unsupported manifest partition_by: {partition_by!r}")
+        key_columns = data.get("key_columns") or []
+        if not isinstance(key_columns, list) or not all(isinstance(c, str) for c in key_columns):
+            raise ValidationError("manifest key_columns must be a list of column names")
+        return Manifest(
+            dataset_id=str(data.get("dataset_id", "")),
+            updated_at=str(data.get("updated_at", "")),
+            partition_column=str(data.get("partition_column", "")),
+            files=[PartitionFile.from_dict(f) for f in files],
+            partition_by=partition_by,
+            key_columns=list(key_columns),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "dataset_id": self.dataset_id,
+            "updated_at": self.updated_at,
+            "partition_by": self.partition_by,
+            "partition_column": self.partition_column,
+            "row_count": self.row_count,
+            "data_size_bytes": self.data_size_bytes,
+            "files": [f.to_dict() for f in self.files],
+        }
+        if self.key_columns:
+            out["key_columns"] = list(self.key_columns)
+        return out
+
+
+def parse_manifest(raw: bytes, dataset_id: str) -> Manifest:
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise ValidationError(f"invalid manifest.json for {dataset_id}") from e
+    if not isinstance(data, dict):
+        raise ValidationError(f"invalid manifest.json for {dataset_id}")
+    return Manifest.from_dict(data)
+
+
+def load_manifest(storage: StorageBackend, dataset_id: str) -> Optional[Manifest]:
+    """Return the dataset's manifest, or None if it is not partitioned."""
+
+    try:
+        raw = storage.get_bytes(manifest_key(dataset_id))
+    except NotFoundError:
+        return None
+    return parse_manifest(raw, dataset_id)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .versioning import utc_now_iso
+
+# Upper bound on the serialized preview rows, so wide tables keep
+# metadata.json (or preview.json) small.
+DEFAULT_PREVIEW_MAX_BYTES = 64 * 1024
+
+
+def _json_sanitize(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    isoformat = getattr(value, "isoformat", None)
+    if callable(isoformat):
+        return isoformat()
+    return str(value)
+
+
+def _iso_timestamps(arr: pa.Array) -> pa.Array:
+    typ = arr.type
+    # Whole seconds are formatted without a fraction, like `isoformat()`.
+    whole = arr.null_count == len(arr) or pc.max(pc.subsecond(arr)).as_py() == 0
+    arr = arr.cast(pa.timestamp("s" if whole else "us", tz=typ.tz), safe=False)
+    out = pc.strftime(arr, format="%Y-%m-%dT%H:%M:%S" + ("%z" if typ.tz else ""))
+    if typ.tz:
+        # `+0100` -> `+01:00`
+        out = pc.replace_substring_regex(out, pattern=r"([+-]\d\d)(\d\d)$", replacement=r"\1:\2")
+    return out
+
+
+def _json_column(arr: pa.Array) -> pa.Array:
+    """Convert a column to JSON-native values (strings, numbers, bools, nulls)."""
+
+    typ = arr.type
+    if pa.types.is_dictionary(typ):
+        return _json_column(arr.cast(typ.value_type))
+    if (
+        pa.types.is_null(typ)
+        or pa.types.is_boolean(typ)
+        or pa.types.is_integer(typ)
+        or pa.types.is_floating(typ)
+        or pa.types.is_string(typ)
+        or pa.types.is_large_string(typ)
+    ):
+        return arr
+    if pa.types.is_timestamp(typ):
+        return _iso_timestamps(arr)
+    if pa.types.is_date(typ) or pa.types.is_time(typ) or pa.types.is_decimal(typ):
+        return arr.cast(pa.string())
+    # Binary, nested and other rare types: formatted value by value.
+    return pa.array([_json_sanitize(v) for v in arr.to_pylist()], type=pa.string())
+
+
+def _cell_bytes(arr: pa.Array) -> pa.Array:
+    """Approximate serialized size of each value (escapes are not counted)."""
+
+    if pa.types.is_null(arr.type):
+        return pa.array([4] * len(arr), type=pa.int64())
+    if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+        sizes = pc.add(pc.binary_length(arr).cast(pa.int64()), 2)
+    else:
+        sizes = pc.binary_length(arr.cast(pa.string())).cast(pa.int64())
+    return pc.fill_null(sizes, 4)
+
+
+def _rows_json_bytes(rows: list[dict[str, Any]]) -> int:
+    return len(json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+
+
+def table_preview(
+    table: pa.Table, *, max_rows: int, max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES
+) -> dict[str, Any]:
+    """Build the `preview` object (`generated_at`, `columns`, `rows`) of a table.
+
+    Values are converted column by column with Arrow casts (timestamps and dates
+    to ISO-8601 strings, decimals to strings). At most `max_rows` leading rows
+    are kept, fewer if their JSON would exceed `max_bytes` (None: no limit).
+    """
+
+    view = table.slice(0, max(min(int(max_rows), int(table.num_rows)), 0)).combine_chunks()
+    names = list(view.column_names)
+    columns = [_json_column(view.column(i).combine_chunks()) for i in range(len(names))]
+
+    n = int(view.num_rows)
+    if max_bytes is not None and names and n:
+        # Each row is `{"name":value,...},`; cut at the last row within budget.
+        overhead = 2 + sum(len(json.dumps(name)) + 2 for name in names)
+        row_bytes = _cell_bytes(columns[0])
+        for col in columns[1:]:
+            row_bytes = pc.add(row_bytes, _cell_bytes(col))
+        total = pc.cumulative_sum(pc.add(row_bytes, overhead))
+        n = int(pc.sum(pc.less_equal(total, int(max_bytes))).as_py() or 0)
+
+    values = [col.slice(0, n).to_pylist() for col in columns]
+    rows = [dict(zip(names, row)) for row in zip(*values)] if names else []
+    # The estimate ignores string escapes; drop rows until the exact size fits.
+    while max_bytes is not None and rows and _rows_json_bytes(rows) > int(max_bytes):
+        rows.pop()
+
+    return {
+        "generated_at": utc_now_iso(),
+        "columns": names,
+        "rows": rows,
+    }
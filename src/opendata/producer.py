@@ -36,6 +36,7 @@ def publish_dataframe_from_dir(
     catalog: CatalogInput,
     preview_rows: Optional[int] = None,
     storage: Optional[StorageBackend] = None,
+    refresh_checked_at: bool = False,
 ) -> PublishedDataset:
     """Publish a DataFrame and upload README (catalog embedded in code)."""
 
@@ -51,6 +52,7 @@ def publish_dataframe_from_dir(
         df=df,
         preview_rows=pr,
         catalog=catalog_obj,
+        refresh_checked_at=refresh_checked_at,
     )
 
     readme = producer_readme_path(producer_dir)
@@ -67,6 +69,7 @@ def publish_table_from_dir(
     catalog: CatalogInput,
     preview_rows: Optional[int] = None,
     storage: Optional[StorageBackend] = None,
+    refresh_checked_at: bool = False,
 ) -> PublishedDataset:
     pr = resolve_preview_rows(preview_rows)
     storage = storage or storage_from_env()
@@ -80,6 +83,7 @@ def publish_table_from_dir(
         table=table,
         preview_rows=pr,
         catalog=catalog_obj,
+        refresh_checked_at=refresh_checked_at,
     )
 
     readme = producer_readme_path(producer_dir)
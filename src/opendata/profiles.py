@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .errors import ValidationError
+
+COMPRESSION_CODECS = ("none", "snappy", "gzip", "brotli", "lz4", "zstd")
+
+# Older pyarrow releases (still allowed by the dependency range) cannot write
+# bloom filters and reject the keyword.
+BLOOM_FILTERS_SUPPORTED = "bloom_filter_options" in inspect.signature(pq.write_table).parameters
+
+# All columns (True), none (False), or the named columns.
+ColumnSelection = Union[bool, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class WriteProfile:
+    """Parquet writer settings applied when a dataset is published.
+
+    - `compression` / `compression_level`: codec (e.g. `zstd`) and its level
+    - `row_group_size`: target rows per row group (None: pyarrow default)
+    - `use_dictionary`: dictionary-encode all columns, none, or the listed ones
+    - `dictionary_pagesize_limit`: bytes of dictionary per column chunk before
+      falling back to plain encoding (None: pyarrow default, 1 MiB)
+    - `byte_stream_split`: BYTE_STREAM_SPLIT for all floating-point columns
+      (True) or the listed columns; these columns are not dictionary-encoded
+    - `write_page_index`: write column/offset indexes for page-level pruning
+    - `bloom_filter_columns`: columns that get a bloom filter
+    """
+
+    compression: str = "snappy"
+    compression_level: Optional[int] = None
+    row_group_size: Optional[int] = None
+    use_dictionary: ColumnSelection = True
+    dictionary_pagesize_limit: Optional[int] = None
+    byte_stream_split: ColumnSelection = False
+    write_page_index: bool = False
+    bloom_filter_columns: tuple[str, ...] = field(default_factory=tuple)
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> WriteProfile:
+        base_name = data.get("base")
+        base = resolve_write_profile(base_name) if base_name is not None else WriteProfile()
+        known = set(WriteProfile.__dataclass_fields__) | {"base"}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValidationError(f"unknown write profile field(s): {', '.join(unknown)}")
+
+        def _opt_int(key: str, current: Optional[int]) -> Optional[int]:
+            if key not in data or data[key] is None:
+                return current
+            v = data[key]
+            if isinstance(v, bool) or not isinstance(v, int) or v <= 0:
+                raise ValidationError(f"write profile {key} must be a positive integer")
+            return v
+
+        def _bool_or_cols(key: str, current: ColumnSelection) -> ColumnSelection:
+            if key not in data:
+                return current
+            v = data[key]
+            if isinstance(v, bool):
+                return v
+            if isinstance(v, list) and all(isinstance(c, str) and c for c in v):
+                return tuple(v)
+            raise ValidationError(f"write profile {key} must be a bool or a list of columns")
+
+        compression = str(data.get("compression", base.compression)).lower()
+        if compression not in COMPRESSION_CODECS:
+            raise ValidationError(
+                f"write profile compression must be one of: {', '.join(COMPRESSION_CODECS)}"
+            )
+        level = data.get("compression_level", base.compression_level)
+        if level is not None and (isinstance(level, bool) or not isinstance(level, int)):
+            raise ValidationError("write profile compression_level must be an integer")
+
+        bloom = data.get("bloom_filter_columns", list(base.bloom_filter_columns))
+        if not isinstance(bloom, list) or not all(isinstance(c, str) and c for c in bloom):
+            raise ValidationError("write profile bloom_filter_columns must be a list of columns")
+
+        return WriteProfile(
+            compression=compression,
+            compression_level=level,
+            row_group_size=_opt_int("row_group_size", base.row_group_size),
+            use_dictionary=_bool_or_cols("use_dictionary", base.use_dictionary),
+            dictionary_pagesize_limit=_opt_int(
+                "dictionary_pagesize_limit", base.dictionary_pagesize_limit
+            ),
+            byte_stream_split=_bool_or_cols("byte_stream_split", base.byte_stream_split),
+            write_page_index=bool(data.get("write_page_index", base.write_page_index)),
+            bloom_filter_columns=tuple(bloom),
+        )
+
+    def writer_kwargs(self, schema: pa.Schema, *, num_rows: Optional[int] = None) -> dict[str, Any]:
+        """Return keyword arguments for `pq.write_table` / `pq.ParquetWriter`.
+
+        `row_group_size` is not included since it is an argument of the write
+        call rather than of the writer. `num_rows`, if known, sizes the bloom
+        filters.
+        """
+
+        names = set(schema.names)
+
+        def _check(cols: tuple[str, ...], what: str) -> list[str]:
+            missing = [c for c in cols if c not in names]
+            if missing:
+                raise ValidationError(f"unknown {what} column(s): {', '.join(missing)}")
+            return list(cols)
+
+        kwargs: dict[str, Any] = {"compression": self.compression}
+        if self.compression_level is not None:
+            kwargs["compression_level"] = self.compression_level
+
+        if self.byte_stream_split is True:
+            split = [f.name for f in schema if pa.types.is_floating(f.type)]
+        elif self.byte_stream_split is False:
+            split = []
+        else:
+            split = _check(self.byte_stream_split, "byte_stream_split")
+
+        if self.use_dictionary is True:
+            dictionary: Any = True
+        elif self.use_dictionary is False:
+            dictionary = False
+        else:
+            dictionary = _check(self.use_dictionary, "use_dictionary")
+        if split:
+            # Dictionary encoding takes precedence over BYTE_STREAM_SPLIT.
+            kwargs["use_byte_stream_split"] = split
+            if dictionary is True:
+                dictionary = [n for n in schema.names if n not in split]
+            elif dictionary:
+                dictionary = [n for n in dictionary if n not in split]
+        kwargs["use_dictionary"] = dictionary
+
+        if self.dictionary_pagesize_limit is not None:
+            kwargs["dictionary_pagesize_limit"] = self.dictionary_pagesize_limit
+        if self.write_page_index:
+            kwargs["write_page_index"] = True
+        if self.bloom_filter_columns:
+            bloom = _check(self.bloom_filter_columns, "bloom filter")
+            if not BLOOM_FILTERS_SUPPORTED:
+                raise ValidationError(
+                    f"bloom_filter_columns is not supported by pyarrow {pa.__version__}; "
+                    "upgrade pyarrow to write bloom filters"
+                )
+            ndv = {"ndv": max(int(num_rows), 1)} if num_rows is not None else {}
+            kwargs["bloom_filter_options"] = {c: dict(ndv) for c in bloom}
+        return kwargs
+
+
+WRITE_PROFILES: dict[str, WriteProfile] = {
+    # pyarrow's defaults, so existing datasets keep byte-identical output.
+    "default": WriteProfile(),
+    # Tuned for consumers: zstd for smaller transfers, row groups small enough
+    # for selective ranged reads and min/max pruning, floats split for better
+    # compression, and page indexes for page-level pruning.
+    "analytics": WriteProfile(
+        compression="zstd",
+        compression_level=3,
+        row_group_size=128 * 1024,
+        byte_stream_split=True,
+        write_page_index=True,
+    ),
+}
+
+WriteProfileInput = Union[str, dict[str, Any], WriteProfile]
+
+
+def resolve_write_profile(profile: Optional[WriteProfileInput]) -> WriteProfile:
+    """Resolve a profile name, dict (optionally with `base`) or instance."""
+
+    if profile is None:
+        return WRITE_PROFILES["default"]
+    if isinstance(profile, WriteProfile):
+        return profile
+    if isinstance(profile, str):
+        try:
+            return WRITE_PROFILES[profile]
+        except KeyError as e:
+            raise ValidationError(
+                f"unknown write profile {profile!r}; expected one of: {', '.join(WRITE_PROFILES)}"
+            ) from e
+    if isinstance(profile, dict):
+        return WriteProfile.from_dict(profile)
+    raise ValidationError("write profile must be a name, a mapping or a WriteProfile")
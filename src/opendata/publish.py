@@ -1,24 +1,43 @@
 from __future__ import annotations
 
+import functools
+import io
 import json
+import tempfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, cast
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
-from .errors import ValidationError
-from .hashing import sha256_bytes, sha256_file
+from .errors import NotFoundError, OpendataError, ValidationError
+from .filters import find_time_column
+from .hashing import HashingWriter, sha256_bytes, sha256_file
 from .ids import (
-    data_key,
+    dataset_prefix,
+    latest_key,
+    manifest_key,
     metadata_key,
+    partition_file_key,
+    preview_key,
     readme_key,
     validate_dataset_id,
+    version_data_key,
+    version_metadata_key,
+    version_preview_key,
 )
 from .metadata import CatalogInput, coerce_catalog
+from .partitions import Manifest, PartitionFile, load_manifest
+from .preview import DEFAULT_PREVIEW_MAX_BYTES, _json_sanitize, table_preview
+from .profiles import WriteProfile, WriteProfileInput, resolve_write_profile
+from .stats import footer_column_sizes, merge_stats, table_stats
 from .storage.base import StorageBackend
 from .versioning import utc_now_iso
+from .versions import LatestPointer, load_latest
 
 
 def _canonical_json_bytes(data: dict[str, Any]) -> bytes:
@@ -32,32 +51,94 @@ def _catalog_payload(catalog: CatalogInput, *, dataset_id: str) -> dict[str, Any
     return cat.to_catalog_dict()
 
 
-def _parquet_schema_columns(path: Path) -> list[dict[str, str]]:
-    pf = pq.ParquetFile(path)
+def _resolve_profile(
+    catalog: CatalogInput, write_profile: Optional[WriteProfileInput]
+) -> WriteProfile:
+    # An explicit argument wins over the profile declared in the catalog.
+    if write_profile is None:
+        write_profile = coerce_catalog(catalog).write_profile
+    return resolve_write_profile(write_profile)
+
+
+def _sort_keys(catalog: CatalogInput, schema: pa.Schema) -> list[str]:
+    keys = coerce_catalog(catalog).sort_keys
+    missing = [k for k in keys if k not in schema.names]
+    if missing:
+        raise ValidationError(f"unknown sort column(s): {', '.join(missing)}")
+    nested = [k for k in keys if pa.types.is_nested(schema.field(k).type)]
+    if nested:
+        raise ValidationError(f"cannot sort by nested column(s): {', '.join(nested)}")
+    return keys
+
+
+def _sort_options(keys: list[str]) -> list[tuple[str, str]]:
+    return [(k, "ascending") for k in keys]
+
+
+# Recording the order in the footer needs `sorting_columns` (pyarrow 15+).
+SORTING_COLUMNS_SUPPORTED = hasattr(pq, "SortingColumn")
+
+
+def _sorting_kwargs(schema: pa.Schema, keys: list[str]) -> dict[str, Any]:
+    if not keys:
+        return {}
+    if not SORTING_COLUMNS_SUPPORTED:
+        raise ValidationError(
+            f"cluster_by / sort_by need pyarrow >= 15 (installed: {pa.__version__})"
+        )
+    # Nulls sort last, as `pc.sort_indices` places them by default.
+    return {"sorting_columns": pq.SortingColumn.from_ordering(schema, _sort_options(keys))}
+
+
+def _check_sorted(
+    table: pa.Table, keys: list[str], previous: Optional[pa.Table]
+) -> Optional[pa.Table]:
+    """Raise unless `table` (after `previous`, the last row seen) is sorted by `keys`.
+
+    Returns the last row of `keys` columns, to be passed as `previous` for the
+    next chunk of the same stream.
+    """
+
+    view = table.select(keys)
+    if view.num_rows == 0:
+        return previous
+    if previous is not None:
+        view = pa.concat_tables([previous, view])
+    # sort_indices is stable, so sorted input yields the identity permutation.
+    indices = pc.sort_indices(view, sort_keys=_sort_options(keys))
+    if not pc.all(pc.equal(indices, pa.array(range(view.num_rows), type=indices.type))).as_py():
+        raise ValidationError(f"data is not sorted by declared keys: {', '.join(keys)}")
+    return view.slice(view.num_rows - 1)
+
+
+def _parquet_schema_columns(pf: pq.ParquetFile) -> list[dict[str, str]]:
     schema = pf.schema_arrow
     return [{"name": field.name, "type": str(field.type)} for field in schema]
 
 
-def _parquet_row_count(path: Path) -> int:
-    pf = pq.ParquetFile(path)
+def _parquet_row_count(pf: pq.ParquetFile) -> int:
     md = pf.metadata
     return int(md.num_rows) if md is not None else 0
 
 
-def _json_sanitize(value: Any) -> Any:
-    if value is None:
-        return None
-    if isinstance(value, (str, int, float, bool)):
-        return value
-    isoformat = getattr(value, "isoformat", None)
-    if callable(isoformat):
-        return isoformat()
-    return str(value)
+def _stats_payload(
+    schema: pa.Schema, stats: dict[str, dict[str, Any]], *footers: pq.FileMetaData
+) -> dict[str, dict[str, Any]]:
+    """Build the `stats` block of metadata.json from value stats and the footer(s)."""
 
+    sizes = footer_column_sizes(*footers)
+    out: dict[str, dict[str, Any]] = {}
+    for name in schema.names:
+        entry = {k: _json_sanitize(v) for k, v in stats.get(name, {}).items()}
+        if name in sizes:
+            entry["compressed_bytes"], entry["uncompressed_bytes"] = sizes[name]
+        out[name] = entry
+    return out
 
-def _parquet_preview_json(path: Path, *, preview_rows: int) -> dict[str, Any]:
-    pf = pq.ParquetFile(path)
 
+def _parquet_preview_json(
+    pf: pq.ParquetFile, *, preview_rows: int, max_bytes: Optional[int]
+) -> dict[str, Any]:
     batches: list[pa.RecordBatch] = []
     remaining = max(int(preview_rows), 0)
     if remaining == 0:
@@ -69,17 +150,7 @@ def _parquet_preview_json(path: Path, *, preview_rows: int) -> dict[str, Any]:
             if remaining <= 0:
                 break
         table = pa.Table.from_batches(batches) if batches else pa.table({})
-        if preview_rows > 0:
-            table = table.slice(0, preview_rows)
-
-    rows_raw = table.to_pylist()
-    rows = [{k: _json_sanitize(v) for k, v in row.items()} for row in rows_raw]
-
-    return {
-        "generated_at": utc_now_iso(),
-        "columns": list(table.column_names),
-        "rows": rows,
-    }
+    return table_preview(table, max_rows=preview_rows, max_bytes=max_bytes)
 
 
 def upload_readme(storage: StorageBackend, *, dataset_id: str, readme_path: Path) -> str:
@@ -105,6 +176,12 @@ class PublishedDataset:
         columns: list[dict[str, str]],
         preview: Optional[dict[str, Any]] = None,
         catalog: Optional[dict[str, Any]] = None,
+        checked_at: Optional[str] = None,
+        unchanged: bool = False,
+        stats: Optional[dict[str, dict[str, Any]]] = None,
+        separate_preview: bool = False,
+        row_group_checksums: Optional[list[dict[str, Any]]] = None,
+        versioned: bool = False,
     ) -> None:
         self.dataset_id = dataset_id
         self.updated_at = updated_at
@@ -116,6 +193,26 @@ class PublishedDataset:
         self.columns = columns
         self.preview = preview
         self.catalog = catalog
+        self.checked_at = checked_at
+        # True when the data matched the already-published checksum and was
+        # not uploaded again.
+        self.unchanged = unchanged
+        # Per-column statistics, keyed by column name.
+        self.stats = stats
+        # Store the preview as `preview.json` and only reference it from the
+        # metadata (`preview_path`).
+        self.separate_preview = separate_preview
+        # Byte range and sha256 of each parquet row group, for ranged reads.
+        self.row_group_checksums = row_group_checksums
+        # Single-file layout: data, metadata and preview live under
+        # `v/<sha256>/` and `latest.json` points at them.
+        self.versioned = versioned
+
+    @property
+    def preview_key(self) -> str:
+        if self.versioned:
+            return version_preview_key(self.dataset_id, self.checksum_sha256)
+        return preview_key(self.dataset_id)
 
     def metadata(self) -> dict[str, Any]:
         meta: dict[str, Any] = {
@@ -126,13 +223,149 @@ class PublishedDataset:
             "checksum_sha256": self.checksum_sha256,
             "columns": self.columns,
         }
+        if self.stats is not None:
+            meta["stats"] = self.stats
+        if self.row_group_checksums is not None:
+            meta["row_group_checksums"] = self.row_group_checksums
         if self.catalog:
             meta.update(self.catalog)
-        if self.preview is not None:
+        if self.preview is not None and self.separate_preview:
+            meta["preview_path"] = self.preview_key[len(dataset_prefix(self.dataset_id)) + 1 :]
+        elif self.preview is not None:
             meta["preview"] = self.preview
+        if self.checked_at:
+            meta["checked_at"] = self.checked_at
         return meta
 
 
+def _existing_metadata(storage: StorageBackend, key: str) -> Optional[dict[str, Any]]:
+    try:
+        raw = storage.get_bytes(key)
+    except NotFoundError:
+        return None
+    try:
+        meta = json.loads(raw)
+    except ValueError:
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def _existing_preview(
+    storage: StorageBackend, dataset_id: str, existing: dict[str, Any]
+) -> Optional[dict[str, Any]]:
+    """Return the published preview, inline or from the `preview_path` object."""
+
+    preview = existing.get("preview")
+    if isinstance(preview, dict):
+        return preview
+    path = existing.get("preview_path")
+    if not isinstance(path, str) or not path:
+        return None
+    return _existing_metadata(storage, f"{dataset_prefix(dataset_id)}/{path}")
+
+
+def _preview_content(preview: dict[str, Any]) -> bytes:
+    return _canonical_json_bytes({k: v for k, v in preview.items() if k != "generated_at"})
+
+
+def _commit_publish(
+    storage: StorageBackend,
+    published: PublishedDataset,
+    *,
+    upload: Callable[[], None],
+    existing: Optional[dict[str, Any]],
+    refresh_checked_at: bool,
+) -> PublishedDataset:
+    """Upload the data (unless unchanged) and then write `metadata.json`.
+
+    `existing` is the current `metadata.json` (None when not checked, i.e.
+    `skip_unchanged=False`). A checksum equal to the existing one skips the data
+    upload and keeps its `updated_at` (and preview timestamp), so readers and
+    caches see no new version. Metadata is only rewritten if other fields (e.g.
+    catalog) changed, or to set `checked_at` when `refresh_checked_at` is true.
+
+    For a `versioned` dataset, `upload` writes `published.data_key` (a
+    `v/<sha256>/` key), then the version's `v/<sha256>/metadata.json`, then
+    `latest.json` pointing at both; the data only counts as unchanged if the
+    pointer already names it. `metadata.json` itself is written last. A
+    `separate_preview` is written before the metadata that references it.
+    """
+
+    if refresh_checked_at:
+        published.checked_at = utc_now_iso()
+
+    versioned = published.versioned
+    previous = load_latest(storage, published.dataset_id) if versioned else None
+    current = existing is not None and existing.get("checksum_sha256") == published.checksum_sha256
+    if versioned and (previous is None or previous.version != published.checksum_sha256):
+        current = False
+
+    old_preview: Optional[dict[str, Any]] = None
+    if existing is None or not current:
+        upload()
+    else:
+        published.unchanged = True
+        if isinstance(existing.get("updated_at"), str):
+            published.updated_at = existing["updated_at"]
+        old_preview = _existing_preview(storage, published.dataset_id, existing)
+        if (
+            published.preview is not None
+            and old_preview is not None
+            and _preview_content(old_preview) == _preview_content(published.preview)
+        ):
+            published.preview = old_preview
+        if not refresh_checked_at:
+            published.checked_at = existing.get("checked_at")
+
+    meta = published.metadata()
+    if published.separate_preview and published.preview is not None:
+        # Skipped only if the existing preview object already has this content.
+        stored = existing is not None and existing.get("preview_path") == meta["preview_path"]
+        if not (stored and published.preview is old_preview):
+            storage.put_bytes(
+                published.preview_key,
+                _canonical_json_bytes(published.preview),
+                content_type="application/json",
+            )
+
+    # Pointers written before per-version metadata are upgraded in place.
+    repoint = versioned and (
+        not published.unchanged or previous is None or previous.metadata_path is None
+    )
+    if published.unchanged and existing is not None and not repoint:
+        # Compare serialized forms so NaN preview values compare equal.
+        if _canonical_json_bytes(meta) == _canonical_json_bytes(existing):
+            return published
+
+    body = _canonical_json_bytes(meta)
+    if versioned:
+        storage.put_bytes(
+            version_metadata_key(published.dataset_id, published.checksum_sha256),
+            body,
+            content_type="application/json",
+        )
+    if repoint:
+        # Readers follow the pointer, so they never see a version whose data
+        # or metadata is not uploaded yet, nor metadata ahead of its data.
+        pointer = LatestPointer.create(
+            published.dataset_id,
+            published.checksum_sha256,
+            updated_at=published.updated_at,
+            row_count=published.row_count,
+            data_size_bytes=published.data_size_bytes,
+            previous=previous,
+        )
+        storage.put_bytes(
+            latest_key(published.dataset_id),
+            _canonical_json_bytes(pointer.to_dict()),
+            content_type="application/json",
+        )
+    # For versioned datasets this stable copy is for readers that do not
+    # follow `latest.json`; it is updated after the switch.
+    storage.put_bytes(published.metadata_key, body, content_type="application/json")
+    return published
+
+
 def publish_parquet_file(
     storage: StorageBackend,
     *,
@@ -140,32 +373,61 @@ def publish_parquet_file(
     parquet_path: Path,
     updated_at: Optional[str] = None,
     preview_rows: int = 100,
+    preview_max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES,
+    separate_preview: bool = False,
     catalog: CatalogInput,
+    skip_unchanged: bool = True,
+    refresh_checked_at: bool = False,
+    compute_stats: bool = True,
 ) -> PublishedDataset:
     """Publish a parquet file + metadata (optional preview in metadata).
 
-    This is the low-level primitive used by `opendata.push()` and the CLI.
+    This is the low-level primitive used by `opendata.push()` and the CLI. See
+    `_commit_publish` for `skip_unchanged` / `refresh_checked_at`.
+
+    The footer is parsed once (row count, schema, preview). The file is hashed
+    before it is uploaded, since its checksum names the version it is stored
+    under (`v/<sha256>/data.parquet`); it is streamed, never fully buffered.
+
+    With `compute_stats` (default), per-column statistics are stored under
+    `stats` in metadata.json. They are computed one row group at a time and
+    merged (so without `distinct_count`, as in `publish_batches`); that pass
+    also checks a declared sort order. Memory stays at about one row group.
     """
 
     validate_dataset_id(dataset_id)
 
-    dk = data_key(dataset_id)
     mk = metadata_key(dataset_id)
 
-    row_count = _parquet_row_count(parquet_path)
-    columns = _parquet_schema_columns(parquet_path)
+    with pq.ParquetFile(parquet_path) as pf:
+        row_count = _parquet_row_count(pf)
+        columns = _parquet_schema_columns(pf)
+        keys = _sort_keys(catalog, pf.schema_arrow)
+        preview_obj = None
+        if preview_rows > 0:
+            preview_obj = _parquet_preview_json(
+                pf, preview_rows=preview_rows, max_bytes=preview_max_bytes
+            )
+        merged: dict[str, dict[str, Any]] = {}
+        if keys or compute_stats:
+            # The file is uploaded as is, so a declared order can only be checked.
+            last: Optional[pa.Table] = None
+            for rg in range(pf.num_row_groups):
+                group = pf.read_row_group(rg, columns=None if compute_stats else keys)
+                if keys:
+                    last = _check_sorted(group.select(keys), keys, last)
+                if compute_stats:
+                    loaders = {n: functools.partial(group.column, n) for n in group.column_names}
+                    for name, rg_stats in table_stats(loaders, distinct=False).items():
+                        merged[name] = merge_stats(merged.get(name), rg_stats)
+        stats = _stats_payload(pf.schema_arrow, merged, pf.metadata) if compute_stats else None
 
-    checksum_sha256 = sha256_file(parquet_path)
     data_size_bytes = int(parquet_path.stat().st_size)
-
-    preview_obj = None
-    if preview_rows > 0:
-        preview_obj = _parquet_preview_json(parquet_path, preview_rows=preview_rows)
+    checksum_sha256 = sha256_file(parquet_path)
+    dk = version_data_key(dataset_id, checksum_sha256)
 
     catalog_payload = _catalog_payload(catalog, dataset_id=dataset_id)
 
-    storage.put_bytes(dk, parquet_path.read_bytes(), content_type="application/octet-stream")
-
     published = PublishedDataset(
         dataset_id=dataset_id,
         updated_at=updated_at or utc_now_iso(),
@@ -177,41 +439,109 @@ def publish_parquet_file(
         columns=columns,
         preview=preview_obj,
         catalog=catalog_payload,
+        stats=stats,
+        separate_preview=separate_preview,
+        versioned=True,
     )
 
-    storage.put_bytes(
-        mk, _canonical_json_bytes(published.metadata()), content_type="application/json"
+    return _commit_publish(
+        storage,
+        published,
+        upload=lambda: storage.put_file(dk, parquet_path, content_type="application/octet-stream"),
+        existing=_existing_metadata(storage, mk) if skip_unchanged else None,
+        refresh_checked_at=refresh_checked_at,
     )
 
-    return published
-
 
 def _table_schema_columns(table: pa.Table) -> list[dict[str, str]]:
     return [{"name": field.name, "type": str(field.type)} for field in table.schema]
 
 
-def _table_preview_json(table: pa.Table, *, preview_rows: int) -> dict[str, Any]:
-    if preview_rows <= 0:
-        view = table.slice(0, 0)
-    else:
-        view = table.slice(0, min(int(preview_rows), int(table.num_rows)))
-
-    rows_raw = view.to_pylist()
-    rows = [{k: _json_sanitize(v) for k, v in row.items()} for row in rows_raw]
-
-    return {
-        "generated_at": utc_now_iso(),
-        "columns": list(view.column_names),
-        "rows": rows,
-    }
+def _table_preview_json(
+    table: pa.Table, *, preview_rows: int, max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES
+) -> dict[str, Any]:
+    return table_preview(table, max_rows=preview_rows, max_bytes=max_bytes)
 
 
-def _table_to_parquet_bytes(table: pa.Table) -> bytes:
+def _table_to_parquet_bytes(table: pa.Table, profile: WriteProfile, keys: list[str]) -> bytes:
     sink = pa.BufferOutputStream()
-    pq.write_table(table, sink)
+    pq.write_table(
+        table,
+        sink,
+        row_group_size=profile.row_group_size,
+        **profile.writer_kwargs(table.schema, num_rows=table.num_rows),
+        **_sorting_kwargs(table.schema, keys),
+    )
     return cast(bytes, sink.getvalue().to_pybytes())
 
 
+# pyarrow's default cap on rows per row group (`max_row_group_length`).
+_DEFAULT_ROW_GROUP_ROWS = 1024 * 1024
+
+
+def _write_parquet(
+    sink: HashingWriter, table: pa.Table, profile: WriteProfile, keys: list[str]
+) -> None:
+    """Write `table` as parquet to `sink`, marking the span of each row group.
+
+    Row groups are written by one `write_table` call each, with an explicit
+    `row_group_size` so pyarrow does not split them at its own 1Mi-row cap,
+    and pyarrow flushes a row group before the call returns.
+    """
+
+    rows = int(profile.row_group_size or _DEFAULT_ROW_GROUP_ROWS)
+    with pq.ParquetWriter(
+        sink,
+        table.schema,
+        **profile.writer_kwargs(table.schema, num_rows=table.num_rows),
+        **_sorting_kwargs(table.schema, keys),
+    ) as writer:
+        sink.mark()
+        for start in range(0, int(table.num_rows), rows) or [0]:
+            writer.write_table(table.slice(start, rows), row_group_size=rows)
+            sink.mark()
+
+
+def _row_group_checksums(
+    md: pq.FileMetaData, segments: list[tuple[int, int, str]]
+) -> list[dict[str, Any]]:
+    """Pair each row group in the footer with the hashed span it was written as.
+
+    Spans follow the leading magic, one per row group and in order. A span
+    runs up to the next row group (older pyarrow also writes column chunk
+    metadata there), so sizes come from the spans rather than the footer.
+    Raises if the spans do not line up with the row groups.
+    """
+
+    starts: list[int] = []
+    for i in range(md.num_row_groups):
+        rg = md.row_group(i)
+        if rg.num_columns == 0:
+            raise OpendataError(f"row group {i} has no columns to locate it by")
+        first = rg.column(0)
+        starts.append(
+            int(
+                first.dictionary_page_offset
+                if first.has_dictionary_page
+                else first.data_page_offset
+            )
+        )
+    spans = [s for s in segments if starts and s[0] >= starts[0]]
+    if [offset for offset, _, _ in spans] != starts:
+        raise OpendataError(
+            f"cannot match {len(spans)} written span(s) to {len(starts)} parquet row group(s)"
+        )
+    return [
+        {
+            "offset": offset,
+            "size_bytes": size,
+            "row_count": int(md.row_group(i).num_rows),
+            "checksum_sha256": digest,
+        }
+        for i, (offset, size, digest) in enumerate(spans)
+    ]
+
+
 def publish_table(
     storage: StorageBackend,
     *,
@@ -219,16 +549,45 @@ def publish_table(
     table: pa.Table,
     updated_at: Optional[str] = None,
     preview_rows: int = 100,
+    preview_max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES,
+    separate_preview: bool = False,
     catalog: CatalogInput,
+    skip_unchanged: bool = True,
+    refresh_checked_at: bool = False,
+    write_profile: Optional[WriteProfileInput] = None,
+    compute_stats: bool = True,
+    row_group_checksums: bool = False,
 ) -> PublishedDataset:
     """Publish an Arrow table as parquet bytes.
 
-    This avoids requiring a local `data.parquet` file.
+    This avoids requiring a local `data.parquet` file. Parquet writer settings
+    come from `write_profile`, else the catalog's `write_profile`, else the
+    `default` profile (see `opendata.profiles`).
+
+    If the catalog declares `cluster_by` / `sort_by`, rows are sorted by those
+    keys before writing and the order is recorded in the parquet
+    `sorting_columns`, so row-group min/max statistics do not overlap.
+
+    With `compute_stats` (default), per-column min/max, null and distinct counts
+    and compressed/uncompressed sizes are stored under `stats` in metadata.json.
+
+    The preview holds the first `preview_rows` rows, fewer if their JSON would
+    exceed `preview_max_bytes`. It is embedded in metadata.json, or with
+    `separate_preview` stored as `preview.json` and referenced by `preview_path`,
+    which keeps metadata fetches small.
+
+    The parquet file is hashed while it is written and uploaded from the same
+    buffer. With `row_group_checksums`, the byte range and sha256 of each row
+    group are stored too, so clients can verify ranged reads.
     """
 
     validate_dataset_id(dataset_id)
 
-    dk = data_key(dataset_id)
+    keys = _sort_keys(catalog, table.schema)
+    if keys:
+        indices = pc.sort_indices(table, sort_keys=_sort_options(keys))
+        table = table.take(indices)
+
     mk = metadata_key(dataset_id)
 
     row_count = int(table.num_rows)
@@ -236,16 +595,30 @@ def publish_table(
 
     preview_obj = None
     if preview_rows > 0:
-        preview_obj = _table_preview_json(table, preview_rows=preview_rows)
+        preview_obj = _table_preview_json(
+            table, preview_rows=preview_rows, max_bytes=preview_max_bytes
+        )
 
     catalog_payload = _catalog_payload(catalog, dataset_id=dataset_id)
 
-    parquet_bytes = _table_to_parquet_bytes(table)
-    data_size_bytes = len(parquet_bytes)
-
-    checksum_sha256 = sha256_bytes(parquet_bytes)
-
-    storage.put_bytes(dk, parquet_bytes, content_type="application/octet-stream")
+    buf = io.BytesIO()
+    sink = HashingWriter(buf, segments=row_group_checksums)
+    _write_parquet(sink, table, _resolve_profile(catalog, write_profile), keys)
+    data_size_bytes = sink.size
+    checksum_sha256 = sink.hexdigest()
+    dk = version_data_key(dataset_id, checksum_sha256)
+
+    # Only the footer is read back, from the end of the buffer.
+    md = pq.read_metadata(buf)
+    stats = None
+    if compute_stats:
+        loaders = {n: functools.partial(table.column, n) for n in table.column_names}
+        stats = _stats_payload(table.schema, table_stats(loaders), md)
+    rg_checksums = _row_group_checksums(md, sink.segments) if row_group_checksums else None
+
+    def _upload() -> None:
+        buf.seek(0)
+        storage.put_stream(dk, buf, content_type="application/octet-stream")
 
     published = PublishedDataset(
         dataset_id=dataset_id,
@@ -258,13 +631,162 @@ def publish_table(
         columns=columns,
         preview=preview_obj,
         catalog=catalog_payload,
+        stats=stats,
+        separate_preview=separate_preview,
+        row_group_checksums=rg_checksums,
+        versioned=True,
     )
 
-    storage.put_bytes(
-        mk, _canonical_json_bytes(published.metadata()), content_type="application/json"
+    return _commit_publish(
+        storage,
+        published,
+        upload=_upload,
+        existing=_existing_metadata(storage, mk) if skip_unchanged else None,
+        refresh_checked_at=refresh_checked_at,
     )
 
-    return published
+
+DEFAULT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_BATCH_ROW_GROUP_ROWS = 128 * 1024
+
+
+def publish_batches(
+    storage: StorageBackend,
+    *,
+    dataset_id: str,
+    batches: Iterable[pa.RecordBatch],
+    schema: pa.Schema,
+    updated_at: Optional[str] = None,
+    preview_rows: int = 100,
+    preview_max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES,
+    separate_preview: bool = False,
+    row_group_size: Optional[int] = None,
+    spool_max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+    catalog: CatalogInput,
+    skip_unchanged: bool = True,
+    refresh_checked_at: bool = False,
+    write_profile: Optional[WriteProfileInput] = None,
+    compute_stats: bool = True,
+    row_group_checksums: bool = False,
+) -> PublishedDataset:
+    """Publish a stream of record batches without materializing the dataset.
+
+    Batches are written with `pq.ParquetWriter` into a spooled temp file (in
+    memory up to `spool_max_bytes`, then on disk), which is then uploaded with
+    `storage.put_stream`. Row count, preview and checksum are computed while
+    writing, so peak memory is about one row group (`row_group_size` rows) of
+    batches plus the writer's buffers.
+
+    `row_group_size` defaults to the write profile's, else 128Ki rows. A stream
+    cannot be re-sorted in bounded memory, so batches must already be in the
+    catalog's `cluster_by` / `sort_by` order; this is checked while writing.
+
+    `stats` are merged row group by row group, so they omit `distinct_count`.
+    `row_group_checksums` are hashed while writing, like the file checksum.
+    """
+
+    validate_dataset_id(dataset_id)
+    profile = _resolve_profile(catalog, write_profile)
+    if row_group_size is None:
+        row_group_size = profile.row_group_size or DEFAULT_BATCH_ROW_GROUP_ROWS
+    if int(row_group_size) <= 0:
+        raise ValidationError("row_group_size must be > 0")
+
+    mk = metadata_key(dataset_id)
+
+    catalog_payload = _catalog_payload(catalog, dataset_id=dataset_id)
+    keys = _sort_keys(catalog, schema)
+    last_key: Optional[pa.Table] = None
+    stats: dict[str, dict[str, Any]] = {}
+
+    row_count = 0
+    preview_batches: list[pa.RecordBatch] = []
+    preview_remaining = max(int(preview_rows), 0)
+
+    with tempfile.SpooledTemporaryFile(max_size=int(spool_max_bytes)) as spool:
+        sink = HashingWriter(spool, segments=row_group_checksums)
+        with pq.ParquetWriter(
+            sink, schema, **profile.writer_kwargs(schema), **_sorting_kwargs(schema, keys)
+        ) as writer:
+            sink.mark()
+
+            def _write(chunk: pa.Table) -> None:
+                nonlocal last_key
+                if keys:
+                    last_key = _check_sorted(chunk, keys, last_key)
+                if compute_stats:
+                    loaders = {n: functools.partial(chunk.column, n) for n in chunk.column_names}
+                    for name, chunk_stats in table_stats(loaders, distinct=False).items():
+                        stats[name] = merge_stats(stats.get(name), chunk_stats)
+                # One row group per call, so each `mark()` ends a row group.
+                for start in range(0, int(chunk.num_rows), int(row_group_size)):
+                    writer.write_table(
+                        chunk.slice(start, int(row_group_size)), row_group_size=int(row_group_size)
+                    )
+                    sink.mark()
+
+            # Each write becomes at least one row group, so small batches are
+            # grouped until a row group's worth of rows has arrived.
+            pending: list[pa.RecordBatch] = []
+            pending_rows = 0
+            for batch in batches:
+                if not batch.schema.equals(schema, check_metadata=False):
+                    raise ValidationError("batch schema does not match schema")
+                row_count += int(batch.num_rows)
+                if preview_remaining > 0:
+                    preview_batches.append(batch.slice(0, preview_remaining))
+                    preview_remaining -= int(preview_batches[-1].num_rows)
+
+                pending.append(batch)
+                pending_rows += int(batch.num_rows)
+                if pending_rows >= int(row_group_size):
+                    _write(pa.Table.from_batches(pending, schema=schema))
+                    pending, pending_rows = [], 0
+            if pending:
+                _write(pa.Table.from_batches(pending, schema=schema))
+
+        preview_obj = None
+        if preview_rows > 0:
+            preview_table = pa.Table.from_batches(preview_batches, schema=schema)
+            preview_obj = _table_preview_json(
+                preview_table, preview_rows=preview_rows, max_bytes=preview_max_bytes
+            )
+
+        spool.seek(0)
+        md = pq.read_metadata(spool)
+        stats_obj = _stats_payload(schema, stats, md) if compute_stats else None
+        rg_checksums = _row_group_checksums(md, sink.segments) if row_group_checksums else None
+
+        checksum_sha256 = sink.hexdigest()
+        dk = version_data_key(dataset_id, checksum_sha256)
+        published = PublishedDataset(
+            dataset_id=dataset_id,
+            updated_at=updated_at or utc_now_iso(),
+            data_key=dk,
+            metadata_key=mk,
+            row_count=row_count,
+            data_size_bytes=sink.size,
+            checksum_sha256=checksum_sha256,
+            columns=[{"name": field.name, "type": str(field.type)} for field in schema],
+            preview=preview_obj,
+            catalog=catalog_payload,
+            stats=stats_obj,
+            separate_preview=separate_preview,
+            row_group_checksums=rg_checksums,
+            versioned=True,
+        )
+
+        def _upload() -> None:
+            spool.seek(0)
+            storage.put_stream(dk, spool, content_type="application/octet-stream")
+
+        return _commit_publish(
+            storage,
+            published,
+            upload=_upload,
+            existing=_existing_metadata(storage, mk) if skip_unchanged else None,
+            refresh_checked_at=refresh_checked_at,
+        )
 
 
 def publish_dataframe(
@@ -274,7 +796,14 @@ def publish_dataframe(
     df: pd.DataFrame,
     updated_at: Optional[str] = None,
     preview_rows: int = 100,
+    preview_max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES,
+    separate_preview: bool = False,
     catalog: CatalogInput,
+    skip_unchanged: bool = True,
+    refresh_checked_at: bool = False,
+    write_profile: Optional[WriteProfileInput] = None,
+    compute_stats: bool = True,
+    row_group_checksums: bool = False,
 ) -> PublishedDataset:
     """Publish a pandas DataFrame without writing a parquet file."""
 
@@ -285,5 +814,175 @@ def publish_dataframe(
         table=table,
         updated_at=updated_at,
         preview_rows=preview_rows,
+        preview_max_bytes=preview_max_bytes,
+        separate_preview=separate_preview,
         catalog=catalog,
+        skip_unchanged=skip_unchanged,
+        refresh_checked_at=refresh_checked_at,
+        write_profile=write_profile,
+        compute_stats=compute_stats,
+        row_group_checksums=row_group_checksums,
+    )
+
+
+DEFAULT_PARTITION_UPLOAD_WORKERS = 8
+
+
+def publish_partitioned(
+    storage: StorageBackend,
+    *,
+    dataset_id: str,
+    table: pa.Table,
+    partition_column: Optional[str] = None,
+    updated_at: Optional[str] = None,
+    preview_rows: int = 100,
+    preview_max_bytes: Optional[int] = DEFAULT_PREVIEW_MAX_BYTES,
+    separate_preview: bool = False,
+    catalog: CatalogInput,
+    skip_unchanged: bool = True,
+    refresh_checked_at: bool = False,
+    write_profile: Optional[WriteProfileInput] = None,
+    compute_stats: bool = True,
+    upload_workers: int = DEFAULT_PARTITION_UPLOAD_WORKERS,
+) -> PublishedDataset:
+    """Publish an Arrow table as one parquet file per UTC day of `partition_column`.
+
+    Files are written to `part/date=YYYY-MM-DD/part-<checksum>.parquet` under the
+    dataset prefix and listed in `manifest.json` with row counts, sizes and the
+    partition column's min/max. `load()` reads the manifest transparently and
+    skips files outside `start`/`end`. `partition_column` defaults to the first
+    timestamp/date column.
+
+    File names are derived from their content, so with `skip_unchanged` only
+    partitions that changed since the current manifest are uploaded. The
+    manifest is written after the files and `metadata.json` last; a previous
+    `latest.json` pointer is then deleted, since readers prefer it. Superseded
+    files (old versions, a legacy `data.parquet`, replaced partitions) are left
+    to `gc_versions`.
+    `checksum_sha256` in metadata.json is the hash of the manifest's file list.
+    """
+
+    validate_dataset_id(dataset_id)
+    if int(upload_workers) <= 0:
+        raise ValidationError("upload_workers must be > 0")
+
+    column = partition_column or find_time_column(table.schema)
+    if column is None:
+        raise ValidationError("partition_column is required without a timestamp or date column")
+    if column not in table.schema.names:
+        raise ValidationError(f"unknown partition column: {column}")
+    typ = table.schema.field(column).type
+    if not (pa.types.is_timestamp(typ) or pa.types.is_date(typ)):
+        raise ValidationError(f"partition column must be a timestamp or date column: {column}")
+    if table.num_rows == 0:
+        raise ValidationError("cannot publish an empty partitioned dataset")
+    if table.column(column).null_count:
+        raise ValidationError(f"partition column must not contain nulls: {column}")
+
+    # Order rows by day, then by the catalog's sort keys within each day, so
+    # each partition is a contiguous slice.
+    keys = _sort_keys(catalog, table.schema)
+    days = pc.cast(table.column(column), pa.date32())
+    order_table = pa.table({"__day": days, **{k: table.column(k) for k in keys}})
+    order = pc.sort_indices(order_table, sort_keys=[("__day", "ascending"), *_sort_options(keys)])
+    table = table.take(order)
+    day_counts = pc.value_counts(days.take(order))
+
+    profile = _resolve_profile(catalog, write_profile)
+    catalog_payload = _catalog_payload(catalog, dataset_id=dataset_id)
+    prefix = dataset_prefix(dataset_id)
+
+    files: list[PartitionFile] = []
+    blobs: dict[str, bytes] = {}
+    footers: list[pq.FileMetaData] = []
+    offset = 0
+    for entry in day_counts:
+        day = entry["values"].as_py().isoformat()
+        n = int(entry["counts"].as_py())
+        part = table.slice(offset, n)
+        offset += n
+
+        data = _table_to_parquet_bytes(part, profile, keys)
+        checksum = sha256_bytes(data)
+        key = partition_file_key(dataset_id, day, f"part-{checksum[:16]}.parquet")
+        bounds = pc.min_max(part.column(column))
+        files.append(
+            PartitionFile(
+                path=key[len(prefix) + 1 :],
+                partition=day,
+                row_count=n,
+                size_bytes=len(data),
+                checksum_sha256=checksum,
+                min=_json_sanitize(bounds["min"].as_py()),
+                max=_json_sanitize(bounds["max"].as_py()),
+            )
+        )
+        blobs[key] = data
+        if compute_stats:
+            footers.append(pq.read_metadata(pa.BufferReader(data)))
+
+    stats = None
+    if compute_stats:
+        loaders = {n: functools.partial(table.column, n) for n in table.column_names}
+        stats = _stats_payload(table.schema, table_stats(loaders), *footers)
+
+    preview_obj = None
+    if preview_rows > 0:
+        preview_obj = _table_preview_json(
+            table, preview_rows=preview_rows, max_bytes=preview_max_bytes
+        )
+
+    mk = metadata_key(dataset_id)
+    published = PublishedDataset(
+        dataset_id=dataset_id,
+        updated_at=updated_at or utc_now_iso(),
+        data_key=manifest_key(dataset_id),
+        metadata_key=mk,
+        row_count=int(table.num_rows),
+        data_size_bytes=sum(f.size_bytes for f in files),
+        checksum_sha256=sha256_bytes(
+            _canonical_json_bytes(
+                {"partition_column": column, "files": [f.to_dict() for f in files]}
+            )
+        ),
+        columns=_table_schema_columns(table),
+        preview=preview_obj,
+        catalog=catalog_payload,
+        stats=stats,
+        separate_preview=separate_preview,
+    )
+
+    def _put(key: str) -> None:
+        storage.put_bytes(key, blobs[key], content_type="application/octet-stream")
+
+    def _upload() -> None:
+        current = load_manifest(storage, dataset_id) if skip_unchanged else None
+        present = {current.file_key(f) for f in current.files} if current else set()
+        todo = [key for key in blobs if key not in present]
+        if todo:
+            with ThreadPoolExecutor(max_workers=min(int(upload_workers), len(todo))) as pool:
+                list(pool.map(_put, todo))
+
+        manifest = Manifest(
+            dataset_id=dataset_id,
+            updated_at=published.updated_at,
+            partition_column=column,
+            files=files,
+        )
+        storage.put_bytes(
+            manifest_key(dataset_id),
+            _canonical_json_bytes(manifest.to_dict()),
+            content_type="application/json",
+        )
+        # Readers prefer the pointer over the manifest; a superseded
+        # `data.parquet` is shadowed by the manifest and left to `gc_versions`.
+        if storage.exists(latest_key(dataset_id)):
+            storage.delete(latest_key(dataset_id))
+
+    return _commit_publish(
+        storage,
+        published,
+        upload=_upload,
+        existing=_existing_metadata(storage, mk) if skip_unchanged else None,
+        refresh_checked_at=refresh_checked_at,
     )
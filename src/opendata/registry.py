@@ -4,9 +4,10 @@ import json
 from typing import Any
 
 from .errors import NotFoundError
-from .ids import metadata_key, validate_dataset_id
+from .ids import validate_dataset_id
 from .storage.base import StorageBackend
 from .versioning import utc_now_iso
+from .versions import current_metadata_key, load_latest
 
 
 def _canonical_json_bytes(data: dict[str, Any]) -> bytes:
@@ -53,14 +54,17 @@ class Registry:
         )
 
     def refresh_metadata(self, dataset_id: str) -> None:
-        """Refresh index entry for a dataset from its `<dataset>/metadata.json`."""
+        """Refresh index entry for a dataset from the metadata of its current version."""
 
         validate_dataset_id(dataset_id)
         index = self.load()
         datasets = list(index.get("datasets", []))
 
+        # The metadata of the version readers are served, not a newer one
+        # whose pointer has not switched yet.
+        key = current_metadata_key(dataset_id, load_latest(self._storage, dataset_id))
         try:
-            meta_raw = self._storage.get_bytes(metadata_key(dataset_id))
+            meta_raw = self._storage.get_bytes(key)
         except NotFoundError:
             return
 
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+ColumnData = Union[pa.Array, pa.ChunkedArray]
+
+DEFAULT_STATS_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _has_min_max(typ: pa.DataType) -> bool:
+    # Binary min/max values are not meaningful in JSON; nested types have no kernel.
+    return not (
+        pa.types.is_nested(typ)
+        or pa.types.is_binary(typ)
+        or pa.types.is_large_binary(typ)
+        or pa.types.is_fixed_size_binary(typ)
+        or pa.types.is_null(typ)
+    )
+
+
+def compute_column_stats(column: ColumnData, *, distinct: bool = True) -> dict[str, Any]:
+    """Return `null_count`, `min`/`max` and `distinct_count` of one column.
+
+    Values are Python objects (None when unavailable). `distinct_count` counts
+    distinct non-null values with a hash-based kernel and is skipped for nested
+    columns or when `distinct=False`.
+    """
+
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+
+    out: dict[str, Any] = {"null_count": int(column.null_count)}
+    if _has_min_max(column.type):
+        try:
+            mm = pc.min_max(column)
+        except pa.ArrowNotImplementedError:
+            pass
+        else:
+            out["min"] = mm["min"].as_py()
+            out["max"] = mm["max"].as_py()
+    if distinct and not pa.types.is_nested(column.type):
+        try:
+            out["distinct_count"] = int(pc.count_distinct(column).as_py())
+        except pa.ArrowNotImplementedError:
+            pass
+    return out
+
+
+def table_stats(
+    columns: Mapping[str, Callable[[], ColumnData]],
+    *,
+    distinct: bool = True,
+    max_workers: int = DEFAULT_STATS_WORKERS,
+) -> dict[str, dict[str, Any]]:
+    """Compute `compute_column_stats` for each column, columns in parallel threads.
+
+    `columns` maps names to loaders, so a column can be read from a file only
+    when its worker starts; Arrow kernels release the GIL.
+    """
+
+    def _one(load: Callable[[], ColumnData]) -> dict[str, Any]:
+        return compute_column_stats(load(), distinct=distinct)
+
+    names = list(columns)
+    if max_workers <= 1 or len(names) <= 1:
+        return {name: _one(columns[name]) for name in names}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as pool:
+        results = pool.map(_one, [columns[name] for name in names])
+        return dict(zip(names, results))
+
+
+def merge_stats(current: Optional[dict[str, Any]], new: dict[str, Any]) -> dict[str, Any]:
+    """Merge stats of two chunks of the same column (`distinct_count` is dropped)."""
+
+    if current is None:
+        return {k: v for k, v in new.items() if k != "distinct_count"}
+    out: dict[str, Any] = {"null_count": current["null_count"] + new["null_count"]}
+    for key, pick in (("min", min), ("max", max)):
+        values = [v for v in (current.get(key), new.get(key)) if v is not None]
+        if values:
+            out[key] = pick(values)
+        elif key in current or key in new:
+            out[key] = None
+    return out
+
+
+def footer_column_sizes(*footers: pq.FileMetaData) -> dict[str, tuple[int, int]]:
+    """Return (compressed, uncompressed) bytes per top-level column, summed over footers."""
+
+    sizes: dict[str, list[int]] = {}
+    for md in footers:
+        for rg in range(md.num_row_groups):
+            rg_meta = md.row_group(rg)
+            for i in range(rg_meta.num_columns):
+                col = rg_meta.column(i)
+                name = col.path_in_schema.split(".", 1)[0]
+                acc = sizes.setdefault(name, [0, 0])
+                acc[0] += int(col.total_compressed_size)
+                acc[1] += int(col.total_uncompressed_size)
+    return {name: (c, u) for name, (c, u) in sizes.items()}
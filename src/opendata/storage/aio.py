@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from ..errors import NotFoundError, StorageError
+from . import storage_from_env
+from .base import StorageBackend
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class AsyncStorageBackend(ABC):
+    """Async counterpart of `StorageBackend` (read side only).
+
+    Used by `opendata.aload()` / `opendata.aload_many()` so that network I/O
+    never blocks the event loop.
+    """
+
+    @abstractmethod
+    async def aexists(self, key: str) -> bool:  # pragma: no cover
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aget_bytes(self, key: str) -> bytes:  # pragma: no cover
+        raise NotImplementedError
+
+    async def asize(self, key: str) -> int:
+        return len(await self.aget_bytes(key))
+
+    async def aget_range(self, key: str, start: int, end: int) -> bytes:
+        return (await self.aget_bytes(key))[start:end]
+
+    async def aclose(self) -> None:
+        return None
+
+    async def __aenter__(self) -> AsyncStorageBackend:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+
+class ThreadedAsyncStorage(AsyncStorageBackend):
+    """Adapt a blocking `StorageBackend` by running each call in a worker thread.
+
+    This is the async path for backends without a native async client (R2 via
+    boto3, MemoryStorage). A semaphore bounds the number of in-flight calls.
+    """
+
+    def __init__(
+        self, storage: StorageBackend, *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
+        self._storage = storage
+        self._max_concurrency = max(int(max_concurrency), 1)
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def storage(self) -> StorageBackend:
+        return self._storage
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives are bound to one loop; recreate per loop.
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        return self._sem
+
+    async def aexists(self, key: str) -> bool:
+        async with self._semaphore():
+            return await asyncio.to_thread(self._storage.exists, key)
+
+    async def aget_bytes(self, key: str) -> bytes:
+        async with self._semaphore():
+            return await asyncio.to_thread(self._storage.get_bytes, key)
+
+    async def asize(self, key: str) -> int:
+        async with self._semaphore():
+            return await asyncio.to_thread(self._storage.size, key)
+
+    async def aget_range(self, key: str, start: int, end: int) -> bytes:
+        async with self._semaphore():
+            return await asyncio.to_thread(self._storage.get_range, key, start, end)
+
+
+class AsyncHttpStorage(AsyncStorageBackend):
+    """Non-blocking HTTP(S) storage backend built on aiohttp.
+
+    Requires optional dependency: `pip install -e .[async]`. The aiohttp session
+    is created lazily inside the running event loop; call `aclose()` (or use the
+    instance as an async context manager) to release connections.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        timeout_s: int = 60,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        try:
+            import aiohttp  # noqa: F401
+        except Exception as e:  # pragma: no cover
+            raise StorageError(
+                "aiohttp is required for AsyncHttpStorage; install extras 'async'"
+            ) from e
+
+        base_url = base_url.strip()
+        if not base_url:
+            raise StorageError("base_url is required")
+        if not base_url.endswith("/"):
+            base_url += "/"
+        self._base_url = base_url
+        self._timeout_s = int(timeout_s)
+        self._max_concurrency = max(int(max_concurrency), 1)
+        self._session: Optional[Any] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    def _url(self, key: str) -> str:
+        if key.startswith("/"):
+            key = key[1:]
+        return self._base_url + key
+
+    def _client(self) -> tuple[Any, asyncio.Semaphore]:
+        import aiohttp
+
+        # Sessions and semaphores are bound to one loop; recreate per loop.
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self._timeout_s),
+                connector=aiohttp.TCPConnector(limit=self._max_concurrency),
+            )
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        assert self._sem is not None
+        return self._session, self._sem
+
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._sem = None
+        self._loop = None
+
+    async def aexists(self, key: str) -> bool:
+        # Only a 404 means missing; errors must not pass for absence.
+        session, sem = self._client()
+        try:
+            async with sem, session.head(self._url(key)) as resp:
+                status = int(resp.status)
+        except Exception as e:
+            raise StorageError(f"failed to HEAD {key}") from e
+        if status == 404:
+            return False
+        if status >= 400:
+            raise StorageError(f"failed to HEAD {key}: HTTP {status}")
+        return True
+
+    async def aget_bytes(self, key: str) -> bytes:
+        session, sem = self._client()
+        try:
+            async with sem, session.get(self._url(key)) as resp:
+                if resp.status == 404:
+                    raise NotFoundError(f"not found: {key}")
+                resp.raise_for_status()
+                return bytes(await resp.read())
+        except NotFoundError:
+            raise
+        except Exception as e:
+            raise StorageError(f"failed to GET {key}") from e
+
+    async def asize(self, key: str) -> int:
+        session, sem = self._client()
+        try:
+            async with sem, session.head(self._url(key)) as resp:
+                if resp.status == 404:
+                    raise NotFoundError(f"not found: {key}")
+                resp.raise_for_status()
+                if resp.content_length is None:
+                    raise StorageError(f"missing Content-Length for {key}")
+                return int(resp.content_length)
+        except (NotFoundError, StorageError):
+            raise
+        except Exception as e:
+            raise StorageError(f"failed to HEAD {key}") from e
+
+    async def aget_range(self, key: str, start: int, end: int) -> bytes:
+        if end <= start:
+            return b""
+        session, sem = self._client()
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        try:
+            async with sem, session.get(self._url(key), headers=headers) as resp:
+                if resp.status == 404:
+                    raise NotFoundError(f"not found: {key}")
+                if resp.status == 416:
+                    return b""
+                resp.raise_for_status()
+                body = bytes(await resp.read())
+                if resp.status == 206:
+                    return body
+                # Server ignored the Range header and sent the full object.
+                return body[start:end]
+        except NotFoundError:
+            raise
+        except Exception as e:
+            raise StorageError(f"failed to GET {key} [{start}, {end})") from e
+
+
+def async_storage_from_env(
+    *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> AsyncStorageBackend:
+    """Create an async storage backend from the same env vars as `storage_from_env`.
+
+    HTTP storage gets a native aiohttp backend; everything else is wrapped in
+    `ThreadedAsyncStorage`.
+    """
+
+    from .http import HttpStorage
+
+    storage = storage_from_env()
+    if isinstance(storage, HttpStorage):
+        return AsyncHttpStorage(base_url=storage.base_url, max_concurrency=max_concurrency)
+    return ThreadedAsyncStorage(storage, max_concurrency=max_concurrency)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from pathlib import Path
+from typing import IO, Optional
+
+import pyarrow as pa
+
+from ..errors import StorageError
 
 
 class StorageBackend(ABC):
@@ -10,6 +15,13 @@ class StorageBackend(ABC):
     Storage is addressed by object keys like `datasets/<namespace>/<name>/...`.
     """
 
+    # Whether `get_range` is a native ranged read (rather than the whole-object
+    # fallback); enables parallel chunked downloads.
+    supports_range_reads = False
+    # Whether the backend already retries failed requests itself; chunked
+    # downloads then do not retry on top of it.
+    retries_requests = False
+
     @abstractmethod
     def exists(self, key: str) -> bool:  # pragma: no cover
         raise NotImplementedError
@@ -18,8 +30,71 @@ class StorageBackend(ABC):
     def get_bytes(self, key: str) -> bytes:  # pragma: no cover
         raise NotImplementedError
 
+    def size(self, key: str) -> int:
+        """Return the size of an object in bytes.
+
+        Backends should override this with a metadata-only lookup.
+        """
+
+        return len(self.get_bytes(key))
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return bytes `[start, end)` of an object.
+
+        Backends should override this with a ranged read; the default falls back
+        to fetching the whole object.
+        """
+
+        return self.get_bytes(key)[start:end]
+
+    def get_range_and_size(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        """Return bytes `[start, end)` of an object and the object's total size.
+
+        Backends should override this with one ranged read that also reports
+        the size (e.g. from `Content-Range`); the default makes two calls.
+        """
+
+        return self.get_range(key, start, end), self.size(key)
+
+    def open_input_file(self, key: str) -> pa.NativeFile:
+        """Open an object as a seekable, pyarrow-compatible random-access file.
+
+        Remote backends override this to read lazily via `get_range`, so memory
+        use is proportional to what is actually read. The default buffers the
+        whole object.
+        """
+
+        return pa.BufferReader(self.get_bytes(key))
+
     @abstractmethod
     def put_bytes(
         self, key: str, data: bytes, *, content_type: Optional[str] = None
     ) -> None:  # pragma: no cover
         raise NotImplementedError
+
+    def put_stream(
+        self, key: str, stream: IO[bytes], *, content_type: Optional[str] = None
+    ) -> None:
+        """Upload an object from a readable binary file object.
+
+        Backends should override this to upload without holding the whole object
+        in memory; the default reads the stream into bytes.
+        """
+
+        self.put_bytes(key, stream.read(), content_type=content_type)
+
+    def put_file(self, key: str, path: Path, *, content_type: Optional[str] = None) -> None:
+        """Upload a local file; the default streams it through `put_stream`."""
+
+        with Path(path).open("rb") as f:
+            self.put_stream(key, f, content_type=content_type)
+
+    def delete(self, key: str) -> None:
+        """Delete an object; deleting a missing object is not an error."""
+
+        raise StorageError(f"{type(self).__name__} does not support delete")
+
+    def list_keys(self, prefix: str) -> list[str]:
+        """Return the keys of all objects starting with `prefix`, sorted."""
+
+        raise StorageError(f"{type(self).__name__} does not support listing")
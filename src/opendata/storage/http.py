@@ -1,11 +1,49 @@
 from __future__ import annotations
 
-from typing import Optional
+import json
+import random
+import threading
+import time
+from typing import IO, Optional
 
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..errors import NotFoundError, StorageError
+from ..ids import key_dataset_prefix
 from .base import StorageBackend
+from .ranged import RangeReader, content_range_size
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_MAX_RETRIES = 3
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Text objects compress well; parquet is already compressed and is read with
+# byte ranges, which must address the raw object.
+COMPRESSIBLE_SUFFIXES = (".json", ".md")
+DEFAULT_REVALIDATE_MAX_BYTES = 1024 * 1024
+
+# Freshness TTL (seconds) per catalog `frequency`, used with `follow_frequency`.
+# Deliberately a small fraction of the update period.
+FREQUENCY_TTL_S: dict[str, float] = {
+    "hourly": 5 * 60,
+    "daily": 60 * 60,
+    "weekly": 6 * 60 * 60,
+    "monthly": 24 * 60 * 60,
+    "quarterly": 24 * 60 * 60,
+    "yearly": 7 * 24 * 60 * 60,
+    "annual": 7 * 24 * 60 * 60,
+}
+
+
+class _CachedObject:
+    def __init__(
+        self, *, body: bytes, etag: Optional[str], last_modified: Optional[str], fetched_at: float
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
 
 
 class HttpStorage(StorageBackend):
@@ -13,9 +51,39 @@ class HttpStorage(StorageBackend):
 
     This is designed for public buckets (e.g. Cloudflare R2 public read). It
     supports reading `index.json`, `metadata.json`, Parquet objects, etc.
+
+    Requests go through one pooled `requests.Session` per instance (up to
+    `pool_size` keep-alive connections per host), so repeated and concurrent
+    callers (e.g. `load_many()`) skip the TCP/TLS handshake. Connection errors,
+    timeouts and 429/5xx responses are retried up to `max_retries` times with
+    jittered exponential backoff. JSON/Markdown keys are requested with
+    `Accept-Encoding: gzip`; everything else with `identity`.
+
+    Small objects (up to `revalidate_max_bytes`, i.e. `index.json` and
+    `metadata.json`) are remembered together with their `ETag`/`Last-Modified`
+    and revalidated with a conditional GET; a `304` is served from memory. Within
+    `cache_ttl_s` of the last fetch they are served without any request. With
+    `follow_frequency`, the TTL for a dataset's keys follows the `frequency` field
+    of its `metadata.json` (see `FREQUENCY_TTL_S`).
     """
 
-    def __init__(self, *, base_url: str, timeout_s: int = 60) -> None:
+    supports_range_reads = True
+    retries_requests = True
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        timeout_s: int = 60,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base_s: float = 0.25,
+        backoff_max_s: float = 8.0,
+        revalidate: bool = True,
+        cache_ttl_s: float = 0.0,
+        follow_frequency: bool = False,
+        revalidate_max_bytes: int = DEFAULT_REVALIDATE_MAX_BYTES,
+    ) -> None:
         base_url = base_url.strip()
         if not base_url:
             raise StorageError("base_url is required")
@@ -23,6 +91,23 @@ class HttpStorage(StorageBackend):
             base_url += "/"
         self._base_url = base_url
         self._timeout_s = int(timeout_s)
+        self._max_retries = max(int(max_retries), 0)
+        self._backoff_base_s = max(float(backoff_base_s), 0.0)
+        self._backoff_max_s = max(float(backoff_max_s), 0.0)
+
+        pool_size = max(int(pool_size), 1)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._revalidate = bool(revalidate)
+        self._cache_ttl_s = max(float(cache_ttl_s), 0.0)
+        self._follow_frequency = bool(follow_frequency)
+        self._revalidate_max_bytes = int(revalidate_max_bytes)
+        self._cached: dict[str, _CachedObject] = {}
+        self._prefix_ttl_s: dict[str, float] = {}
+        self._lock = threading.Lock()
 
     @property
     def base_url(self) -> str:
@@ -34,25 +119,177 @@ class HttpStorage(StorageBackend):
             key = key[1:]
         return self._base_url + key
 
+    def _backoff_s(self, attempt: int) -> float:
+        # "Full jitter": spreads retries from many clients instead of synchronising them.
+        cap = min(self._backoff_max_s, self._backoff_base_s * (2**attempt))
+        return random.uniform(0.0, cap)
+
+    def _request(
+        self, method: str, key: str, *, headers: Optional[dict[str, str]] = None
+    ) -> requests.Response:
+        all_headers = {
+            "Accept-Encoding": "gzip" if key.endswith(COMPRESSIBLE_SUFFIXES) else "identity"
+        }
+        all_headers.update(headers or {})
+
+        attempt = 0
+        while True:
+            try:
+                resp = self._session.request(
+                    method, self._url(key), headers=all_headers, timeout=self._timeout_s
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self._max_retries:
+                    raise
+            else:
+                if resp.status_code not in RETRY_STATUS_CODES or attempt >= self._max_retries:
+                    return resp
+                resp.close()
+            time.sleep(self._backoff_s(attempt))
+            attempt += 1
+
     def exists(self, key: str) -> bool:
         try:
-            resp = requests.head(self._url(key), timeout=self._timeout_s)
-            return resp.status_code == 200
-        except Exception:
-            return False
+            resp = self._request("HEAD", key)
+        except Exception as e:
+            raise StorageError(f"failed to HEAD {key}") from e
+        if resp.status_code in RETRY_STATUS_CODES:
+            raise StorageError(f"failed to HEAD {key}: HTTP {resp.status_code}")
+        return resp.status_code == 200
+
+    def _ttl_for(self, key: str) -> float:
+        # Learned per dataset, so it covers `latest.json`, the manifest and the
+        # metadata of every version alike.
+        prefix = key_dataset_prefix(key)
+        if prefix is None:
+            return self._cache_ttl_s
+        return self._prefix_ttl_s.get(prefix, self._cache_ttl_s)
+
+    def _observe_metadata(self, key: str, body: bytes) -> None:
+        try:
+            meta = json.loads(body)
+        except ValueError:
+            return
+        frequency = meta.get("frequency") if isinstance(meta, dict) else None
+        ttl = FREQUENCY_TTL_S.get(str(frequency).strip().lower()) if frequency else None
+        prefix = key_dataset_prefix(key)
+        if ttl is not None and prefix is not None:
+            self._prefix_ttl_s[prefix] = ttl
 
     def get_bytes(self, key: str) -> bytes:
+        with self._lock:
+            cached = self._cached.get(key) if self._revalidate else None
+            if cached is not None and time.monotonic() - cached.fetched_at < self._ttl_for(key):
+                return cached.body
+
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         try:
-            resp = requests.get(self._url(key), timeout=self._timeout_s)
+            resp = self._request("GET", key, headers=headers)
+            if resp.status_code == 304 and cached is not None:
+                with self._lock:
+                    cached.fetched_at = time.monotonic()
+                return cached.body
             if resp.status_code == 404:
+                with self._lock:
+                    self._cached.pop(key, None)
                 raise NotFoundError(f"not found: {key}")
             resp.raise_for_status()
-            return resp.content
+            body = bytes(resp.content)
         except NotFoundError:
             raise
         except Exception as e:
             raise StorageError(f"failed to GET {key}") from e
 
+        if self._revalidate and len(body) <= self._revalidate_max_bytes:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified or self._cache_ttl_s > 0 or self._follow_frequency:
+                with self._lock:
+                    self._cached[key] = _CachedObject(
+                        body=body,
+                        etag=etag,
+                        last_modified=last_modified,
+                        fetched_at=time.monotonic(),
+                    )
+                    if self._follow_frequency and key.endswith("/metadata.json"):
+                        self._observe_metadata(key, body)
+        return body
+
+    def size(self, key: str) -> int:
+        try:
+            resp = self._request("HEAD", key)
+            if resp.status_code == 404:
+                raise NotFoundError(f"not found: {key}")
+            resp.raise_for_status()
+            length = resp.headers.get("Content-Length")
+            if length is None:
+                raise StorageError(f"missing Content-Length for {key}")
+            return int(length)
+        except (NotFoundError, StorageError):
+            raise
+        except Exception as e:
+            raise StorageError(f"failed to HEAD {key}") from e
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        if end <= start:
+            return b""
+        try:
+            resp = self._request("GET", key, headers={"Range": f"bytes={start}-{end - 1}"})
+            if resp.status_code == 404:
+                raise NotFoundError(f"not found: {key}")
+            if resp.status_code == 416:
+                return b""
+            resp.raise_for_status()
+            if resp.status_code == 206:
+                return resp.content
+            # Server ignored the Range header and sent the full object.
+            return resp.content[start:end]
+        except NotFoundError:
+            raise
+        except Exception as e:
+            raise StorageError(f"failed to GET {key} [{start}, {end})") from e
+
+    def get_range_and_size(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        if end <= start:
+            return b"", self.size(key)
+        try:
+            resp = self._request("GET", key, headers={"Range": f"bytes={start}-{end - 1}"})
+            if resp.status_code == 404:
+                raise NotFoundError(f"not found: {key}")
+            if resp.status_code == 416:
+                data = b""
+            else:
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    # Server ignored the Range header and sent the full object.
+                    return resp.content[start:end], len(resp.content)
+                data = resp.content
+        except NotFoundError:
+            raise
+        except Exception as e:
+            raise StorageError(f"failed to GET {key} [{start}, {end})") from e
+        total = content_range_size(resp.headers.get("Content-Range"))
+        return data, self.size(key) if total is None else total
+
+    def open_input_file(self, key: str) -> pa.NativeFile:
+        return pa.PythonFile(RangeReader(self, key), mode="r")
+
     def put_bytes(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> None:
         _ = (key, data, content_type)
         raise StorageError("HttpStorage is read-only")
+
+    def put_stream(
+        self, key: str, stream: IO[bytes], *, content_type: Optional[str] = None
+    ) -> None:
+        _ = (key, stream, content_type)
+        raise StorageError("HttpStorage is read-only")
+
+    def delete(self, key: str) -> None:
+        _ = key
+        raise StorageError("HttpStorage is read-only")
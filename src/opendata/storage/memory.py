@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+import pyarrow as pa
+
 from ..errors import NotFoundError
 from .base import StorageBackend
 
@@ -24,10 +26,23 @@ class MemoryStorage(StorageBackend):
         except KeyError as e:
             raise NotFoundError(f"not found: {key}") from e
 
+    def size(self, key: str) -> int:
+        return len(self.get_bytes(key))
+
+    def open_input_file(self, key: str) -> pa.NativeFile:
+        # `py_buffer` wraps the stored bytes without copying.
+        return pa.BufferReader(pa.py_buffer(self.get_bytes(key)))
+
     def put_bytes(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> None:
         _ = content_type
         self._objects[key] = bytes(data)
 
+    def delete(self, key: str) -> None:
+        self._objects.pop(key, None)
+
+    def list_keys(self, prefix: str) -> list[str]:
+        return sorted(k for k in self._objects if k.startswith(prefix))
+
 
 _GLOBAL: Optional[MemoryStorage] = None
 
@@ -1,10 +1,54 @@
 from __future__ import annotations
 
+import functools
 import os
-from typing import Optional, cast
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Optional, cast
 
-from ..errors import NotFoundError, StorageError
+import pyarrow as pa
+
+from ..errors import NotFoundError, StorageError, ValidationError
+from ..ids import cache_control
 from .base import StorageBackend
+from .ranged import RangeReader, content_range_size
+
+DEFAULT_MULTIPART_THRESHOLD_BYTES = 64 * 1024 * 1024
+DEFAULT_PART_SIZE_BYTES = 16 * 1024 * 1024
+# S3 (and R2) reject parts smaller than this, except for the last one.
+MIN_PART_SIZE_BYTES = 5 * 1024 * 1024
+DEFAULT_UPLOAD_WORKERS = 8
+DEFAULT_PART_RETRIES = 3
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError as e:
+        raise StorageError(f"{name} must be an integer") from e
+
+
+def _const(data: bytes) -> Callable[[], bytes]:
+    return lambda: data
+
+
+def _read_full(stream: IO[bytes], n: int) -> bytes:
+    # `read(n)` may return short reads on pipes/sockets before EOF.
+    chunks: list[bytes] = []
+    remaining = n
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
 
 
 class R2Config:
@@ -16,12 +60,24 @@ class R2Config:
         access_key_id: str,
         secret_access_key: str,
         region: str = "auto",
+        multipart_threshold_bytes: int = DEFAULT_MULTIPART_THRESHOLD_BYTES,
+        part_size_bytes: int = DEFAULT_PART_SIZE_BYTES,
+        upload_workers: int = DEFAULT_UPLOAD_WORKERS,
+        part_retries: int = DEFAULT_PART_RETRIES,
     ) -> None:
+        if int(part_size_bytes) < MIN_PART_SIZE_BYTES:
+            raise ValidationError(f"part_size_bytes must be >= {MIN_PART_SIZE_BYTES}")
+        if int(upload_workers) <= 0:
+            raise ValidationError("upload_workers must be > 0")
         self.endpoint_url = endpoint_url
         self.bucket = bucket
         self.access_key_id = access_key_id
         self.secret_access_key = secret_access_key
         self.region = region
+        self.multipart_threshold_bytes = int(multipart_threshold_bytes)
+        self.part_size_bytes = int(part_size_bytes)
+        self.upload_workers = int(upload_workers)
+        self.part_retries = max(int(part_retries), 0)
 
     @staticmethod
     def from_env() -> R2Config:
@@ -35,6 +91,9 @@ class R2Config:
 
         Optional:
         - OPENDATA_R2_REGION (default: auto)
+        - OPENDATA_R2_MULTIPART_THRESHOLD: bytes (default: 64 MiB)
+        - OPENDATA_R2_PART_SIZE: bytes (default: 16 MiB, min 5 MiB)
+        - OPENDATA_R2_UPLOAD_WORKERS: concurrent part uploads (default: 8)
         """
 
         endpoint_url = os.environ.get("OPENDATA_R2_ENDPOINT_URL", "").strip()
@@ -66,23 +125,43 @@ class R2Config:
             access_key_id=access_key_id,
             secret_access_key=secret_access_key,
             region=region,
+            multipart_threshold_bytes=_int_env(
+                "OPENDATA_R2_MULTIPART_THRESHOLD", DEFAULT_MULTIPART_THRESHOLD_BYTES
+            ),
+            part_size_bytes=_int_env("OPENDATA_R2_PART_SIZE", DEFAULT_PART_SIZE_BYTES),
+            upload_workers=_int_env("OPENDATA_R2_UPLOAD_WORKERS", DEFAULT_UPLOAD_WORKERS),
         )
 
 
 class R2Storage(StorageBackend):
     """Cloudflare R2 storage backend (S3 compatible).
 
-    Requires optional dependency: `pip install -e .[r2]`.
+    Objects of at least `cfg.multipart_threshold_bytes` written via `put_stream`
+    or `put_file` use a multipart upload: parts of `cfg.part_size_bytes` are
+    uploaded by up to `cfg.upload_workers` threads, each part is retried on its
+    own, and the upload is aborted if any part ultimately fails.
+
+    Requires optional dependency: `pip install -e .[r2]`. An existing S3 client
+    may be passed as `client`.
     """
 
-    def __init__(self, cfg: R2Config) -> None:
+    supports_range_reads = True
+    # botocore retries throttling and transient errors itself.
+    retries_requests = True
+
+    def __init__(self, cfg: R2Config, *, client: Optional[Any] = None) -> None:
+        self._bucket = cfg.bucket
+        self._cfg = cfg
+        if client is not None:
+            self._client = client
+            return
+
         try:
             import boto3  # type: ignore
             from botocore.config import Config  # type: ignore
         except Exception as e:  # pragma: no cover
             raise StorageError("boto3 is required for R2Storage; install extras 'r2'") from e
 
-        self._bucket = cfg.bucket
         self._client = boto3.client(
             "s3",
             endpoint_url=cfg.endpoint_url,
@@ -110,11 +189,199 @@ class R2Storage(StorageBackend):
         except Exception as e:
             raise NotFoundError(f"not found: {key}") from e
 
+    def size(self, key: str) -> int:
+        try:
+            resp = self._client.head_object(Bucket=self._bucket, Key=key)
+            return int(resp["ContentLength"])
+        except Exception as e:
+            raise NotFoundError(f"not found: {key}") from e
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        if end <= start:
+            return b""
+        try:
+            resp = self._client.get_object(
+                Bucket=self._bucket, Key=key, Range=f"bytes={start}-{end - 1}"
+            )
+            return cast(bytes, resp["Body"].read())
+        except Exception as e:
+            raise NotFoundError(f"not found: {key}") from e
+
+    def get_range_and_size(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        if end <= start:
+            return b"", self.size(key)
+        try:
+            resp = self._client.get_object(
+                Bucket=self._bucket, Key=key, Range=f"bytes={start}-{end - 1}"
+            )
+            data = cast(bytes, resp["Body"].read())
+        except Exception as e:
+            raise NotFoundError(f"not found: {key}") from e
+        total = content_range_size(resp.get("ContentRange"))
+        return data, self.size(key) if total is None else total
+
+    def open_input_file(self, key: str) -> pa.NativeFile:
+        return pa.PythonFile(RangeReader(self, key), mode="r")
+
     def put_bytes(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> None:
-        kwargs: dict[str, object] = {"Bucket": self._bucket, "Key": key, "Body": data}
+        self._put_object(key, data, content_type=content_type)
+
+    def put_stream(
+        self, key: str, stream: IO[bytes], *, content_type: Optional[str] = None
+    ) -> None:
+        threshold = self._cfg.multipart_threshold_bytes
+        part_size = self._cfg.part_size_bytes
+
+        # Buffer parts until the threshold is reached; smaller objects are sent
+        # with a single PUT.
+        head: list[bytes] = []
+        buffered = 0
+        while True:
+            chunk = _read_full(stream, part_size)
+            head.append(chunk)
+            buffered += len(chunk)
+            if len(chunk) < part_size:
+                self.put_bytes(key, b"".join(head), content_type=content_type)
+                return
+            if buffered >= threshold:
+                break
+
+        def _parts() -> Iterator[Callable[[], bytes]]:
+            while head:
+                yield _const(head.pop(0))
+            while True:
+                chunk = _read_full(stream, part_size)
+                if not chunk:
+                    return
+                yield _const(chunk)
+
+        self._multipart_upload(key, _parts(), content_type=content_type)
+
+    def put_file(self, key: str, path: Path, *, content_type: Optional[str] = None) -> None:
+        path = Path(path)
+        size = path.stat().st_size
+        if size < self._cfg.multipart_threshold_bytes:
+            with path.open("rb") as f:
+                self._put_object(key, f, content_type=content_type)
+            return
+
+        part_size = self._cfg.part_size_bytes
+
+        def _read_part(start: int) -> bytes:
+            # Each part opens its own handle so workers read in parallel.
+            with path.open("rb") as f:
+                f.seek(start)
+                return _read_full(f, part_size)
+
+        def _parts() -> Iterator[Callable[[], bytes]]:
+            for start in range(0, size, part_size):
+                yield functools.partial(_read_part, start)
+
+        self._multipart_upload(key, _parts(), content_type=content_type)
+
+    def delete(self, key: str) -> None:
+        # S3 DeleteObject succeeds for missing keys.
+        try:
+            self._client.delete_object(Bucket=self._bucket, Key=key)
+        except Exception as e:
+            raise StorageError(f"failed to delete object: {key}") from e
+
+    def list_keys(self, prefix: str) -> list[str]:
+        keys: list[str] = []
+        try:
+            paginator = self._client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
+                keys.extend(str(obj["Key"]) for obj in page.get("Contents", []))
+        except Exception as e:
+            raise StorageError(f"failed to list objects: {prefix}") from e
+        return sorted(keys)
+
+    def _object_kwargs(self, key: str, content_type: Optional[str]) -> dict[str, object]:
+        kwargs: dict[str, object] = {"Bucket": self._bucket, "Key": key}
         if content_type:
             kwargs["ContentType"] = content_type
+        # Content-addressed keys are immutable, so CDNs and browsers may cache
+        # them forever; see `opendata.ids.cache_control`.
+        header = cache_control(key)
+        if header:
+            kwargs["CacheControl"] = header
+        return kwargs
+
+    def _put_object(self, key: str, body: Any, *, content_type: Optional[str]) -> None:
+        kwargs = self._object_kwargs(key, content_type)
+        kwargs["Body"] = body
         try:
             self._client.put_object(**kwargs)
         except Exception as e:
             raise StorageError(f"failed to put object: {key}") from e
+
+    def _upload_part(self, key: str, upload_id: str, number: int, data: bytes) -> str:
+        attempt = 0
+        while True:
+            try:
+                resp = self._client.upload_part(
+                    Bucket=self._bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=data,
+                )
+                return str(resp["ETag"])
+            except Exception:
+                if attempt >= self._cfg.part_retries:
+                    raise
+            time.sleep(min(0.25 * (2**attempt), 4.0))
+            attempt += 1
+
+    def _multipart_upload(
+        self,
+        key: str,
+        parts: Iterator[Callable[[], bytes]],
+        *,
+        content_type: Optional[str],
+    ) -> None:
+        kwargs = self._object_kwargs(key, content_type)
+        try:
+            upload_id = str(self._client.create_multipart_upload(**kwargs)["UploadId"])
+        except Exception as e:
+            raise StorageError(f"failed to start multipart upload: {key}") from e
+
+        # At most `upload_workers` parts are read and in flight at once, which
+        # bounds memory to that many parts when reading from a stream.
+        workers = self._cfg.upload_workers
+        slots = threading.BoundedSemaphore(workers)
+
+        def _run(number: int, read: Callable[[], bytes]) -> str:
+            try:
+                return self._upload_part(key, upload_id, number, read())
+            finally:
+                slots.release()
+
+        futures: list[Future[str]] = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for number, read in enumerate(parts, start=1):
+                    slots.acquire()
+                    if any(f.done() and f.exception() is not None for f in futures):
+                        slots.release()
+                        break
+                    futures.append(pool.submit(_run, number, read))
+            etags = [f.result() for f in futures]
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [{"ETag": etag, "PartNumber": i} for i, etag in enumerate(etags, 1)]
+                },
+            )
+        except BaseException as e:
+            try:
+                self._client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=key, UploadId=upload_id
+                )
+            except Exception:
+                pass
+            if isinstance(e, Exception):
+                raise StorageError(f"multipart upload failed: {key}") from e
+            raise
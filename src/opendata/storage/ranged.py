@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import io
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+import pyarrow.parquet as pq
+
+from ..errors import StorageError
+from .base import StorageBackend
+
+DEFAULT_READAHEAD_BYTES = 64 * 1024
+DEFAULT_HOLE_BYTES = 8 * 1024
+# pyarrow speculatively reads this many trailing bytes to find the footer.
+FOOTER_READ_BYTES = 64 * 1024
+
+
+def content_range_size(value: Optional[str]) -> Optional[int]:
+    """Total object size from a `Content-Range` header (`bytes 0-99/1234`), if known."""
+
+    if not value or "/" not in value:
+        return None
+    total = value.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+def parquet_footer_length(tail: bytes) -> int:
+    """Return the footer length encoded in the last 8 bytes of a parquet file."""
+
+    if len(tail) < 8 or tail[-4:] != b"PAR1":
+        raise StorageError("not a parquet file (missing PAR1 footer magic)")
+    return int.from_bytes(tail[-8:-4], "little")
+
+
+def read_parquet_footer(
+    storage: StorageBackend, key: str, *, size: Optional[int] = None
+) -> pq.FileMetaData:
+    """Fetch and parse only the footer of a parquet object.
+
+    One ranged request covers the footer in the common case; a second one is
+    made only if the footer is larger than `FOOTER_READ_BYTES`.
+    """
+
+    total = storage.size(key) if size is None else int(size)
+    tail_start = max(total - FOOTER_READ_BYTES, 0)
+    reader = PrefetchedReader(total)
+    tail = storage.get_range(key, tail_start, total)
+    reader.add(tail_start, tail)
+
+    footer_start = total - parquet_footer_length(tail) - 8
+    if footer_start < tail_start:
+        reader.add(footer_start, storage.get_range(key, footer_start, tail_start))
+    return pq.read_metadata(reader)
+
+
+def column_chunk_ranges(
+    metadata: pq.FileMetaData,
+    columns: Optional[Sequence[str]] = None,
+    *,
+    row_groups: Optional[Iterable[int]] = None,
+) -> list[tuple[int, int]]:
+    """Return `[start, end)` byte ranges of the column chunks needed to read columns.
+
+    `columns` are top-level (Arrow) column names; nested columns map to all of
+    their leaf chunks. `None` selects every column / every row group.
+    """
+
+    wanted = set(columns) if columns is not None else None
+    rgs = range(metadata.num_row_groups) if row_groups is None else row_groups
+    out: list[tuple[int, int]] = []
+    for rg in rgs:
+        rg_meta = metadata.row_group(rg)
+        for i in range(rg_meta.num_columns):
+            col = rg_meta.column(i)
+            if wanted is not None and col.path_in_schema.split(".", 1)[0] not in wanted:
+                continue
+            start = int(col.data_page_offset)
+            if col.has_dictionary_page and col.dictionary_page_offset is not None:
+                start = min(start, int(col.dictionary_page_offset))
+            out.append((start, start + int(col.total_compressed_size)))
+    return out
+
+
+def coalesce_ranges(
+    ranges: Iterable[tuple[int, int]], *, hole_bytes: int = DEFAULT_HOLE_BYTES
+) -> list[tuple[int, int]]:
+    """Merge overlapping ranges and ranges separated by at most `hole_bytes`."""
+
+    out: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if out and start <= out[-1][1] + hole_bytes:
+            out[-1] = (out[-1][0], max(out[-1][1], end))
+        else:
+            out.append((start, end))
+    return out
+
+
+class RangeReader(io.RawIOBase):
+    """Seekable, read-only file object backed by `StorageBackend.get_range`.
+
+    Reads are served by ranged requests, so readers like `pq.ParquetFile` only
+    transfer the footer and the column chunks they actually decode. Reads smaller
+    than `readahead_bytes` fetch a full read-ahead window instead and keep the
+    excess buffered, which coalesces runs of small adjacent reads (page headers,
+    neighbouring small column chunks) into a single request. Larger reads are
+    fetched exactly so skipped columns are never over-fetched.
+
+    The reader is safe to use from multiple threads (pyarrow may read from an I/O
+    thread pool); each read is atomic with respect to the file position.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        key: str,
+        *,
+        size: Optional[int] = None,
+        readahead_bytes: int = DEFAULT_READAHEAD_BYTES,
+    ) -> None:
+        super().__init__()
+        self._storage = storage
+        self._key = key
+        self._size = int(size) if size is not None else storage.size(key)
+        self._readahead = max(int(readahead_bytes), 0)
+        self._pos = 0
+        self._buf_start = 0
+        self._buf = b""
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        with self._lock:
+            if whence == io.SEEK_SET:
+                pos = offset
+            elif whence == io.SEEK_CUR:
+                pos = self._pos + offset
+            elif whence == io.SEEK_END:
+                pos = self._size + offset
+            else:
+                raise ValueError(f"invalid whence: {whence}")
+            if pos < 0:
+                raise ValueError("negative seek position")
+            self._pos = pos
+            return self._pos
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        with self._lock:
+            view = memoryview(buffer).cast("B")
+            want = min(len(view), self._size - self._pos)
+            if want <= 0:
+                return 0
+
+            n = 0
+            offset = self._pos - self._buf_start
+            if 0 <= offset < len(self._buf):
+                n = min(want, len(self._buf) - offset)
+                view[:n] = self._buf[offset : offset + n]
+
+            if n < want:
+                start = self._pos + n
+                remaining = want - n
+                if remaining < self._readahead:
+                    end = min(start + self._readahead, self._size)
+                    data = self._storage.get_range(self._key, start, end)
+                    self._buf_start, self._buf = start, data
+                    take = min(remaining, len(data))
+                    view[n : n + take] = data[:take]
+                else:
+                    data = self._storage.get_range(self._key, start, start + remaining)
+                    take = len(data)
+                    view[n : n + take] = data
+                n += take
+
+            self._pos += n
+            return n
+
+
+class PrefetchedReader(io.RawIOBase):
+    """Seekable, read-only file object over already-fetched byte ranges.
+
+    This lets pyarrow decode from ranges that were fetched elsewhere (e.g. with
+    async I/O). Reads outside the fetched ranges raise `StorageError`.
+    """
+
+    def __init__(self, size: int) -> None:
+        super().__init__()
+        self._size = int(size)
+        self._blocks: list[tuple[int, bytes]] = []
+        self._pos = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def add(self, start: int, data: bytes) -> None:
+        self._blocks.append((int(start), data))
+        self._blocks.sort(key=lambda b: b[0])
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError("negative seek position")
+        self._pos = pos
+        return self._pos
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        view = memoryview(buffer).cast("B")
+        want = min(len(view), self._size - self._pos)
+        n = 0
+        while n < want:
+            pos = self._pos + n
+            for start, data in self._blocks:
+                if start <= pos < start + len(data):
+                    take = min(want - n, start + len(data) - pos)
+                    view[n : n + take] = data[pos - start : pos - start + take]
+                    n += take
+                    break
+            else:
+                raise StorageError(f"read at offset {pos} is outside the prefetched ranges")
+        self._pos += n
+        return n
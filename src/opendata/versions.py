@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .errors import NotFoundError, ValidationError
+from .ids import (
+    data_key,
+    dataset_prefix,
+    latest_key,
+    manifest_key,
+    metadata_key,
+    version_data_key,
+    version_metadata_key,
+)
+from .partitions import load_manifest
+from .storage.base import StorageBackend
+
+# Previous versions remembered in `latest.json`, for `gc_versions(keep=...)`.
+POINTER_HISTORY = 20
+DEFAULT_KEEP_VERSIONS = 3
+
+
+@dataclass(frozen=True)
+class LatestPointer:
+    """Contents of `latest.json`, the pointer to a dataset's current version.
+
+    `version` is the sha256 of the data and `path` its key relative to the
+    dataset prefix (`v/<sha256>/data.parquet`); `metadata_path` is the
+    version's own `metadata.json` (None in pointers written before it
+    existed). `history` lists previous versions, newest first, as
+    `{"version", "updated_at"}` objects.
+    """
+
+    dataset_id: str
+    version: str
+    path: str
+    updated_at: str
+    row_count: int = 0
+    data_size_bytes: int = 0
+    history: list[dict[str, str]] = field(default_factory=list)
+    metadata_path: Optional[str] = None
+
+    @property
+    def data_key(self) -> str:
+        return f"{dataset_prefix(self.dataset_id)}/{self.path}"
+
+    @property
+    def metadata_key(self) -> Optional[str]:
+        if not self.metadata_path:
+            return None
+        return f"{dataset_prefix(self.dataset_id)}/{self.metadata_path}"
+
+    @staticmethod
+    def create(
+        dataset_id: str,
+        version: str,
+        *,
+        updated_at: str,
+        row_count: int,
+        data_size_bytes: int,
+        previous: Optional[LatestPointer] = None,
+    ) -> LatestPointer:
+        """Build the pointer to `version`, pushing `previous` onto the history."""
+
+        history: list[dict[str, str]] = []
+        if previous is not None:
+            history = [{"version": previous.version, "updated_at": previous.updated_at}]
+            history += previous.history
+        history = [h for h in history if h["version"] != version][:POINTER_HISTORY]
+        skip = len(dataset_prefix(dataset_id)) + 1
+        return LatestPointer(
+            dataset_id=dataset_id,
+            version=version,
+            path=version_data_key(dataset_id, version)[skip:],
+            updated_at=updated_at,
+            row_count=row_count,
+            data_size_bytes=data_size_bytes,
+            history=history,
+            metadata_path=version_metadata_key(dataset_id, version)[skip:],
+        )
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> LatestPointer:
+        history = data.get("history") or []
+        if not isinstance(history, list) or not all(
+            isinstance(h, dict) and isinstance(h.get("version"), str) for h in history
+        ):
+            raise ValidationError("latest.json history must be a list of versions")
+        try:
+            return LatestPointer(
+                dataset_id=str(data["dataset_id"]),
+                version=str(data["version"]),
+                path=str(data["path"]),
+                updated_at=str(data.get("updated_at", "")),
+                row_count=int(data.get("row_count") or 0),
+                data_size_bytes=int(data.get("data_size_bytes") or 0),
+                history=[
+                    {"version": h["version"], "updated_at": str(h.get("updated_at", ""))}
+                    for h in history
+                ],
+                metadata_path=str(data["metadata_path"]) if data.get("metadata_path") else None,
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"invalid latest.json: {data!r}") from e
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "dataset_id": self.dataset_id,
+            "version": self.version,
+            "path": self.path,
+            "updated_at": self.updated_at,
+            "row_count": self.row_count,
+            "data_size_bytes": self.data_size_bytes,
+            "checksum_sha256": self.version,
+            "history": [dict(h) for h in self.history],
+        }
+        if self.metadata_path:
+            out["metadata_path"] = self.metadata_path
+        return out
+
+
+def parse_latest(raw: bytes, dataset_id: str) -> LatestPointer:
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise ValidationError(f"invalid latest.json for {dataset_id}") from e
+    if not isinstance(data, dict):
+        raise ValidationError(f"invalid latest.json for {dataset_id}")
+    return LatestPointer.from_dict(data)
+
+
+def load_latest(storage: StorageBackend, dataset_id: str) -> Optional[LatestPointer]:
+    """Return the dataset's `latest.json` pointer, or None if it has none."""
+
+    try:
+        raw = storage.get_bytes(latest_key(dataset_id))
+    except NotFoundError:
+        return None
+    return parse_latest(raw, dataset_id)
+
+
+def current_metadata_key(dataset_id: str, pointer: Optional[LatestPointer]) -> str:
+    """Key of the metadata describing the data `pointer` names.
+
+    A version's metadata is written before the pointer switches to it, so it
+    never describes data readers are not served yet. Without a pointer (or one
+    written before per-version metadata) this is `metadata.json`.
+    """
+
+    if pointer is not None and pointer.metadata_key:
+        return pointer.metadata_key
+    return metadata_key(dataset_id)
+
+
+def resolve_data_key(storage: StorageBackend, dataset_id: str) -> tuple[str, Optional[str]]:
+    """Return the key of the dataset's single data file and its checksum if known.
+
+    The `latest.json` pointer wins, then `manifest.json`: partitioned and
+    appended datasets have no single data file (ValidationError), even if a
+    superseded `data.parquet` is still around. Datasets published before
+    versioning fall back to `data.parquet` (checksum unknown).
+    """
+
+    pointer = load_latest(storage, dataset_id)
+    if pointer is not None:
+        return pointer.data_key, pointer.version
+    if storage.exists(manifest_key(dataset_id)):
+        raise ValidationError(f"{dataset_id} is stored as several files (manifest.json)")
+    return data_key(dataset_id), None
+
+
+def resolve_data_keys(storage: StorageBackend, dataset_id: str) -> list[str]:
+    """Return the keys of all of the dataset's data files, in read order.
+
+    Like `resolve_data_key`, but partitioned and appended datasets resolve to
+    the files listed in `manifest.json` instead of raising.
+    """
+
+    pointer = load_latest(storage, dataset_id)
+    if pointer is not None:
+        return [pointer.data_key]
+    manifest = load_manifest(storage, dataset_id)
+    if manifest is not None:
+        if not manifest.files:
+            raise NotFoundError(f"not found: no files in manifest of {dataset_id}")
+        return [manifest.file_key(f) for f in manifest.files]
+    return [data_key(dataset_id)]
+
+
+def gc_versions(
+    storage: StorageBackend,
+    dataset_id: str,
+    *,
+    keep: int = DEFAULT_KEEP_VERSIONS,
+    dry_run: bool = False,
+) -> list[str]:
+    """Delete data objects that no longer back the dataset's current version.
+
+    With a `latest.json` pointer, its version and the `keep` most recent
+    previous versions (from the pointer's history) are kept with their
+    metadata; other `v/` versions, a legacy `data.parquet` and any
+    partitioned files are deleted. A `manifest.json` the pointer superseded
+    counts as the version before the oldest in its history, so it and its
+    files are kept while that history is shorter than `keep`.
+    For partitioned and appended datasets, files not listed in `manifest.json`
+    (replaced partitions, compacted base/delta files), `v/` versions and a
+    legacy `data.parquet` are deleted.
+    `metadata.json`, `README.md` and the pointer itself are never touched.
+
+    Previous versions are kept so readers that fetched the pointer just before
+    a publish can still download the data it named. Returns the deleted keys
+    (or those that would be deleted with `dry_run`). Requires a backend that
+    supports `list_keys` and `delete`.
+    """
+
+    if int(keep) < 0:
+        raise ValidationError("keep must be >= 0")
+
+    prefix = dataset_prefix(dataset_id)
+    pointer = load_latest(storage, dataset_id)
+    live: set[str] = set()
+    # Kept versions keep all their objects (data, metadata, preview).
+    kept_versions: tuple[str, ...] = ()
+    if pointer is not None:
+        versions = [pointer.version, *(h["version"] for h in pointer.history[: int(keep)])]
+        kept_versions = tuple(f"{prefix}/v/{v}/" for v in versions)
+        # Partitioned and appended publishes drop the pointer, so its whole
+        # history is newer than a manifest still lying around.
+        superseded = load_manifest(storage, dataset_id)
+        if superseded is not None and len(pointer.history) < int(keep):
+            live = {manifest_key(dataset_id)}
+            live.update(superseded.file_key(f) for f in superseded.files)
+        candidates = [
+            k for k in (data_key(dataset_id), manifest_key(dataset_id)) if storage.exists(k)
+        ]
+        candidates += storage.list_keys(f"{prefix}/part/")
+    else:
+        manifest = load_manifest(storage, dataset_id)
+        if manifest is None:
+            # Nothing is current without a pointer or manifest (legacy
+            # `data.parquet` or no data at all): only versions are stale.
+            candidates = []
+        else:
+            live = {manifest.file_key(f) for f in manifest.files}
+            candidates = [k for k in (data_key(dataset_id),) if storage.exists(k)]
+            candidates += storage.list_keys(f"{prefix}/part/")
+    candidates += storage.list_keys(f"{prefix}/v/")
+
+    stale = [k for k in candidates if k not in live and not k.startswith(kept_versions)]
+    if not dry_run:
+        for key in stale:
+            storage.delete(key)
+    return stale
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path, PurePosixPath
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import opendata as od
+from opendata.append import publish_append
+from opendata.errors import NotFoundError, StorageError
+from opendata.ids import data_key
+from opendata.publish import publish_dataframe, publish_partitioned
+from opendata.storage.aio import ThreadedAsyncStorage
+from opendata.storage.memory import MemoryStorage
+
+
+def _free_port() -> int:
+    with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _catalog(dataset_id: str) -> dict[str, object]:
+    return {
+        "id": dataset_id,
+        "title": "Async",
+        "description": "Async test dataset",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["test"],
+        "owners": ["test"],
+        "frequency": "daily",
+    }
+
+
+def test_aload_and_aload_many_over_threaded_storage() -> None:
+    storage = MemoryStorage()
+    frames = {}
+    for name in ["coinbase-btc-usd-candles-1d", "coinbase-eth-usd-candles-1d"]:
+        dataset_id = f"getopendata/{name}"
+        df = pd.DataFrame({"close": [1.0, 2.0, 3.0], "volume": [10, 20, 30]})
+        publish_dataframe(storage, dataset_id=dataset_id, df=df, catalog=_catalog(dataset_id))
+        frames[dataset_id] = df
+
+    async def _run() -> None:
+        backend = ThreadedAsyncStorage(storage, max_concurrency=2)
+        first = next(iter(frames))
+
+        df_out = await od.aload(first, storage=backend)
+        pd.testing.assert_frame_equal(df_out, frames[first])
+
+        df_cols = await od.aload(first, columns=["volume"], storage=backend)
+        pd.testing.assert_frame_equal(df_cols, frames[first][["volume"]])
+
+        res = await od.aload_many([*frames, "getopendata/missing"], storage=backend)
+        assert list(res.frames) == list(frames)
+        assert isinstance(res.errors["getopendata/missing"], NotFoundError)
+
+    asyncio.run(_run())
+
+
+def test_aload_reads_manifest_datasets() -> None:
+    storage = MemoryStorage()
+    ts = pd.date_range("2024-01-01", periods=48, freq="h", tz="UTC")
+    table = pa.table({"t": ts, "v": list(range(48))})
+    partitioned = "getopendata/async-partitioned"
+    appended = "getopendata/async-append"
+    publish_partitioned(storage, dataset_id=partitioned, table=table, catalog=_catalog(partitioned))
+    for window in (table.slice(0, 24), table.slice(24)):
+        publish_append(
+            storage,
+            dataset_id=appended,
+            table=window,
+            key_columns=["t"],
+            catalog=_catalog(appended),
+            compact=False,
+        )
+
+    async def _run() -> None:
+        backend = ThreadedAsyncStorage(storage)
+        for dataset_id in (partitioned, appended):
+            expected = od.load(dataset_id, storage=storage)
+            df = await od.aload(dataset_id, storage=backend)
+            pd.testing.assert_frame_equal(df, expected)
+            cols = await od.aload(dataset_id, columns=["v"], storage=backend)
+            assert cols["v"].tolist() == list(range(48))
+
+    asyncio.run(_run())
+
+
+def test_aload_over_local_http_server(tmp_path: Path) -> None:
+    pytest.importorskip("aiohttp")
+    from opendata.storage.aio import AsyncHttpStorage
+
+    bucket_dir = tmp_path / "bucket"
+    dataset_id = "getopendata/stooq-aapl-daily"
+    df_in = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    key = data_key(dataset_id)
+    parquet_path = bucket_dir / Path(*PurePosixPath(key).parts)
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    df_in.to_parquet(parquet_path, index=False)
+
+    class Handler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            super().__init__(*args, directory=str(bucket_dir), **kwargs)
+
+        def log_message(self, format, *args):  # type: ignore[no-untyped-def]
+            return
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", _free_port()), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    async def _run() -> None:
+        port = httpd.server_address[1]
+        async with AsyncHttpStorage(base_url=f"http://127.0.0.1:{port}/") as storage:
+            assert await storage.aexists(key)
+            assert not await storage.aexists("datasets/nope/nope/data.parquet")
+            assert await storage.asize(key) == parquet_path.stat().st_size
+
+            df_out = await od.aload(dataset_id, storage=storage)
+            pd.testing.assert_frame_equal(df_in, df_out)
+
+            df_cols = await od.aload(dataset_id, columns=["b"], storage=storage)
+            pd.testing.assert_frame_equal(df_in[["b"]], df_cols)
+
+    try:
+        asyncio.run(_run())
+    finally:
+        httpd.shutdown()
+
+
+def test_aexists_raises_on_server_errors() -> None:
+    pytest.importorskip("aiohttp")
+    from opendata.storage.aio import AsyncHttpStorage
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # type: ignore[no-untyped-def]
+            return
+
+        def do_HEAD(self) -> None:
+            self.send_response(404 if self.path.endswith("/missing.json") else 500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", _free_port()), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    async def _run() -> None:
+        port = httpd.server_address[1]
+        async with AsyncHttpStorage(base_url=f"http://127.0.0.1:{port}/") as storage:
+            assert not await storage.aexists("datasets/a/b/missing.json")
+            with pytest.raises(StorageError, match="HTTP 500"):
+                await storage.aexists("datasets/a/b/latest.json")
+        # Connection errors are not "missing" either.
+        async with AsyncHttpStorage(base_url=f"http://127.0.0.1:{_free_port()}/") as down:
+            with pytest.raises(StorageError):
+                await down.aexists("datasets/a/b/latest.json")
+
+    try:
+        asyncio.run(_run())
+    finally:
+        httpd.shutdown()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from opendata.cache import DiskCache
+from opendata.client import load
+from opendata.publish import publish_dataframe
+from opendata.storage.memory import MemoryStorage
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets: list[str] = []
+
+    def get_bytes(self, key: str) -> bytes:
+        self.gets.append(key)
+        return super().get_bytes(key)
+
+    def data_gets(self) -> int:
+        return sum(key.endswith("/data.parquet") for key in self.gets)
+
+
+def _catalog(dataset_id: str) -> dict[str, object]:
+    return {
+        "id": dataset_id,
+        "title": "Cache",
+        "description": "Cache test dataset",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["test"],
+        "owners": ["test"],
+        "frequency": "daily",
+    }
+
+
+def test_load_with_cache_skips_data_download_until_checksum_changes(tmp_path: Path) -> None:
+    storage = CountingStorage()
+    dataset_id = "getopendata/cache-test"
+    cache = DiskCache(tmp_path / "cache")
+
+    df1 = pd.DataFrame({"a": [1, 2, 3]})
+    publish_dataframe(storage, dataset_id=dataset_id, df=df1, catalog=_catalog(dataset_id))
+
+    pd.testing.assert_frame_equal(load(dataset_id, storage=storage, cache=cache), df1)
+    pd.testing.assert_frame_equal(load(dataset_id, storage=storage, cache=cache), df1)
+    assert storage.data_gets() == 1
+
+    df2 = pd.DataFrame({"a": [4, 5]})
+    publish_dataframe(storage, dataset_id=dataset_id, df=df2, catalog=_catalog(dataset_id))
+
+    pd.testing.assert_frame_equal(load(dataset_id, storage=storage, cache=cache), df2)
+    assert storage.data_gets() == 2
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=250)
+
+    old = cache.put(b"a" * 100)
+    os.utime(cache.path_for(old), (1, 1))
+    kept = cache.put(b"b" * 100)
+    os.utime(cache.path_for(kept), (2, 2))
+    newest = cache.put(b"c" * 100)
+
+    assert cache.get(old) is None
+    assert cache.get(kept) == b"b" * 100
+    assert cache.get(newest) == b"c" * 100
+    assert cache.total_bytes() <= 250
+    assert not list(tmp_path.glob("objects/*/.tmp-*"))
+
+
+def test_disk_cache_from_env(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.delenv("OPENDATA_CACHE_DIR", raising=False)
+    assert DiskCache.from_env() is None
+
+    monkeypatch.setenv("OPENDATA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("OPENDATA_CACHE_MAX_BYTES", "1024")
+    cache = DiskCache.from_env()
+    assert cache is not None
+    assert cache.directory == tmp_path
+    assert cache.max_bytes == 1024
+
+
+def test_arrow_cache_returns_memory_mapped_tables(tmp_path: Path) -> None:
+    storage = CountingStorage()
+    dataset_id = "getopendata/cache-test"
+    cache = DiskCache(tmp_path / "cache", format="arrow")
+
+    df = pd.DataFrame({"a": list(range(1000)), "b": [f"v{i}" for i in range(1000)]})
+    publish_dataframe(storage, dataset_id=dataset_id, df=df, catalog=_catalog(dataset_id))
+
+    first = load(dataset_id, storage=storage, cache=cache, return_type="arrow")
+    assert isinstance(first, pa.Table)
+    assert len(list((tmp_path / "cache").glob("objects/*/*.arrow"))) == 1
+
+    before = pa.total_allocated_bytes()
+    second = load(dataset_id, columns=["b"], storage=storage, cache=cache, return_type="arrow")
+    assert pa.total_allocated_bytes() == before
+    assert second.column_names == ["b"]
+    assert storage.data_gets() == 1
+
+    pd.testing.assert_frame_equal(load(dataset_id, storage=storage, cache=cache), df)
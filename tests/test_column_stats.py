@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from opendata.ids import metadata_key
+from opendata.info import info
+from opendata.publish import publish_batches, publish_dataframe, publish_parquet_file
+from opendata.stats import compute_column_stats
+from opendata.storage.memory import MemoryStorage
+
+DATASET_ID = "getopendata/stats-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Stats",
+    "description": "Column stats test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "daily",
+}
+
+
+def _table() -> pa.Table:
+    return pa.table(
+        {
+            "date": pa.array(pd.date_range("2024-01-01", periods=6, freq="D")),
+            "symbol": pa.array(["A", "B", None, "A", "C", "B"]).dictionary_encode(),
+            "value": [3.5, None, 1.0, 2.0, None, 9.0],
+            "tags": [["x"], [], None, ["y"], ["x", "y"], []],
+        }
+    )
+
+
+def _stats(storage: MemoryStorage) -> dict[str, dict[str, object]]:
+    return json.loads(storage.get_bytes(metadata_key(DATASET_ID)))["stats"]
+
+
+def test_compute_column_stats() -> None:
+    stats = compute_column_stats(_table().column("symbol"))
+    assert stats == {"null_count": 1, "min": "A", "max": "C", "distinct_count": 3}
+    assert compute_column_stats(_table().column("tags")) == {"null_count": 1}
+
+
+def test_publish_dataframe_stores_stats() -> None:
+    storage = MemoryStorage()
+    publish_dataframe(storage, dataset_id=DATASET_ID, df=_table().to_pandas(), catalog=CATALOG)
+
+    stats = _stats(storage)
+    assert set(stats) == {"date", "symbol", "value", "tags"}
+    assert stats["date"]["min"] == "2024-01-01T00:00:00"
+    assert stats["date"]["max"] == "2024-01-06T00:00:00"
+    assert stats["value"]["null_count"] == 2
+    assert stats["value"]["min"] == 1.0 and stats["value"]["max"] == 9.0
+    assert stats["value"]["distinct_count"] == 4
+    for entry in stats.values():
+        assert entry["uncompressed_bytes"] > 0 and entry["compressed_bytes"] > 0
+
+    # info() uses the stats block when the footer is not fetched.
+    value = next(
+        c for c in info(DATASET_ID, footer=False, storage=storage).columns if c.name == "value"
+    )
+    assert (value.min, value.max, value.null_count) == (1.0, 9.0, 2)
+
+
+def test_publish_parquet_file_stores_stats(tmp_path: Path) -> None:
+    path = tmp_path / "data.parquet"
+    pq.write_table(_table(), path, row_group_size=2)
+    storage = MemoryStorage()
+    publish_parquet_file(storage, dataset_id=DATASET_ID, parquet_path=path, catalog=CATALOG)
+
+    # Merged over the three row groups, so there is no distinct_count.
+    stats = _stats(storage)
+    assert stats["symbol"] == {
+        "null_count": 1,
+        "min": "A",
+        "max": "C",
+        "compressed_bytes": stats["symbol"]["compressed_bytes"],
+        "uncompressed_bytes": stats["symbol"]["uncompressed_bytes"],
+    }
+    assert stats["value"]["null_count"] == 2
+    assert stats["value"]["min"] == 1.0 and stats["value"]["max"] == 9.0
+
+
+def test_publish_parquet_file_reads_one_row_group_at_a_time(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    path = tmp_path / "data.parquet"
+    pq.write_table(_table(), path, row_group_size=2)
+    groups: list[int] = []
+    read_row_group = pq.ParquetFile.read_row_group
+
+    def record(self, i, *args, **kwargs):  # type: ignore[no-untyped-def]
+        groups.append(i)
+        return read_row_group(self, i, *args, **kwargs)
+
+    def read_all(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("the whole file must not be read")
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", record)
+    monkeypatch.setattr(pq.ParquetFile, "read", read_all)
+    storage = MemoryStorage()
+    catalog = {**CATALOG, "sort_by": ["date"]}
+    publish_parquet_file(storage, dataset_id=DATASET_ID, parquet_path=path, catalog=catalog)
+
+    # One pass checks the sort order and computes the stats.
+    assert groups == [0, 1, 2]
+    assert _stats(storage)["date"]["max"] == "2024-01-06T00:00:00"
+
+
+def test_publish_batches_merges_stats_and_skips_distinct() -> None:
+    storage = MemoryStorage()
+    table = _table()
+    publish_batches(
+        storage,
+        dataset_id=DATASET_ID,
+        batches=table.to_batches(max_chunksize=2),
+        schema=table.schema,
+        row_group_size=2,
+        catalog=CATALOG,
+    )
+
+    stats = _stats(storage)
+    assert stats["value"]["null_count"] == 2
+    assert stats["value"]["min"] == 1.0 and stats["value"]["max"] == 9.0
+    assert "distinct_count" not in stats["value"]
+
+
+def test_compute_stats_can_be_disabled() -> None:
+    storage = MemoryStorage()
+    publish_dataframe(
+        storage,
+        dataset_id=DATASET_ID,
+        df=_table().to_pandas(),
+        catalog=CATALOG,
+        compute_stats=False,
+    )
+    assert "stats" not in json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
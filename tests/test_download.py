@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from opendata.client import load
+from opendata.download import download_bytes, download_file, fetch_object
+from opendata.errors import StorageError
+from opendata.ids import data_key
+from opendata.publish import publish_dataframe
+from opendata.storage.memory import MemoryStorage
+
+
+class FlakyRangeStorage(MemoryStorage):
+    """Range-capable storage whose range reads fail once and then return short reads."""
+
+    supports_range_reads = True
+
+    def __init__(self, *, fail_every: int = 0, max_range_bytes: int = 0) -> None:
+        super().__init__()
+        self.fail_every = fail_every
+        self.max_range_bytes = max_range_bytes
+        self.range_calls = 0
+        self.size_calls = 0
+        self.gets: list[str] = []
+
+    def get_bytes(self, key: str) -> bytes:
+        self.gets.append(key)
+        return super().get_bytes(key)
+
+    def size(self, key: str) -> int:
+        self.size_calls += 1
+        return len(self._objects[key])
+
+    def get_range_and_size(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        return self.get_range(key, start, end), len(self._objects[key])
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        self.range_calls += 1
+        if self.fail_every and self.range_calls % self.fail_every == 0:
+            raise ConnectionError("connection reset")
+        if self.max_range_bytes:
+            end = min(end, start + self.max_range_bytes)
+        return self._objects[key][start:end]
+
+
+def _payload(n: int) -> bytes:
+    return b"".join(hashlib.sha256(str(i).encode()).digest() for i in range(n // 32 + 1))[:n]
+
+
+def test_download_bytes_retries_and_resumes_chunks(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.download.time.sleep", lambda _: None)
+    storage = FlakyRangeStorage(fail_every=3, max_range_bytes=700)
+    data = _payload(10_000)
+    storage.put_bytes("obj", data)
+
+    out = download_bytes(storage, "obj", chunk_bytes=1024, max_workers=4)
+    assert bytes(out) == data
+    assert storage.gets == []
+
+
+def test_download_bytes_gives_up_after_retries(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.download.time.sleep", lambda _: None)
+    storage = FlakyRangeStorage(fail_every=1)
+    storage.put_bytes("obj", b"x" * 100)
+
+    with pytest.raises(StorageError):
+        download_bytes(storage, "obj", chunk_bytes=10, retries=2)
+
+
+def test_download_file_is_atomic(tmp_path: Path) -> None:
+    storage = FlakyRangeStorage(max_range_bytes=300)
+    data = _payload(5_000)
+    storage.put_bytes("obj", data)
+
+    dest = download_file(storage, "obj", tmp_path / "out" / "data.bin", chunk_bytes=1000)
+    assert dest.read_bytes() == data
+    assert not list(dest.parent.glob(".tmp-*"))
+
+
+def test_fetch_object_uses_threshold() -> None:
+    storage = FlakyRangeStorage()
+    storage.put_bytes("obj", b"y" * 100)
+
+    # Small objects: one ranged read, which also reports the size.
+    assert fetch_object(storage, "obj", threshold_bytes=1000) == b"y" * 100
+    assert storage.range_calls == 1
+
+    assert fetch_object(storage, "obj", threshold_bytes=0) == b"y" * 100
+    assert storage.gets == ["obj"]
+    assert storage.size_calls == 0
+
+
+def test_fetch_object_downloads_the_rest_in_chunks(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.download.DEFAULT_CHUNK_BYTES", 1024)
+    storage = FlakyRangeStorage()
+    data = _payload(10_000)
+    storage.put_bytes("obj", data)
+
+    out = fetch_object(storage, "obj", threshold_bytes=2048)
+    assert out == data and type(out) is bytes
+    assert storage.range_calls == 10 and storage.size_calls == 0
+
+
+def test_chunks_are_not_retried_over_backend_retries(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.download.time.sleep", lambda _: None)
+    storage = FlakyRangeStorage(fail_every=1)
+    storage.put_bytes("obj", b"x" * 100)
+    with pytest.raises(StorageError):
+        download_bytes(storage, "obj", chunk_bytes=100)
+    assert storage.range_calls == 4  # the first try and DEFAULT_CHUNK_RETRIES
+
+    storage.range_calls = 0
+    storage.retries_requests = True
+    with pytest.raises(StorageError):
+        download_bytes(storage, "obj", chunk_bytes=100)
+    assert storage.range_calls == 1
+
+
+def test_load_downloads_large_objects_in_parallel(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("OPENDATA_PARALLEL_DOWNLOAD_THRESHOLD", "1")
+    storage = FlakyRangeStorage()
+    dataset_id = "getopendata/download-test"
+    df = pd.DataFrame({"a": list(range(1000))})
+    publish_dataframe(
+        storage,
+        dataset_id=dataset_id,
+        df=df,
+        catalog={
+            "id": dataset_id,
+            "title": "Download",
+            "description": "Download test dataset",
+            "license": "MIT",
+            "repo": "https://github.com/example/repo",
+            "topics": ["test"],
+            "owners": ["test"],
+            "frequency": "daily",
+        },
+    )
+
+    pd.testing.assert_frame_equal(load(dataset_id, storage=storage), df)
+    assert data_key(dataset_id) not in storage.gets
+    assert storage.range_calls > 0
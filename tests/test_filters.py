@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from opendata.client import load
+from opendata.errors import ValidationError
+from opendata.filters import normalize_filters, prune_row_groups
+from opendata.ids import data_key
+from opendata.storage.memory import MemoryStorage
+from opendata.storage.ranged import RangeReader
+
+DATASET_ID = "getopendata/filter-test"
+
+
+class RangeCountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ranges: list[tuple[int, int]] = []
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        self.ranges.append((start, end))
+        return super().get_range(key, start, end)
+
+    def open_input_file(self, key: str) -> pa.NativeFile:
+        return pa.PythonFile(RangeReader(self, key), mode="r")
+
+
+def _series(n: int = 24 * 365) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2023-01-01", periods=n, freq="h", tz="UTC"),
+            "value": list(range(n)),
+            "note": [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)],
+        }
+    )
+
+
+def _publish(storage: MemoryStorage, df: pd.DataFrame) -> int:
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink, row_group_size=24 * 7)
+    data = sink.getvalue().to_pybytes()
+    storage.put_bytes(data_key(DATASET_ID), data)
+    return len(data)
+
+
+def test_load_start_end_fetches_only_matching_row_groups() -> None:
+    storage = RangeCountingStorage()
+    df = _series()
+    size = _publish(storage, df)
+
+    out = load(DATASET_ID, start="2023-06-01", end="2023-06-07", storage=storage)
+
+    mask = (df["time"] >= "2023-06-01") & (df["time"] < "2023-06-08")
+    pd.testing.assert_frame_equal(out, df[mask].reset_index(drop=True))
+    fetched = sum(end - start for start, end in storage.ranges)
+    assert fetched < size / 5
+
+
+def test_load_filters_combine_with_columns() -> None:
+    storage = RangeCountingStorage()
+    df = _series(1000)
+    _publish(storage, df)
+
+    out = load(
+        DATASET_ID,
+        columns=["note"],
+        filters=[[("value", "<", 3)], [("value", "in", [500, 999])]],
+        storage=storage,
+    )
+    assert list(out.columns) == ["note"]
+    assert list(out["note"]) == list(df["note"].iloc[[0, 1, 2, 500, 999]])
+
+
+def test_prune_row_groups_keeps_groups_without_proof() -> None:
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.table({"a": list(range(100))}), sink, row_group_size=10)
+    metadata = pq.ParquetFile(pa.BufferReader(sink.getvalue())).metadata
+    schema = pa.schema([("a", pa.int64())])
+
+    assert prune_row_groups(metadata, normalize_filters(schema, [("a", ">=", 95)])) == [9]
+    assert prune_row_groups(metadata, normalize_filters(schema, [("a", "!=", 5)])) == list(
+        range(10)
+    )
+    assert prune_row_groups(metadata, normalize_filters(schema, [("a", "in", [3, 42])])) == [0, 4]
+
+
+def test_normalize_filters_validates_terms() -> None:
+    schema = pa.schema([("a", pa.int64())])
+    with pytest.raises(ValidationError):
+        normalize_filters(schema, [("b", "=", 1)])
+    with pytest.raises(ValidationError):
+        normalize_filters(schema, [("a", "~", 1)])
+    with pytest.raises(ValidationError):
+        normalize_filters(schema, start="2024-01-01")
+
+
+def test_unknown_time_column_is_a_validation_error() -> None:
+    schema = pa.schema([("t", pa.timestamp("us"))])
+    with pytest.raises(ValidationError, match="unknown time_column: missing"):
+        normalize_filters(schema, end="2024-01-02", time_column="missing")
+
+    storage = MemoryStorage()
+    _publish(storage, _series(48))
+    with pytest.raises(ValidationError, match="unknown time_column"):
+        load(DATASET_ID, end="2024-01-02", time_column="missing", storage=storage)
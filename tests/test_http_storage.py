@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import json
 import socket
 import threading
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path, PurePosixPath
+from typing import Optional
 
 import pandas as pd
+import pytest
 
 from opendata.client import load
-from opendata.ids import data_key
+from opendata.download import fetch_object
+from opendata.errors import NotFoundError, StorageError
+from opendata.ids import data_key, latest_key, version_metadata_key
 from opendata.storage.http import HttpStorage
 
 
@@ -50,3 +56,255 @@ def test_http_storage_can_load_dataset(tmp_path: Path) -> None:
         pd.testing.assert_frame_equal(df_in, df_out)
     finally:
         httpd.shutdown()
+
+
+def _serve_with_ranges(
+    bucket_dir: Path, log: list[tuple[str, str]], heads: Optional[list[str]] = None
+) -> ThreadingHTTPServer:
+    class RangeHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            super().__init__(*args, directory=str(bucket_dir), **kwargs)
+
+        def log_message(self, format, *args):  # type: ignore[no-untyped-def]
+            return
+
+        def do_HEAD(self) -> None:
+            if heads is not None:
+                heads.append(self.path)
+            super().do_HEAD()
+
+        def do_GET(self) -> None:
+            range_header = self.headers.get("Range")
+            log.append((self.path, range_header or ""))
+            if not range_header:
+                super().do_GET()
+                return
+
+            path = Path(self.translate_path(self.path))
+            if not path.is_file():
+                self.send_error(404)
+                return
+            data = path.read_bytes()
+            start_s, end_s = range_header.removeprefix("bytes=").split("-", 1)
+            start, end = int(start_s), min(int(end_s), len(data) - 1)
+            body = data[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", _free_port()), RangeHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def test_http_storage_loads_column_subset_with_range_reads(tmp_path: Path) -> None:
+    bucket_dir = tmp_path / "bucket"
+
+    dataset_id = "getopendata/owid-covid-global-daily"
+    n = 50_000
+    df_in = pd.DataFrame(
+        {
+            "a": range(n),
+            "wide1": [f"text-{i}" * 4 for i in range(n)],
+            "wide2": [f"more-{i}" * 4 for i in range(n)],
+        }
+    )
+
+    key = data_key(dataset_id)
+    parquet_path = bucket_dir / Path(*PurePosixPath(key).parts)
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    df_in.to_parquet(parquet_path, index=False)
+
+    log: list[tuple[str, str]] = []
+    httpd = _serve_with_ranges(bucket_dir, log)
+    try:
+        port = httpd.server_address[1]
+        http_storage = HttpStorage(base_url=f"http://127.0.0.1:{port}/")
+        assert http_storage.size(key) == parquet_path.stat().st_size
+        assert http_storage.get_range(key, 0, 4) == b"PAR1"
+
+        df_out = load(dataset_id, columns=["a"], storage=http_storage)
+        pd.testing.assert_frame_equal(df_in[["a"]], df_out)
+    finally:
+        httpd.shutdown()
+
+    # Only the (missing) `latest.json` pointer is requested without a range.
+    data_log = [r for path, r in log if path.endswith("/data.parquet")]
+    ranged = [r for r in data_log if r]
+    assert ranged and len(ranged) == len(data_log)
+    fetched = 0
+    for r in ranged:
+        start_s, end_s = r.removeprefix("bytes=").split("-", 1)
+        fetched += int(end_s) - int(start_s) + 1
+    assert fetched < parquet_path.stat().st_size / 2
+
+
+def test_http_fetch_object_takes_the_size_from_content_range(tmp_path: Path) -> None:
+    data = bytes(range(256)) * 20
+    (tmp_path / "obj.bin").write_bytes(data)
+    log: list[tuple[str, str]] = []
+    heads: list[str] = []
+    httpd = _serve_with_ranges(tmp_path, log, heads)
+    try:
+        storage = HttpStorage(base_url=f"http://127.0.0.1:{httpd.server_address[1]}/")
+        assert fetch_object(storage, "obj.bin", threshold_bytes=1 << 20) == data
+        assert storage.get_range_and_size("obj.bin", 10, 20) == (data[10:20], len(data))
+    finally:
+        httpd.shutdown()
+
+    # One ranged GET per call; no HEAD to learn the size first.
+    assert [r for _, r in log] == ["bytes=0-1048575", "bytes=10-19"]
+    assert heads == []
+
+
+def _serve_with_etags(objects: dict[str, bytes], log: list[tuple[str, int]]) -> ThreadingHTTPServer:
+    class EtagHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # type: ignore[no-untyped-def]
+            return
+
+        def do_GET(self) -> None:
+            body = objects.get(self.path.lstrip("/"))
+            if body is None:
+                log.append((self.path, 404))
+                self.send_error(404)
+                return
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                log.append((self.path, 304))
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            log.append((self.path, 200))
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", _free_port()), EtagHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def test_http_storage_revalidates_with_etag() -> None:
+    objects = {"index.json": b'{"datasets":[]}'}
+    log: list[tuple[str, int]] = []
+    httpd = _serve_with_etags(objects, log)
+    try:
+        port = httpd.server_address[1]
+        storage = HttpStorage(base_url=f"http://127.0.0.1:{port}/")
+
+        assert storage.get_bytes("index.json") == b'{"datasets":[]}'
+        assert storage.get_bytes("index.json") == b'{"datasets":[]}'
+        objects["index.json"] = b'{"datasets":[{"id":"a/b"}]}'
+        assert storage.get_bytes("index.json") == b'{"datasets":[{"id":"a/b"}]}'
+    finally:
+        httpd.shutdown()
+
+    assert [status for _, status in log] == [200, 304, 200]
+
+
+def test_http_storage_ttl_follows_catalog_frequency() -> None:
+    meta_key = "datasets/getopendata/fred-unrate-monthly/metadata.json"
+    objects = {meta_key: json.dumps({"frequency": "monthly"}).encode("utf-8")}
+    log: list[tuple[str, int]] = []
+    httpd = _serve_with_etags(objects, log)
+    try:
+        port = httpd.server_address[1]
+        base_url = f"http://127.0.0.1:{port}/"
+
+        following = HttpStorage(base_url=base_url, follow_frequency=True)
+        following.get_bytes(meta_key)
+        following.get_bytes(meta_key)
+        assert len(log) == 1
+
+        plain = HttpStorage(base_url=base_url)
+        plain.get_bytes(meta_key)
+        plain.get_bytes(meta_key)
+        assert [status for _, status in log] == [200, 200, 304]
+    finally:
+        httpd.shutdown()
+
+
+def test_http_storage_ttl_applies_to_the_whole_dataset() -> None:
+    dataset_id = "getopendata/fred-unrate-monthly"
+    meta_key = version_metadata_key(dataset_id, "ab" * 32)
+    objects = {
+        meta_key: json.dumps({"frequency": "monthly"}).encode("utf-8"),
+        latest_key(dataset_id): b'{"version": "..."}',
+        "datasets/getopendata/other/latest.json": b"{}",
+    }
+    log: list[tuple[str, int]] = []
+    httpd = _serve_with_etags(objects, log)
+    try:
+        storage = HttpStorage(
+            base_url=f"http://127.0.0.1:{httpd.server_address[1]}/", follow_frequency=True
+        )
+        storage.get_bytes(latest_key(dataset_id))
+        storage.get_bytes(meta_key)
+        # Learned from `v/<sha>/metadata.json`, used for the dataset's pointer.
+        storage.get_bytes(latest_key(dataset_id))
+        storage.get_bytes("datasets/getopendata/other/latest.json")
+        storage.get_bytes("datasets/getopendata/other/latest.json")
+    finally:
+        httpd.shutdown()
+
+    assert [path.lstrip("/") for path, _ in log] == [
+        latest_key(dataset_id),
+        meta_key,
+        "datasets/getopendata/other/latest.json",
+        "datasets/getopendata/other/latest.json",
+    ]
+
+
+def test_http_storage_retries_server_errors_and_negotiates_encoding() -> None:
+    seen: list[tuple[str, str]] = []
+    failures = {"index.json": 2}
+
+    class FlakyHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # type: ignore[no-untyped-def]
+            return
+
+        def do_GET(self) -> None:
+            key = self.path.lstrip("/")
+            seen.append((key, self.headers.get("Accept-Encoding", "")))
+            if failures.get(key, 0) > 0:
+                failures[key] -= 1
+                self.send_error(503)
+                return
+            if key == "missing.json":
+                self.send_error(404)
+                return
+            body = b"{}" if key.endswith(".json") else b"PAR1"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", _free_port()), FlakyHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        port = httpd.server_address[1]
+        storage = HttpStorage(base_url=f"http://127.0.0.1:{port}/", backoff_base_s=0.0)
+        assert storage.get_bytes("index.json") == b"{}"
+        assert storage.get_bytes("data.parquet") == b"PAR1"
+
+        with pytest.raises(NotFoundError):
+            storage.get_bytes("missing.json")
+
+        failures["index.json"] = 10
+        no_retry = HttpStorage(
+            base_url=f"http://127.0.0.1:{port}/", revalidate=False, max_retries=1
+        )
+        with pytest.raises(StorageError):
+            no_retry.get_bytes("index.json")
+    finally:
+        httpd.shutdown()
+
+    assert [k for k, _ in seen[:4]] == ["index.json"] * 3 + ["data.parquet"]
+    assert seen[0][1] == "gzip"
+    assert seen[3][1] == "identity"
+    assert failures["index.json"] == 8
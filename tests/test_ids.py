@@ -3,7 +3,14 @@ from __future__ import annotations
 import pytest
 
 from opendata.errors import DatasetIdError
-from opendata.ids import data_key, metadata_key, readme_key, validate_dataset_id
+from opendata.ids import (
+    data_key,
+    key_dataset_prefix,
+    metadata_key,
+    readme_key,
+    validate_dataset_id,
+    version_metadata_key,
+)
 
 
 def test_validate_dataset_id_ok() -> None:
@@ -31,3 +38,11 @@ def test_key_layout() -> None:
     assert data_key(dataset_id) == "datasets/getopendata/us-stock-daily/data.parquet"
     assert metadata_key(dataset_id) == "datasets/getopendata/us-stock-daily/metadata.json"
     assert readme_key(dataset_id) == "datasets/getopendata/us-stock-daily/README.md"
+
+
+def test_key_dataset_prefix() -> None:
+    dataset_id = "getopendata/us-stock-daily"
+    prefix = "datasets/getopendata/us-stock-daily"
+    assert key_dataset_prefix(metadata_key(dataset_id)) == prefix
+    assert key_dataset_prefix(version_metadata_key(dataset_id, "ab" * 32)) == prefix
+    assert key_dataset_prefix("index.json") is None
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from opendata.ids import data_key, latest_key, manifest_key, metadata_key, version_metadata_key
+from opendata.info import info
+from opendata.publish import publish_dataframe
+from opendata.storage.memory import MemoryStorage
+
+
+class RangeOnlyStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.full_gets: list[str] = []
+        self.ranges: list[tuple[int, int]] = []
+
+    def get_bytes(self, key: str) -> bytes:
+        self.full_gets.append(key)
+        return super().get_bytes(key)
+
+    def size(self, key: str) -> int:
+        return len(self._objects[key])
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        self.ranges.append((start, end))
+        return self._objects[key][start:end]
+
+
+def test_info_reads_metadata_and_footer_only() -> None:
+    storage = RangeOnlyStorage()
+    dataset_id = "getopendata/info-test"
+    df = pd.DataFrame({"a": list(range(10_000)), "b": [None, "x"] * 5_000})
+    publish_dataframe(
+        storage,
+        dataset_id=dataset_id,
+        df=df,
+        catalog={
+            "id": dataset_id,
+            "title": "Info",
+            "description": "Info test dataset",
+            "license": "MIT",
+            "repo": "https://github.com/example/repo",
+            "topics": ["test"],
+            "owners": ["test"],
+            "frequency": "daily",
+        },
+    )
+
+    storage.full_gets.clear()
+    described = info(dataset_id, storage=storage)
+
+    # The pointer is read once and selects the version's metadata.
+    assert storage.full_gets == [
+        latest_key(dataset_id),
+        version_metadata_key(dataset_id, described.checksum_sha256),
+    ]
+    assert described.row_count == 10_000
+    assert described.column_names == ["a", "b"]
+    assert described.catalog["title"] == "Info"
+    assert described.checksum_sha256
+    a, b = described.columns
+    assert (a.min, a.max, a.null_count) == (0, 9_999, 0)
+    assert b.null_count == 5_000
+    assert a.compressed_bytes and a.uncompressed_bytes
+    assert sum(rg.num_rows for rg in described.row_groups) == 10_000
+    assert described.to_dict()["columns"][0]["max"] == 9_999
+
+
+def test_info_falls_back_to_footer_without_metadata() -> None:
+    storage = RangeOnlyStorage()
+    dataset_id = "getopendata/info-test"
+    sink = pa.BufferOutputStream()
+    table = pa.table({"t": pd.date_range("2024-01-01", periods=100, tz="UTC")})
+    pq.write_table(table, sink, row_group_size=30)
+    storage.put_bytes(data_key(dataset_id), sink.getvalue().to_pybytes())
+
+    described = info(dataset_id, storage=storage)
+
+    assert storage.full_gets == [
+        latest_key(dataset_id),
+        metadata_key(dataset_id),
+        manifest_key(dataset_id),
+    ]
+    assert described.row_count == 100
+    assert [rg.num_rows for rg in described.row_groups] == [30, 30, 30, 10]
+    assert described.columns[0].type.startswith("timestamp[")
+    assert described.columns[0].max == pd.Timestamp("2024-04-09", tz="UTC")
+    assert described.updated_at is None
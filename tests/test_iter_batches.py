@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import opendata as od
+from opendata.errors import ValidationError
+from opendata.ids import data_key
+from opendata.storage.memory import MemoryStorage
+
+
+def _put_parquet(storage: MemoryStorage, dataset_id: str, table: pa.Table) -> None:
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, row_group_size=1000)
+    storage.put_bytes(data_key(dataset_id), sink.getvalue().to_pybytes())
+
+
+def test_iter_batches_streams_row_groups_in_order() -> None:
+    storage = MemoryStorage()
+    dataset_id = "getopendata/stream-test"
+    table = pa.table({"a": list(range(3500)), "b": [str(i) for i in range(3500)]})
+    _put_parquet(storage, dataset_id, table)
+
+    batches = list(od.iter_batches(dataset_id, batch_size=400, storage=storage))
+
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    assert max(b.num_rows for b in batches) == 400
+    assert pa.Table.from_batches(batches).equals(table)
+
+
+def test_iter_batches_projects_columns() -> None:
+    storage = MemoryStorage()
+    dataset_id = "getopendata/stream-test"
+    table = pa.table({"a": list(range(2500)), "b": [str(i) for i in range(2500)]})
+    _put_parquet(storage, dataset_id, table)
+
+    batches = list(od.iter_batches(dataset_id, columns=["b"], storage=storage))
+
+    assert [b.num_rows for b in batches] == [1000, 1000, 500]
+    assert pa.Table.from_batches(batches).equals(table.select(["b"]))
+
+    with pytest.raises(ValidationError):
+        list(od.iter_batches(dataset_id, columns=["missing"], storage=storage))
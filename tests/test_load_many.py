@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+import opendata as od
+from opendata.errors import DatasetIdError, NotFoundError, OpendataError
+from opendata.publish import publish_dataframe
+from opendata.storage.memory import MemoryStorage
+
+
+def _catalog(dataset_id: str) -> dict[str, object]:
+    return {
+        "id": dataset_id,
+        "title": "Load many",
+        "description": "Load many test dataset",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["test"],
+        "owners": ["test"],
+        "frequency": "monthly",
+    }
+
+
+def test_load_many_collects_frames_and_errors() -> None:
+    storage = MemoryStorage()
+    frames_in = {}
+    for i, name in enumerate(
+        ["fred-cpi-u-monthly", "fred-fedfunds-monthly", "fred-unrate-monthly"]
+    ):
+        dataset_id = f"getopendata/{name}"
+        df = pd.DataFrame({"value": [float(i), float(i) + 0.5]})
+        publish_dataframe(storage, dataset_id=dataset_id, df=df, catalog=_catalog(dataset_id))
+        frames_in[dataset_id] = df
+
+    ids = [*frames_in, "getopendata/missing", "Not A Valid Id"]
+    result = od.load_many(ids, max_workers=4, storage=storage)
+
+    assert list(result.frames) == list(frames_in)
+    for dataset_id, df in frames_in.items():
+        pd.testing.assert_frame_equal(result.frames[dataset_id], df)
+
+    assert isinstance(result.errors["getopendata/missing"], NotFoundError)
+    assert isinstance(result.errors["Not A Valid Id"], DatasetIdError)
+
+    with pytest.raises(OpendataError, match="2 dataset"):
+        result.raise_for_errors()
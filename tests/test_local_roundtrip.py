@@ -3,8 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from opendata.client import load
+from opendata.errors import ValidationError
 from opendata.publish import publish_dataframe, publish_parquet_file
 from opendata.storage.memory import MemoryStorage
 
@@ -53,3 +56,56 @@ def test_publish_parquet_file_and_load_roundtrip(tmp_path: Path) -> None:
 
     df_out = load(dataset_id, storage=storage)
     pd.testing.assert_frame_equal(df_in, df_out)
+
+
+def test_load_column_subset() -> None:
+    storage = MemoryStorage()
+    dataset_id = "getopendata/us-stock-daily"
+    df_in = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.0, 2.0, 3.0]})
+    catalog = {
+        "id": dataset_id,
+        "title": "US Stock Daily",
+        "description": "Daily OHLCV bars for US stocks.",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["stocks"],
+        "owners": ["example"],
+        "frequency": "daily",
+    }
+    publish_dataframe(storage, dataset_id=dataset_id, df=df_in, catalog=catalog)
+
+    df_out = load(dataset_id, columns=["c", "a"], storage=storage)
+    pd.testing.assert_frame_equal(df_in[["c", "a"]], df_out)
+
+    with pytest.raises(ValidationError):
+        load(dataset_id, columns=["missing"], storage=storage)
+
+
+def test_load_return_types() -> None:
+    storage = MemoryStorage()
+    dataset_id = "getopendata/us-stock-daily"
+    df_in = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    catalog = {
+        "id": dataset_id,
+        "title": "US Stock Daily",
+        "description": "Daily OHLCV bars for US stocks.",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["stocks"],
+        "owners": ["example"],
+        "frequency": "daily",
+    }
+    publish_dataframe(storage, dataset_id=dataset_id, df=df_in, catalog=catalog)
+
+    table = load(dataset_id, return_type="arrow", storage=storage)
+    assert isinstance(table, pa.Table)
+    assert table.column("a").to_pylist() == [1, 2, 3]
+
+    df_arrow = load(dataset_id, return_type="pandas-arrow", storage=storage)
+    assert all(isinstance(t, pd.ArrowDtype) for t in df_arrow.dtypes)
+    assert df_arrow["b"].tolist() == ["x", "y", "z"]
+
+    pd.testing.assert_frame_equal(load(dataset_id, return_type="pandas", storage=storage), df_in)
+
+    with pytest.raises(ValidationError):
+        load(dataset_id, return_type="polars", storage=storage)
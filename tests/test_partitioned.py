@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from opendata.cache import DiskCache
+from opendata.client import load
+from opendata.errors import ValidationError
+from opendata.ids import latest_key, manifest_key, metadata_key
+from opendata.info import info
+from opendata.publish import publish_dataframe, publish_partitioned
+from opendata.storage.memory import MemoryStorage
+
+DATASET_ID = "getopendata/partitioned-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Partitioned",
+    "description": "Partitioned layout test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "daily",
+}
+
+
+class RecordingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[str] = []
+        self.puts: list[str] = []
+
+    def get_bytes(self, key: str) -> bytes:
+        self.reads.append(key)
+        return super().get_bytes(key)
+
+    def size(self, key: str) -> int:
+        return len(super().get_bytes(key))
+
+    def put_bytes(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> None:
+        self.puts.append(key)
+        super().put_bytes(key, data, content_type=content_type)
+
+
+def _table(days: int = 3) -> pa.Table:
+    ts = pd.date_range("2024-01-01", periods=days * 24, freq="h", tz="UTC")
+    df = pd.DataFrame({"open_time": ts, "close": [float(i) for i in range(len(ts))]})
+    # Producers emit rows in API order, not time order.
+    return pa.Table.from_pandas(df.iloc[::-1], preserve_index=False)
+
+
+def _part_keys(keys: list[str]) -> list[str]:
+    return [k for k in keys if "/part/" in k]
+
+
+def test_publish_writes_one_file_per_day_and_manifest() -> None:
+    storage = RecordingStorage()
+    published = publish_partitioned(storage, dataset_id=DATASET_ID, table=_table(), catalog=CATALOG)
+
+    manifest = json.loads(storage.get_bytes(manifest_key(DATASET_ID)))
+    assert [f["partition"] for f in manifest["files"]] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    first = manifest["files"][0]
+    assert first["path"].startswith("part/date=2024-01-01/part-")
+    assert first["row_count"] == 24
+    assert first["min"] == "2024-01-01T00:00:00+00:00"
+    assert first["max"] == "2024-01-01T23:00:00+00:00"
+    assert manifest["partition_column"] == "open_time"
+    assert manifest["row_count"] == 72
+
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert meta["row_count"] == 72
+    assert meta["data_size_bytes"] == sum(f["size_bytes"] for f in manifest["files"])
+    assert published.data_key == manifest_key(DATASET_ID)
+    assert info(DATASET_ID, storage=storage).row_count == 72
+
+
+def test_load_reads_partitions_and_prunes_on_start_end() -> None:
+    storage = RecordingStorage()
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=_table(), catalog=CATALOG)
+
+    full = load(DATASET_ID, return_type="arrow", storage=storage)
+    assert full.num_rows == 72
+    days = [ts.date() for ts in full.column("open_time").to_pylist()]
+    assert days == sorted(days)
+
+    storage.reads.clear()
+    df = load(DATASET_ID, start="2024-01-02", end="2024-01-02", storage=storage)
+    assert len(df) == 24
+    assert {ts.date().isoformat() for ts in df["open_time"]} == {"2024-01-02"}
+    # One footer read for the schema, plus the matching partition only.
+    assert {k.split("/")[-2] for k in _part_keys(storage.reads)} <= {
+        "date=2024-01-01",
+        "date=2024-01-02",
+    }
+    assert not any("date=2024-01-03" in k for k in storage.reads)
+
+    empty = load(DATASET_ID, start="2025-01-01", columns=["close"], storage=storage)
+    assert list(empty.columns) == ["close"] and len(empty) == 0
+
+
+def test_load_partitioned_through_cache(tmp_path: Path) -> None:
+    storage = RecordingStorage()
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=_table(), catalog=CATALOG)
+    cache = DiskCache(tmp_path / "cache")
+
+    assert len(load(DATASET_ID, storage=storage, cache=cache)) == 72
+    storage.reads.clear()
+    assert len(load(DATASET_ID, storage=storage, cache=cache)) == 72
+    assert _part_keys(storage.reads) == []
+
+
+def test_republish_uploads_only_changed_partitions() -> None:
+    storage = RecordingStorage()
+    table = _table()
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=table, catalog=CATALOG)
+
+    storage.puts.clear()
+    again = publish_partitioned(storage, dataset_id=DATASET_ID, table=table, catalog=CATALOG)
+    assert again.unchanged and storage.puts == []
+
+    # A new day appended: only its file, the manifest and metadata are written.
+    storage.puts.clear()
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=_table(days=4), catalog=CATALOG)
+    assert [k.split("/")[-2] for k in _part_keys(storage.puts)] == ["date=2024-01-04"]
+    assert manifest_key(DATASET_ID) in storage.puts
+
+
+def test_switching_to_partitioned_removes_single_file() -> None:
+    storage = RecordingStorage()
+    publish_dataframe(storage, dataset_id=DATASET_ID, df=_table().to_pandas(), catalog=CATALOG)
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=_table(days=2), catalog=CATALOG)
+
+    assert not storage.exists(latest_key(DATASET_ID))
+    assert len(load(DATASET_ID, storage=storage)) == 48
+
+
+def test_partition_column_validation() -> None:
+    table = pa.table({"x": [1, 2]})
+    with pytest.raises(ValidationError, match="partition_column"):
+        publish_partitioned(MemoryStorage(), dataset_id=DATASET_ID, table=table, catalog=CATALOG)
+    with pytest.raises(ValidationError, match="timestamp or date"):
+        publish_partitioned(
+            MemoryStorage(),
+            dataset_id=DATASET_ID,
+            table=table,
+            partition_column="x",
+            catalog=CATALOG,
+        )
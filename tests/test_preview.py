@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+
+from opendata.ids import metadata_key, preview_key, version_preview_key
+from opendata.info import info
+from opendata.preview import table_preview
+from opendata.publish import publish_dataframe
+from opendata.storage.memory import MemoryStorage
+
+DATASET_ID = "getopendata/preview-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Preview",
+    "description": "Preview test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "daily",
+}
+
+
+def test_table_preview_converts_columns() -> None:
+    table = pa.table(
+        {
+            "t": pa.array(
+                [dt.datetime(2024, 1, 1, 12, 0), None], type=pa.timestamp("ms", tz="UTC")
+            ),
+            "t_us": pa.array(
+                [dt.datetime(2024, 1, 1, 0, 0, 0, 500000), dt.datetime(2024, 1, 2)],
+                type=pa.timestamp("us"),
+            ),
+            "d": pa.array([dt.date(2024, 1, 1), dt.date(2024, 1, 2)]),
+            "cat": pa.array(["x", "y"]).dictionary_encode(),
+            "dec": pa.array([Decimal("1.50"), None], type=pa.decimal128(5, 2)),
+            "b": pa.array([b"ab", None]),
+            "n": [1.5, None],
+        }
+    )
+    preview = table_preview(table, max_rows=10)
+
+    assert preview["columns"] == ["t", "t_us", "d", "cat", "dec", "b", "n"]
+    assert preview["rows"] == [
+        {
+            "t": "2024-01-01T12:00:00+00:00",
+            "t_us": "2024-01-01T00:00:00.500000",
+            "d": "2024-01-01",
+            "cat": "x",
+            "dec": "1.50",
+            "b": "b'ab'",
+            "n": 1.5,
+        },
+        {
+            "t": None,
+            "t_us": "2024-01-02T00:00:00.000000",
+            "d": "2024-01-02",
+            "cat": "y",
+            "dec": None,
+            "b": None,
+            "n": None,
+        },
+    ]
+
+
+def test_table_preview_respects_byte_budget() -> None:
+    table = pa.table({"s": ["x" * 100] * 50, "q": ['"\\' * 20] * 50})
+
+    assert len(table_preview(table, max_rows=10, max_bytes=None)["rows"]) == 10
+    rows = table_preview(table, max_rows=50, max_bytes=1000)["rows"]
+    assert 0 < len(rows) < 50
+    assert len(json.dumps(rows, separators=(",", ":"))) <= 1000
+    assert table_preview(table, max_rows=50, max_bytes=10)["rows"] == []
+
+
+def test_separate_preview_is_written_to_preview_json() -> None:
+    storage = MemoryStorage()
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    published = publish_dataframe(
+        storage, dataset_id=DATASET_ID, df=df, catalog=CATALOG, separate_preview=True
+    )
+
+    # Like the metadata, the preview belongs to a version.
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert "preview" not in meta
+    assert meta["preview_path"] == f"v/{published.checksum_sha256}/preview.json"
+    assert not storage.exists(preview_key(DATASET_ID))
+    preview = json.loads(
+        storage.get_bytes(version_preview_key(DATASET_ID, published.checksum_sha256))
+    )
+    assert preview["rows"] == [{"a": 1}, {"a": 2}, {"a": 3}]
+    assert "preview_path" not in info(DATASET_ID, storage=storage).catalog
+
+    puts: list[str] = []
+    put_bytes = storage.put_bytes
+
+    def record(key, data, **kwargs):  # type: ignore[no-untyped-def]
+        puts.append(key)
+        return put_bytes(key, data, **kwargs)
+
+    storage.put_bytes = record  # type: ignore[method-assign]
+    republished = publish_dataframe(
+        storage, dataset_id=DATASET_ID, df=df, catalog=CATALOG, separate_preview=True
+    )
+    assert republished.unchanged and puts == []
+
+
+def test_switching_to_separate_preview_writes_preview_json() -> None:
+    storage = MemoryStorage()
+    df = pd.DataFrame({"a": [1, 2]})
+    published = publish_dataframe(storage, dataset_id=DATASET_ID, df=df, catalog=CATALOG)
+    key = version_preview_key(DATASET_ID, published.checksum_sha256)
+    assert not storage.exists(key)
+
+    publish_dataframe(storage, dataset_id=DATASET_ID, df=df, catalog=CATALOG, separate_preview=True)
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert meta["preview_path"] == f"v/{published.checksum_sha256}/preview.json"
+    assert json.loads(storage.get_bytes(key))["rows"] == [{"a": 1}, {"a": 2}]
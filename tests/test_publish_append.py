@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from opendata.append import compact_appended, publish_append
+from opendata.cli import main
+from opendata.client import iter_batches, load
+from opendata.errors import ValidationError
+from opendata.ids import (
+    data_key,
+    latest_key,
+    manifest_key,
+    metadata_key,
+    version_metadata_key,
+)
+from opendata.publish import publish_dataframe
+from opendata.storage.memory import MemoryStorage, reset_memory_storage
+from opendata.versions import gc_versions
+
+DATASET_ID = "getopendata/append-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Append",
+    "description": "Append test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "hourly",
+}
+
+
+class PutRecordingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.puts: dict[str, int] = {}
+
+    def put_bytes(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> None:
+        self.puts[key] = len(data)
+        super().put_bytes(key, data, content_type=content_type)
+
+
+def _window(start: int, hours: int = 24) -> pa.Table:
+    ts = pd.date_range("2024-01-01", periods=start + hours, freq="h", tz="UTC")[start:]
+    df = pd.DataFrame(
+        {
+            "open_time": ts,
+            "symbol": "BTCUSDT",
+            "close": [float(i) for i in range(start, start + hours)],
+        }
+    )
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _manifest(storage: MemoryStorage) -> dict[str, object]:
+    return json.loads(storage.get_bytes(manifest_key(DATASET_ID)))
+
+
+def _append(storage: MemoryStorage, table: pa.Table, **kwargs: object):  # type: ignore[no-untyped-def]
+    return publish_append(
+        storage,
+        dataset_id=DATASET_ID,
+        table=table,
+        key_columns=["open_time", "symbol"],
+        catalog=CATALOG,
+        **kwargs,
+    )
+
+
+def test_append_uploads_only_new_rows_as_delta() -> None:
+    storage = PutRecordingStorage()
+    _append(storage, _window(0))
+    assert [f["partition"] for f in _manifest(storage)["files"]] == ["base"]
+
+    # The next run re-fetches an overlapping 24h window with 2 new hours.
+    storage.puts.clear()
+    published = _append(storage, _window(2))
+    files = _manifest(storage)["files"]
+    assert [f["partition"] for f in files] == ["base", "delta"]
+    assert files[1]["row_count"] == 2
+    delta_puts = [k for k in storage.puts if "/part/" in k]
+    assert delta_puts == [f"datasets/getopendata/append-test/{files[1]['path']}"]
+    assert published.row_count == 26
+
+    df = load(DATASET_ID, storage=storage)
+    assert df["close"].tolist() == [float(i) for i in range(26)]
+
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert meta["row_count"] == 26
+    assert meta["stats"]["close"]["max"] == 25.0
+
+    # Nothing new: nothing is written.
+    storage.puts.clear()
+    assert _append(storage, _window(2)).unchanged
+    assert storage.puts == {}
+
+
+def test_append_dedupes_within_batch_keeping_last() -> None:
+    storage = MemoryStorage()
+    table = _window(0, hours=3)
+    dup = table.slice(1, 1).set_column(2, "close", pa.array([99.0]))
+    _append(storage, pa.concat_tables([table, dup]))
+
+    df = load(DATASET_ID, storage=storage)
+    assert df["close"].tolist() == [0.0, 2.0, 99.0]
+
+
+def test_compaction_merges_deltas_into_base() -> None:
+    storage = MemoryStorage()
+    _append(storage, _window(0))
+    for start in (1, 2, 3):
+        _append(storage, _window(start), compact_max_deltas=2)
+
+    files = _manifest(storage)["files"]
+    assert [f["partition"] for f in files] == ["base"]
+    assert files[0]["row_count"] == 27
+    # Superseded base/delta files stay for readers of the old manifest until gc.
+    part_keys = [k for k in storage._objects if "/part/" in k]
+    assert len(part_keys) == 4
+    assert len(load(DATASET_ID, storage=storage)) == 27
+    assert len(gc_versions(storage, DATASET_ID)) == 3
+    assert [k for k in storage._objects if "/part/" in k] == [
+        f"datasets/{DATASET_ID}/{files[0]['path']}"
+    ]
+    assert len(load(DATASET_ID, storage=storage)) == 27
+
+    _append(storage, _window(4))
+    compact_appended(storage, dataset_id=DATASET_ID, catalog=CATALOG)
+    assert [f["partition"] for f in _manifest(storage)["files"]] == ["base"]
+    assert load(DATASET_ID, storage=storage)["close"].tolist() == [float(i) for i in range(28)]
+
+
+def test_append_adopts_single_file_dataset() -> None:
+    storage = MemoryStorage()
+    publish_dataframe(storage, dataset_id=DATASET_ID, df=_window(0).to_pandas(), catalog=CATALOG)
+    _append(storage, _window(1))
+
+    assert not storage.exists(latest_key(DATASET_ID))
+    assert _manifest(storage)["key_columns"] == ["open_time", "symbol"]
+    assert len(load(DATASET_ID, storage=storage)) == 25
+    assert len(gc_versions(storage, DATASET_ID)) == 2  # data.parquet and metadata.json
+
+
+def test_append_leaves_adopted_legacy_file_for_gc() -> None:
+    storage = MemoryStorage()
+    legacy = publish_dataframe(
+        storage, dataset_id=DATASET_ID, df=_window(0).to_pandas(), catalog=CATALOG
+    )
+    storage.put_bytes(data_key(DATASET_ID), storage.get_bytes(legacy.data_key))
+    storage.delete(latest_key(DATASET_ID))
+    storage.delete(legacy.data_key)
+    storage.delete(version_metadata_key(DATASET_ID, legacy.checksum_sha256))
+    _append(storage, _window(1))
+
+    # The manifest wins over the superseded data.parquet until gc deletes it.
+    assert storage.exists(data_key(DATASET_ID))
+    assert len(load(DATASET_ID, storage=storage)) == 25
+    assert gc_versions(storage, DATASET_ID) == [data_key(DATASET_ID)]
+    assert len(load(DATASET_ID, storage=storage)) == 25
+
+
+def test_append_validation() -> None:
+    storage = MemoryStorage()
+    with pytest.raises(ValidationError, match="key_columns"):
+        publish_append(
+            storage, dataset_id=DATASET_ID, table=_window(0), key_columns=[], catalog=CATALOG
+        )
+    _append(storage, _window(0))
+    with pytest.raises(ValidationError, match="key_columns must match"):
+        publish_append(
+            storage,
+            dataset_id=DATASET_ID,
+            table=_window(1),
+            key_columns=["open_time"],
+            catalog=CATALOG,
+        )
+    with pytest.raises(ValidationError, match="schema"):
+        _append(storage, _window(1).append_column("extra", pa.array([1] * 24)))
+
+
+def test_appended_dataset_streams_and_downloads(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("OPENDATA_STORAGE", "memory")
+    storage = reset_memory_storage()
+    _append(storage, _window(0))
+    _append(storage, _window(24))
+    expected = load(DATASET_ID, storage=storage, return_type="arrow")
+
+    # Each file in the manifest is streamed in turn, in manifest order.
+    batches = list(iter_batches(DATASET_ID, batch_size=10, storage=storage))
+    assert max(b.num_rows for b in batches) == 10
+    assert pa.Table.from_batches(batches).to_pydict() == expected.to_pydict()
+    closes = [b.num_rows for b in iter_batches(DATASET_ID, columns=["close"], storage=storage)]
+    assert sum(closes) == 48
+
+    out = tmp_path / "append-test"
+    assert main(["download", DATASET_ID, "--out", str(out)]) == 0
+    files = sorted(out.rglob("*.parquet"))
+    assert len(files) == len(_manifest(storage)["files"]) == 2
+    assert sum(pq.read_metadata(f).num_rows for f in files) == 48
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Iterator
+from typing import IO, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from opendata.errors import ValidationError
+from opendata.hashing import sha256_bytes
+from opendata.ids import metadata_key, version_data_key
+from opendata.publish import publish_batches
+from opendata.storage.memory import MemoryStorage
+
+DATASET_ID = "getopendata/batch-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Batches",
+    "description": "Streaming publish test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "daily",
+}
+SCHEMA = pa.schema([("a", pa.int64()), ("b", pa.string())])
+
+
+class StreamRecordingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.streamed: list[str] = []
+
+    def put_stream(
+        self, key: str, stream: IO[bytes], *, content_type: Optional[str] = None
+    ) -> None:
+        self.streamed.append(key)
+        super().put_stream(key, stream, content_type=content_type)
+
+
+def _batches(n: int, size: int) -> Iterator[pa.RecordBatch]:
+    for i in range(n):
+        start = i * size
+        yield pa.record_batch(
+            [pa.array(range(start, start + size)), pa.array([f"v{j}" for j in range(size)])],
+            schema=SCHEMA,
+        )
+
+
+def test_publish_batches_streams_and_computes_metadata() -> None:
+    storage = StreamRecordingStorage()
+
+    published = publish_batches(
+        storage,
+        dataset_id=DATASET_ID,
+        batches=_batches(50, 100),
+        schema=SCHEMA,
+        preview_rows=150,
+        row_group_size=1_000,
+        spool_max_bytes=1024,
+        catalog=CATALOG,
+    )
+
+    assert published.data_key == version_data_key(DATASET_ID, published.checksum_sha256)
+    assert storage.streamed == [published.data_key]
+    data = storage.get_bytes(published.data_key)
+    assert published.checksum_sha256 == sha256_bytes(data)
+    assert published.data_size_bytes == len(data)
+    assert published.row_count == 5_000
+
+    pf = pq.ParquetFile(io.BytesIO(data))
+    assert pf.num_row_groups == 5
+    assert pf.read().column("a").to_pylist() == list(range(5_000))
+
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert meta["columns"] == [{"name": "a", "type": "int64"}, {"name": "b", "type": "string"}]
+    assert len(meta["preview"]["rows"]) == 150
+    assert meta["preview"]["rows"][149] == {"a": 149, "b": "v49"}
+
+
+def test_publish_batches_rejects_mismatched_schema() -> None:
+    storage = MemoryStorage()
+    bad = pa.record_batch([pa.array([1.5])], names=["a"])
+
+    with pytest.raises(ValidationError):
+        publish_batches(
+            storage, dataset_id=DATASET_ID, batches=[bad], schema=SCHEMA, catalog=CATALOG
+        )
+    assert storage.list_keys("datasets/") == []
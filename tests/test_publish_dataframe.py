@@ -4,7 +4,7 @@ import json
 
 import pandas as pd
 
-from opendata.ids import data_key
+from opendata.ids import version_data_key
 from opendata.publish import publish_dataframe
 from opendata.storage.memory import MemoryStorage
 
@@ -35,7 +35,8 @@ def test_publish_dataframe_writes_objects() -> None:
         catalog=catalog,
     )
 
-    assert published.data_key == data_key(dataset_id)
+    assert published.data_key == version_data_key(dataset_id, published.checksum_sha256)
+    assert storage.exists(published.data_key)
 
     meta = json.loads(storage.get_bytes(published.metadata_key))
     assert meta["dataset_id"] == dataset_id
@@ -4,7 +4,7 @@ import json
 import sys
 from pathlib import Path
 
-from opendata.ids import data_key, metadata_key
+from opendata.ids import latest_key, metadata_key
 from opendata.storage.memory import get_memory_storage, reset_memory_storage
 
 
@@ -81,7 +81,7 @@ raise SystemExit(1)
     assert rc == 0
 
     storage = get_memory_storage()
-    assert storage.exists(data_key("alice/ok-dataset"))
+    assert storage.exists(latest_key("alice/ok-dataset"))
     assert storage.exists(metadata_key("alice/ok-dataset"))
 
     index = json.loads(storage.get_bytes("index.json"))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import IO, Optional
+
+import pandas as pd
+
+from opendata.hashing import sha256_file
+from opendata.ids import latest_key, metadata_key, version_data_key, version_metadata_key
+from opendata.publish import publish_dataframe, publish_parquet_file
+from opendata.storage.memory import MemoryStorage
+from opendata.versions import load_latest
+
+DATASET_ID = "getopendata/unchanged-test"
+
+
+class PutRecordingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.puts: list[str] = []
+
+    def put_bytes(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> None:
+        self.puts.append(key)
+        super().put_bytes(key, data, content_type=content_type)
+
+    def put_stream(
+        self, key: str, stream: IO[bytes], *, content_type: Optional[str] = None
+    ) -> None:
+        self.puts.append(f"stream:{key}")
+        super().put_bytes(key, stream.read(), content_type=content_type)
+
+
+def _catalog(title: str = "Unchanged") -> dict[str, object]:
+    return {
+        "id": DATASET_ID,
+        "title": title,
+        "description": "Skip-unchanged test dataset",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["test"],
+        "owners": ["test"],
+        "frequency": "daily",
+    }
+
+
+def _publish(storage: MemoryStorage, df: pd.DataFrame, **kwargs: object):  # type: ignore[no-untyped-def]
+    return publish_dataframe(storage, dataset_id=DATASET_ID, df=df, catalog=_catalog(), **kwargs)
+
+
+def test_republishing_identical_data_skips_all_writes() -> None:
+    storage = PutRecordingStorage()
+    df = pd.DataFrame({"a": [1.0, float("nan")], "b": ["x", "y"]})
+
+    first = _publish(storage, df, updated_at="2024-01-01T00:00:00+00:00")
+    storage.puts.clear()
+    second = _publish(storage, df, updated_at="2024-01-02T00:00:00+00:00")
+
+    assert storage.puts == []
+    assert second.unchanged and not first.unchanged
+    assert second.updated_at == "2024-01-01T00:00:00+00:00"
+
+
+def test_refresh_checked_at_rewrites_only_metadata() -> None:
+    storage = PutRecordingStorage()
+    df = pd.DataFrame({"a": [1, 2]})
+
+    _publish(storage, df, updated_at="2024-01-01T00:00:00+00:00")
+    storage.puts.clear()
+    published = _publish(storage, df, refresh_checked_at=True)
+
+    version_meta = version_metadata_key(DATASET_ID, published.checksum_sha256)
+    assert storage.puts == [version_meta, metadata_key(DATASET_ID)]
+    assert storage.get_bytes(version_meta) == storage.get_bytes(metadata_key(DATASET_ID))
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert meta["updated_at"] == "2024-01-01T00:00:00+00:00"
+    assert meta["checked_at"] == published.checked_at
+
+
+def test_changed_data_or_catalog_is_written() -> None:
+    storage = PutRecordingStorage()
+    first = _publish(storage, pd.DataFrame({"a": [1, 2]}))
+
+    storage.puts.clear()
+    publish_dataframe(
+        storage,
+        dataset_id=DATASET_ID,
+        df=pd.DataFrame({"a": [1, 2]}),
+        catalog=_catalog("Renamed"),
+    )
+    version_meta = version_metadata_key(DATASET_ID, first.checksum_sha256)
+    assert storage.puts == [version_meta, metadata_key(DATASET_ID)]
+
+    storage.puts.clear()
+    changed = _publish(storage, pd.DataFrame({"a": [3]}))
+    # Data and version metadata first, then the pointer, then the stable copy.
+    expected = [
+        f"stream:{changed.data_key}",
+        version_metadata_key(DATASET_ID, changed.checksum_sha256),
+        latest_key(DATASET_ID),
+        metadata_key(DATASET_ID),
+    ]
+    assert storage.puts == expected
+
+    storage.puts.clear()
+    _publish(storage, pd.DataFrame({"a": [3]}), skip_unchanged=False)
+    assert storage.puts == expected
+
+
+def test_publish_parquet_file_uploads_a_new_version(tmp_path: Path) -> None:
+    storage = PutRecordingStorage()
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"a": [1, 2, 3]}).to_parquet(path, index=False)
+
+    published = publish_parquet_file(
+        storage, dataset_id=DATASET_ID, parquet_path=path, catalog=_catalog()
+    )
+    first_key = version_data_key(DATASET_ID, sha256_file(path))
+    assert published.data_key == first_key
+    assert storage.puts == [
+        f"stream:{first_key}",
+        version_metadata_key(DATASET_ID, sha256_file(path)),
+        latest_key(DATASET_ID),
+        metadata_key(DATASET_ID),
+    ]
+    assert storage.get_bytes(first_key) == path.read_bytes()
+
+    storage.puts.clear()
+    again = publish_parquet_file(
+        storage, dataset_id=DATASET_ID, parquet_path=path, catalog=_catalog()
+    )
+    assert again.unchanged
+    assert storage.puts == []
+
+    pd.DataFrame({"a": [4, 5, 6]}).to_parquet(path, index=False)
+    changed = publish_parquet_file(
+        storage, dataset_id=DATASET_ID, parquet_path=path, catalog=_catalog()
+    )
+    assert not changed.unchanged
+    assert changed.data_key == version_data_key(DATASET_ID, sha256_file(path))
+    assert storage.get_bytes(changed.data_key) == path.read_bytes()
+    # The previous version stays readable until garbage-collected.
+    assert storage.exists(first_key)
+    pointer = load_latest(storage, DATASET_ID)
+    assert pointer is not None
+    assert pointer.data_key == changed.data_key
+    assert [h["version"] for h in pointer.history] == [published.checksum_sha256]
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import io
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from opendata.errors import StorageError
+from opendata.ids import (
+    IMMUTABLE_CACHE_CONTROL,
+    POINTER_CACHE_CONTROL,
+    latest_key,
+    metadata_key,
+    version_data_key,
+)
+from opendata.storage.r2 import MIN_PART_SIZE_BYTES, R2Config, R2Storage
+
+PART = MIN_PART_SIZE_BYTES
+
+
+class FakeS3Client:
+    """Just enough of the boto3 S3 client for uploads."""
+
+    def __init__(self, *, fail_part: int = 0, fail_times: int = 0) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.cache_control: dict[str, Any] = {}
+        self.put_calls = 0
+        self.fail_part = fail_part
+        self.fail_times = fail_times
+        self._lock = threading.Lock()
+
+    def put_object(self, *, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> dict[str, Any]:
+        self.put_calls += 1
+        self.cache_control[Key] = kwargs.get("CacheControl")
+        self.objects[Key] = Body if isinstance(Body, bytes) else Body.read()
+        return {}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, **kwargs: Any) -> dict[str, Any]:
+        self.cache_control[Key] = kwargs.get("CacheControl")
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict[str, Any]:
+        with self._lock:
+            if PartNumber == self.fail_part and self.fail_times > 0:
+                self.fail_times -= 1
+                raise ConnectionError("reset")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict[str, Any]
+    ) -> dict[str, Any]:
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        assert numbers == sorted(self.uploads[UploadId])
+        self.objects[Key] = b"".join(self.uploads[UploadId][n] for n in numbers)
+        return {}
+
+    def get_paginator(self, name: str) -> Any:
+        assert name == "list_objects_v2"
+        objects = self.objects
+
+        class _Paginator:
+            def paginate(self, *, Bucket: str, Prefix: str) -> list[dict[str, Any]]:
+                keys = sorted(k for k in objects if k.startswith(Prefix))
+                # One key per page, to exercise pagination.
+                return [{"Contents": [{"Key": k}]} for k in keys] + [{"KeyCount": 0}]
+
+        return _Paginator()
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> dict[str, Any]:
+        self.aborted.append(UploadId)
+        return {}
+
+
+def _storage(client: FakeS3Client, **kwargs: Any) -> R2Storage:
+    cfg = R2Config(
+        endpoint_url="https://example.invalid",
+        bucket="bucket",
+        access_key_id="id",
+        secret_access_key="secret",
+        multipart_threshold_bytes=2 * PART,
+        part_size_bytes=PART,
+        part_retries=2,
+        **kwargs,
+    )
+    return R2Storage(cfg, client=client)
+
+
+def _payload(n: int) -> bytes:
+    return bytes(i % 251 for i in range(n))
+
+
+def test_small_streams_use_a_single_put() -> None:
+    client = FakeS3Client()
+    _storage(client).put_stream("k", io.BytesIO(b"abc"))
+
+    assert client.objects["k"] == b"abc"
+    assert client.put_calls == 1
+    assert client.uploads == {}
+
+
+def test_large_streams_upload_parts_and_retry_failed_parts(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.storage.r2.time.sleep", lambda _: None)
+    client = FakeS3Client(fail_part=2, fail_times=2)
+    data = _payload(3 * PART + 123)
+
+    _storage(client).put_stream("k", io.BytesIO(data))
+
+    assert client.objects["k"] == data
+    assert client.put_calls == 0
+    assert [len(p) for p in client.uploads["upload-0"].values()] == [PART, PART, PART, 123]
+    assert client.aborted == []
+
+
+def test_put_file_aborts_when_a_part_keeps_failing(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.storage.r2.time.sleep", lambda _: None)
+    client = FakeS3Client(fail_part=1, fail_times=10)
+    path = tmp_path / "data.parquet"
+    path.write_bytes(_payload(2 * PART + 1))
+
+    with pytest.raises(StorageError):
+        _storage(client, upload_workers=2).put_file("k", path)
+
+    assert client.aborted == ["upload-0"]
+    assert "k" not in client.objects
+
+
+def test_versioned_keys_are_uploaded_as_immutable(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr("opendata.storage.r2.time.sleep", lambda _: None)
+    client = FakeS3Client()
+    storage = _storage(client)
+    versioned = version_data_key("getopendata/r2-test", "0" * 64)
+
+    storage.put_bytes(versioned, b"small")
+    storage.put_stream(f"{versioned}.big", io.BytesIO(_payload(2 * PART + 1)))
+    storage.put_bytes(latest_key("getopendata/r2-test"), b"{}")
+    storage.put_bytes(metadata_key("getopendata/r2-test"), b"{}")
+
+    assert client.cache_control == {
+        versioned: IMMUTABLE_CACHE_CONTROL,
+        f"{versioned}.big": IMMUTABLE_CACHE_CONTROL,
+        latest_key("getopendata/r2-test"): POINTER_CACHE_CONTROL,
+        metadata_key("getopendata/r2-test"): None,
+    }
+    assert storage.list_keys("datasets/getopendata/r2-test/v/") == [
+        versioned,
+        f"{versioned}.big",
+    ]
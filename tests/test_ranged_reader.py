@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from opendata.storage.memory import MemoryStorage
+from opendata.storage.ranged import RangeReader
+
+
+class RangeCountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ranges: list[tuple[int, int]] = []
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        self.ranges.append((start, end))
+        return super().get_range(key, start, end)
+
+    def open_input_file(self, key: str) -> pa.NativeFile:
+        return pa.PythonFile(RangeReader(self, key), mode="r")
+
+
+def test_range_reader_coalesces_small_adjacent_reads() -> None:
+    storage = RangeCountingStorage()
+    data = bytes(range(256)) * 1024
+    storage.put_bytes("obj", data)
+
+    reader = RangeReader(storage, "obj", readahead_bytes=4096)
+    chunks = [reader.read(100) for _ in range(40)]
+    assert b"".join(chunks) == data[:4000]
+    assert storage.ranges == [(0, 4096)]
+
+    reader.seek(-10, 2)
+    assert reader.read(100) == data[-10:]
+    assert reader.read(1) == b""
+
+    storage.ranges.clear()
+    reader.seek(10_000)
+    assert reader.read(50_000) == data[10_000:60_000]
+    assert storage.ranges == [(10_000, 60_000)]
+
+
+def test_parquet_file_reads_only_what_it_needs_through_open_input_file() -> None:
+    storage = RangeCountingStorage()
+    n = 20_000
+    wide = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+    table = pa.table({"a": list(range(n)), "b": wide})
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+    data = sink.getvalue().to_pybytes()
+    storage.put_bytes("obj", data)
+
+    with storage.open_input_file("obj") as f:
+        out = pq.ParquetFile(f).read(columns=["a"])
+
+    assert out.equals(table.select(["a"]))
+    fetched = sum(end - start for start, end in storage.ranges)
+    assert fetched < len(data) / 2
+
+
+def test_memory_storage_open_input_file_is_zero_copy() -> None:
+    storage = MemoryStorage()
+    storage.put_bytes("obj", b"0123456789")
+    stored = storage.get_bytes("obj")
+
+    with storage.open_input_file("obj") as f:
+        f.seek(2)
+        buf = f.read_buffer(3)
+
+    assert buf.to_pybytes() == b"234"
+    assert buf.address == pa.py_buffer(stored).address + 2
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from opendata.errors import OpendataError
+from opendata.hashing import HashingWriter, sha256_bytes
+from opendata.ids import metadata_key
+from opendata.profiles import resolve_write_profile
+from opendata.publish import (
+    _row_group_checksums,
+    _write_parquet,
+    publish_batches,
+    publish_table,
+)
+from opendata.storage.memory import MemoryStorage
+
+DATASET_ID = "getopendata/row-group-checksums-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Row group checksums",
+    "description": "Row group checksum test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "daily",
+    "write_profile": {"base": "default", "row_group_size": 100},
+}
+
+
+def _table(n: int) -> pa.Table:
+    return pa.table({"a": list(range(n)), "b": [f"v{i % 7}" for i in range(n)]})
+
+
+def _verify(storage: MemoryStorage, data_key: str, row_count: int) -> list[dict[str, object]]:
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    groups = meta["row_group_checksums"]
+    assert sum(g["row_count"] for g in groups) == row_count
+    for g in groups:
+        start = int(g["offset"])
+        chunk = storage.get_range(data_key, start, start + int(g["size_bytes"]))
+        assert sha256_bytes(chunk) == g["checksum_sha256"]
+    # Spans are contiguous: each runs up to the start of the next row group.
+    for g, nxt in zip(groups, groups[1:]):
+        assert int(g["offset"]) + int(g["size_bytes"]) == int(nxt["offset"])
+    return list(groups)
+
+
+def test_hashing_writer_segments() -> None:
+    sink = HashingWriter(io.BytesIO(), segments=True)
+    sink.write(b"ab")
+    sink.mark()
+    sink.mark()
+    sink.write(b"cde")
+    sink.mark()
+    assert sink.segments == [(0, 2, sha256_bytes(b"ab")), (2, 3, sha256_bytes(b"cde"))]
+    assert sink.hexdigest() == sha256_bytes(b"abcde") and sink.size == 5
+
+    plain = HashingWriter(io.BytesIO())
+    plain.write(b"ab")
+    plain.mark()
+    assert plain.segments == []
+
+
+def test_publish_table_row_group_checksums() -> None:
+    storage = MemoryStorage()
+    table = _table(250)
+    published = publish_table(
+        storage, dataset_id=DATASET_ID, table=table, catalog=CATALOG, row_group_checksums=True
+    )
+
+    groups = _verify(storage, published.data_key, 250)
+    assert [g["row_count"] for g in groups] == [100, 100, 50]
+    data = storage.get_bytes(published.data_key)
+    assert published.checksum_sha256 == sha256_bytes(data)
+    assert pq.read_table(io.BytesIO(data)).equals(table)
+
+
+def test_row_groups_above_the_pyarrow_default_cap() -> None:
+    storage = MemoryStorage()
+    n = 1_200_000
+    table = pa.table({"a": pa.array(range(n), pa.int32())})
+    catalog = {**CATALOG, "write_profile": {"base": "default", "row_group_size": 1_100_000}}
+    published = publish_table(
+        storage,
+        dataset_id=DATASET_ID,
+        table=table,
+        catalog=catalog,
+        row_group_checksums=True,
+        compute_stats=False,
+    )
+
+    groups = _verify(storage, published.data_key, n)
+    assert [g["row_count"] for g in groups] == [1_100_000, 100_000]
+
+
+def test_publish_batches_row_group_checksums() -> None:
+    storage = MemoryStorage()
+    table = _table(330)
+    published = publish_batches(
+        storage,
+        dataset_id=DATASET_ID,
+        batches=table.to_batches(max_chunksize=50),
+        schema=table.schema,
+        catalog=CATALOG,
+        row_group_checksums=True,
+    )
+
+    groups = _verify(storage, published.data_key, 330)
+    assert [g["row_count"] for g in groups] == [100, 100, 100, 30]
+
+
+def test_row_group_checksums_are_opt_in() -> None:
+    storage = MemoryStorage()
+    publish_table(storage, dataset_id=DATASET_ID, table=_table(10), catalog=CATALOG)
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert "row_group_checksums" not in meta
+
+
+def test_row_group_checksums_reject_unmatched_spans() -> None:
+    buf = io.BytesIO()
+    sink = HashingWriter(buf, segments=True)
+    profile = resolve_write_profile(CATALOG["write_profile"])
+    _write_parquet(sink, _table(250), profile, [])
+    md = pq.ParquetFile(io.BytesIO(buf.getvalue())).metadata
+
+    assert len(_row_group_checksums(md, sink.segments)) == 3
+    with pytest.raises(OpendataError, match="cannot match 2"):
+        _row_group_checksums(md, sink.segments[:-1])
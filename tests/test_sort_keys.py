@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from opendata import publish
+from opendata.errors import ValidationError
+from opendata.ids import metadata_key
+from opendata.publish import (
+    SORTING_COLUMNS_SUPPORTED,
+    publish_batches,
+    publish_dataframe,
+    publish_parquet_file,
+)
+from opendata.storage.memory import MemoryStorage
+from opendata.versions import resolve_data_key
+
+DATASET_ID = "getopendata/sort-test"
+
+needs_sorting_columns = pytest.mark.skipif(
+    not SORTING_COLUMNS_SUPPORTED, reason="pyarrow cannot write sorting_columns"
+)
+
+
+def _catalog(**extra: object) -> dict[str, object]:
+    return {
+        "id": DATASET_ID,
+        "title": "Sorted",
+        "description": "Sort key test dataset",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["test"],
+        "owners": ["test"],
+        "frequency": "daily",
+        **extra,
+    }
+
+
+def _shuffled() -> pd.DataFrame:
+    dates = pd.date_range("2024-01-01", periods=6, freq="D")
+    return pd.DataFrame(
+        {
+            "date": [dates[i] for i in (3, 0, 5, 1, 4, 2)] * 2,
+            "symbol": ["B"] * 6 + ["A"] * 6,
+            "value": [float(i) for i in range(12)],
+        }
+    )
+
+
+def _data(storage: MemoryStorage) -> bytes:
+    return storage.get_bytes(resolve_data_key(storage, DATASET_ID)[0])
+
+
+@needs_sorting_columns
+def test_publish_sorts_by_cluster_and_sort_keys() -> None:
+    storage = MemoryStorage()
+    catalog = _catalog(cluster_by="symbol", sort_by=["date"])
+    publish_dataframe(storage, dataset_id=DATASET_ID, df=_shuffled(), catalog=catalog)
+
+    pf = pq.ParquetFile(io.BytesIO(_data(storage)))
+    table = pf.read()
+    assert table.column("symbol").to_pylist() == ["A"] * 6 + ["B"] * 6
+    dates = table.column("date").to_pylist()
+    assert dates[:6] == sorted(dates[:6]) and dates[6:] == sorted(dates[6:])
+
+    sorting = pf.metadata.row_group(0).sorting_columns
+    assert [(c.column_index, c.descending) for c in sorting] == [(1, False), (0, False)]
+
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert meta["cluster_by"] == ["symbol"]
+    assert meta["sort_by"] == ["date"]
+    assert meta["preview"]["rows"][0]["symbol"] == "A"
+
+
+@needs_sorting_columns
+def test_publish_batches_checks_declared_order() -> None:
+    storage = MemoryStorage()
+    table = pa.Table.from_pandas(_shuffled(), preserve_index=False)
+    ordered = table.sort_by([("symbol", "ascending"), ("date", "ascending")])
+
+    publish_batches(
+        storage,
+        dataset_id=DATASET_ID,
+        batches=ordered.to_batches(max_chunksize=2),
+        schema=ordered.schema,
+        row_group_size=4,
+        catalog=_catalog(cluster_by=["symbol"], sort_by="date"),
+    )
+    md = pq.ParquetFile(io.BytesIO(_data(storage))).metadata
+    assert md.num_row_groups == 3
+    assert md.row_group(2).sorting_columns
+
+    # Each row group is sorted but the second starts before the first ends.
+    rows = ordered.take([4, 5, 6, 7, 0, 1, 2, 3, 8, 9, 10, 11])
+    with pytest.raises(ValidationError, match="not sorted"):
+        publish_batches(
+            MemoryStorage(),
+            dataset_id=DATASET_ID,
+            batches=rows.to_batches(max_chunksize=4),
+            schema=rows.schema,
+            row_group_size=4,
+            catalog=_catalog(cluster_by=["symbol"], sort_by="date"),
+        )
+
+
+def test_publish_parquet_file_rejects_unsorted_file(tmp_path: Path) -> None:
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.Table.from_pandas(_shuffled(), preserve_index=False), path)
+
+    with pytest.raises(ValidationError, match="not sorted"):
+        publish_parquet_file(
+            MemoryStorage(),
+            dataset_id=DATASET_ID,
+            parquet_path=path,
+            catalog=_catalog(sort_by="date"),
+        )
+
+
+def test_unknown_sort_column_is_rejected() -> None:
+    with pytest.raises(ValidationError, match="unknown sort column"):
+        publish_dataframe(
+            MemoryStorage(), dataset_id=DATASET_ID, df=_shuffled(), catalog=_catalog(sort_by=["ts"])
+        )
+
+
+def test_sort_keys_rejected_on_old_pyarrow(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(publish, "SORTING_COLUMNS_SUPPORTED", False)
+    with pytest.raises(ValidationError, match="pyarrow >= 15"):
+        publish_dataframe(
+            MemoryStorage(),
+            dataset_id=DATASET_ID,
+            df=_shuffled(),
+            catalog=_catalog(cluster_by="symbol"),
+        )
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from opendata.aio import aload
+from opendata.cli import main
+from opendata.client import iter_batches, load
+from opendata.errors import StorageError, ValidationError
+from opendata.ids import (
+    IMMUTABLE_CACHE_CONTROL,
+    POINTER_CACHE_CONTROL,
+    cache_control,
+    data_key,
+    latest_key,
+    manifest_key,
+    metadata_key,
+    version_data_key,
+    version_metadata_key,
+)
+from opendata.info import info
+from opendata.publish import publish_dataframe, publish_partitioned
+from opendata.registry import Registry
+from opendata.storage.aio import ThreadedAsyncStorage
+from opendata.storage.memory import MemoryStorage, reset_memory_storage
+from opendata.versions import gc_versions, load_latest
+
+DATASET_ID = "getopendata/versions-test"
+CATALOG = {
+    "id": DATASET_ID,
+    "title": "Versions",
+    "description": "Versioned layout test dataset",
+    "license": "MIT",
+    "repo": "https://github.com/example/repo",
+    "topics": ["test"],
+    "owners": ["test"],
+    "frequency": "daily",
+}
+
+
+def _publish(storage: MemoryStorage, value: int):  # type: ignore[no-untyped-def]
+    df = pd.DataFrame({"a": [value, value + 1]})
+    return publish_dataframe(storage, dataset_id=DATASET_ID, df=df, catalog=CATALOG)
+
+
+def test_publish_writes_a_version_and_points_latest_at_it() -> None:
+    storage = MemoryStorage()
+    first = _publish(storage, 1)
+    second = _publish(storage, 10)
+
+    assert not storage.exists(data_key(DATASET_ID))
+    assert storage.exists(first.data_key) and storage.exists(second.data_key)
+    pointer = load_latest(storage, DATASET_ID)
+    assert pointer is not None
+    assert pointer.data_key == version_data_key(DATASET_ID, second.checksum_sha256)
+    assert pointer.row_count == 2 and pointer.updated_at == second.updated_at
+    assert [h["version"] for h in pointer.history] == [first.checksum_sha256]
+    assert pointer.metadata_key == version_metadata_key(DATASET_ID, second.checksum_sha256)
+
+    for key in (pointer.metadata_key, metadata_key(DATASET_ID)):
+        meta = json.loads(storage.get_bytes(key))
+        assert meta["checksum_sha256"] == pointer.version
+    assert load(DATASET_ID, storage=storage)["a"].tolist() == [10, 11]
+    assert sum(b.num_rows for b in iter_batches(DATASET_ID, storage=storage)) == 2
+    df = asyncio.run(aload(DATASET_ID, storage=ThreadedAsyncStorage(storage)))
+    assert df["a"].tolist() == [10, 11]
+
+
+class FailingPointerStorage(MemoryStorage):
+    def put_bytes(self, key: str, data: bytes, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        if key == latest_key(DATASET_ID):
+            raise StorageError("pointer write failed")
+        super().put_bytes(key, data, **kwargs)
+
+
+def test_metadata_follows_the_pointer() -> None:
+    storage = MemoryStorage()
+    first = _publish(storage, 1)
+    reg = Registry(storage)
+    reg.refresh_metadata(DATASET_ID)
+
+    # A publish that stops before switching latest.json leaves readers on the
+    # old version's data *and* metadata.
+    failing = FailingPointerStorage()
+    failing._objects = storage._objects
+    with pytest.raises(StorageError):
+        df = pd.DataFrame({"a": [10, 11, 12]})
+        publish_dataframe(failing, dataset_id=DATASET_ID, df=df, catalog=CATALOG)
+    described = info(DATASET_ID, storage=storage)
+    assert described.checksum_sha256 == first.checksum_sha256 and described.row_count == 2
+    reg.refresh_metadata(DATASET_ID)
+    assert json.loads(storage.get_bytes("index.json"))["datasets"][0]["row_count"] == 2
+    assert load(DATASET_ID, storage=storage)["a"].tolist() == [1, 2]
+
+
+def test_legacy_single_file_is_read_until_first_versioned_publish() -> None:
+    storage = MemoryStorage()
+    legacy = _publish(storage, 1)
+    storage.put_bytes(data_key(DATASET_ID), storage.get_bytes(legacy.data_key))
+    storage.delete(latest_key(DATASET_ID))
+    storage.delete(legacy.data_key)
+    assert load(DATASET_ID, storage=storage)["a"].tolist() == [1, 2]
+
+    # Same data: the checksum matches metadata.json, but there is no pointer yet.
+    republished = _publish(storage, 1)
+    assert not republished.unchanged
+    assert storage.exists(latest_key(DATASET_ID))
+
+    assert gc_versions(storage, DATASET_ID) == [data_key(DATASET_ID)]
+    assert load(DATASET_ID, storage=storage)["a"].tolist() == [1, 2]
+
+
+def test_gc_keeps_current_and_recent_versions() -> None:
+    storage = MemoryStorage()
+    published = [_publish(storage, i) for i in range(4)]
+    keys = [p.data_key for p in published]
+
+    metas = [version_metadata_key(DATASET_ID, p.checksum_sha256) for p in published]
+    stale = sorted(keys[:2] + metas[:2])
+
+    assert gc_versions(storage, DATASET_ID, keep=1, dry_run=True) == stale
+    assert all(storage.exists(k) for k in keys)
+
+    assert gc_versions(storage, DATASET_ID, keep=1) == stale
+    assert [storage.exists(k) for k in keys] == [False, False, True, True]
+    assert [storage.exists(k) for k in metas] == [False, False, True, True]
+    assert gc_versions(storage, DATASET_ID, keep=1) == []
+    assert storage.exists(metadata_key(DATASET_ID))
+
+    with pytest.raises(ValidationError):
+        gc_versions(storage, DATASET_ID, keep=-1)
+
+
+def test_partitioned_publish_drops_pointer_and_gc_removes_versions() -> None:
+    storage = MemoryStorage()
+    single = _publish(storage, 1)
+    ts = pd.date_range("2024-01-01", periods=48, freq="h", tz="UTC")
+    table = pa.table({"t": ts, "a": list(range(48))})
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=table, catalog=CATALOG)
+
+    assert load_latest(storage, DATASET_ID) is None
+    assert len(load(DATASET_ID, storage=storage)) == 48
+    assert gc_versions(storage, DATASET_ID) == sorted(
+        [single.data_key, version_metadata_key(DATASET_ID, single.checksum_sha256)]
+    )
+    assert storage.exists(manifest_key(DATASET_ID))
+    assert len(load(DATASET_ID, storage=storage)) == 48
+
+
+def test_gc_keeps_a_superseded_manifest_for_keep_versions() -> None:
+    storage = MemoryStorage()
+    ts = pd.date_range("2024-01-01", periods=48, freq="h", tz="UTC")
+    table = pa.table({"t": ts, "a": list(range(48))})
+    publish_partitioned(storage, dataset_id=DATASET_ID, table=table, catalog=CATALOG)
+    parts = storage.list_keys(f"datasets/{DATASET_ID}/part/")
+    _publish(storage, 1)
+
+    # A reader that resolved the manifest before the switch can still load it.
+    assert gc_versions(storage, DATASET_ID, keep=1) == []
+    assert storage.exists(manifest_key(DATASET_ID))
+    assert all(storage.exists(k) for k in parts)
+
+    second = _publish(storage, 2)
+    stale = gc_versions(storage, DATASET_ID, keep=1)
+    assert sorted(stale) == sorted([manifest_key(DATASET_ID), *parts])
+    assert load(DATASET_ID, storage=storage)["a"].tolist() == [2, 3]
+    assert load_latest(storage, DATASET_ID).version == second.checksum_sha256  # type: ignore[union-attr]
+
+
+def test_cache_control_by_key() -> None:
+    prefix = "datasets/getopendata/versions-test"
+    assert cache_control(version_data_key(DATASET_ID, "ab" * 32)) == IMMUTABLE_CACHE_CONTROL
+    assert cache_control(f"{prefix}/part/date=2024-01-01/part-0123abcd.parquet") == (
+        IMMUTABLE_CACHE_CONTROL
+    )
+    assert cache_control(latest_key(DATASET_ID)) == POINTER_CACHE_CONTROL
+    assert cache_control(metadata_key(DATASET_ID)) is None
+    assert cache_control(version_metadata_key(DATASET_ID, "ab" * 32)) is None
+    assert cache_control(data_key(DATASET_ID)) is None
+
+
+def test_cli_gc(monkeypatch, capsys) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("OPENDATA_STORAGE", "memory")
+    storage = reset_memory_storage()
+    old = _publish(storage, 1)
+    _publish(storage, 2)
+
+    assert main(["gc", DATASET_ID, "--keep", "0", "--dry-run"]) == 0
+    assert storage.exists(old.data_key)
+    assert main(["gc", DATASET_ID, "--keep", "0"]) == 0
+    assert not storage.exists(old.data_key)
+    out = capsys.readouterr().out
+    assert "would delete 2 object(s)" in out and "deleted 2 object(s)" in out
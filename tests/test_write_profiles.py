@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from opendata import profiles
+from opendata.errors import ValidationError
+from opendata.ids import metadata_key
+from opendata.metadata import DatasetCatalog
+from opendata.profiles import BLOOM_FILTERS_SUPPORTED, WRITE_PROFILES, resolve_write_profile
+from opendata.publish import publish_batches, publish_dataframe
+from opendata.storage.memory import MemoryStorage
+from opendata.versions import resolve_data_key
+
+DATASET_ID = "getopendata/profile-test"
+
+
+def _catalog(**extra: object) -> dict[str, object]:
+    return {
+        "id": DATASET_ID,
+        "title": "Profiles",
+        "description": "Write profile test dataset",
+        "license": "MIT",
+        "repo": "https://github.com/example/repo",
+        "topics": ["test"],
+        "owners": ["test"],
+        "frequency": "daily",
+        **extra,
+    }
+
+
+def _df(n: int = 300_000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": range(n),
+            "price": [i * 0.5 for i in range(n)],
+            "symbol": [("AAA", "BBB", "CCC")[i % 3] for i in range(n)],
+        }
+    )
+
+
+def _data(storage: MemoryStorage) -> bytes:
+    return storage.get_bytes(resolve_data_key(storage, DATASET_ID)[0])
+
+
+def _parquet(storage: MemoryStorage) -> pq.ParquetFile:
+    return pq.ParquetFile(io.BytesIO(_data(storage)))
+
+
+def test_default_profile_matches_pyarrow_defaults() -> None:
+    storage = MemoryStorage()
+    df = _df(1000)
+    publish_dataframe(storage, dataset_id=DATASET_ID, df=df, catalog=_catalog())
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink)
+    assert _data(storage) == sink.getvalue().to_pybytes()
+
+
+def test_catalog_analytics_profile_is_applied() -> None:
+    storage = MemoryStorage()
+    publish_dataframe(
+        storage, dataset_id=DATASET_ID, df=_df(), catalog=_catalog(write_profile="analytics")
+    )
+
+    md = _parquet(storage).metadata
+    assert md.num_row_groups == 3
+    assert md.row_group(0).num_rows == 128 * 1024
+    price = md.row_group(0).column(1)
+    assert price.compression == "ZSTD"
+    assert "BYTE_STREAM_SPLIT" in price.encodings
+    assert price.has_offset_index and price.has_column_index
+    assert "RLE_DICTIONARY" in md.row_group(0).column(2).encodings
+
+    meta = json.loads(storage.get_bytes(metadata_key(DATASET_ID)))
+    assert "write_profile" not in meta
+
+
+@pytest.mark.skipif(not BLOOM_FILTERS_SUPPORTED, reason="pyarrow cannot write bloom filters")
+def test_explicit_profile_overrides_catalog() -> None:
+    storage = MemoryStorage()
+    publish_dataframe(
+        storage,
+        dataset_id=DATASET_ID,
+        df=_df(1000),
+        catalog=_catalog(write_profile="analytics"),
+        write_profile={"compression": "gzip", "bloom_filter_columns": ["symbol"]},
+    )
+
+    col = _parquet(storage).metadata.row_group(0).column(2)
+    assert col.compression == "GZIP"
+    assert col.bloom_filter_offset is not None
+
+
+def test_publish_batches_uses_profile_row_group_size() -> None:
+    storage = MemoryStorage()
+    table = pa.Table.from_pandas(_df(1000), preserve_index=False)
+    publish_batches(
+        storage,
+        dataset_id=DATASET_ID,
+        batches=table.to_batches(max_chunksize=100),
+        schema=table.schema,
+        catalog=_catalog(),
+        write_profile={"base": "analytics", "row_group_size": 400},
+    )
+
+    md = _parquet(storage).metadata
+    assert [md.row_group(i).num_rows for i in range(md.num_row_groups)] == [400, 400, 200]
+    assert md.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_profile_dict_extends_base() -> None:
+    profile = resolve_write_profile({"base": "analytics", "compression_level": 9})
+    assert profile.compression == "zstd"
+    assert profile.compression_level == 9
+    assert profile.row_group_size == WRITE_PROFILES["analytics"].row_group_size
+
+
+def test_invalid_profiles_are_rejected() -> None:
+    with pytest.raises(ValidationError, match="unknown write profile"):
+        resolve_write_profile("fastest")
+    with pytest.raises(ValidationError, match="unknown write profile field"):
+        resolve_write_profile({"compresion": "zstd"})
+    with pytest.raises(ValidationError, match="compression"):
+        resolve_write_profile({"compression": "lzma"})
+    with pytest.raises(ValidationError, match="write profile"):
+        DatasetCatalog.from_dict(_catalog(write_profile={"row_group_size": 0}))
+
+    schema = pa.schema([("a", pa.int64())])
+    with pytest.raises(ValidationError, match="unknown bloom filter column"):
+        resolve_write_profile({"bloom_filter_columns": ["b"]}).writer_kwargs(schema)
+
+
+def test_bloom_filters_rejected_on_old_pyarrow(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(profiles, "BLOOM_FILTERS_SUPPORTED", False)
+    with pytest.raises(ValidationError, match="bloom_filter_columns is not supported"):
+        publish_dataframe(
+            MemoryStorage(),
+            dataset_id=DATASET_ID,
+            df=_df(10),
+            catalog=_catalog(write_profile={"bloom_filter_columns": ["symbol"]}),
+        )